@@ -0,0 +1,366 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmark every tool against an in-process simulated SeaTunnel REST API.
+
+Each tool is called ``--calls`` times at each ``--concurrency`` level, and
+throughput, p50/p95/p99 latency and memory are reported. Results are saved
+as JSON; pass an earlier result file as ``--baseline`` to compare runs::
+
+    python -m benchmarks.run_benchmarks --concurrency 1 16 --output after.json --baseline before.json
+
+By default the simulator answers instantly and never fails, so that runs are
+comparable; ``--latency-ms``, ``--error-rate`` and ``--history`` make it
+behave like a loaded production cluster instead. Memory is measured for the
+whole process, which also runs the simulator.
+
+``--record`` saves the REST API traffic of a run to a cassette, and
+``--replay`` answers the requests from a cassette instead of the simulator,
+e.g. one recorded from a production cluster with ``seatunnel-mcp run
+--record``, at its recorded latency divided by ``--replay-speed``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import httpx
+
+from src.seatunnel_mcp.bench import percentile
+from src.seatunnel_mcp.cassette import Cassette, CassetteWriter, RecordingTransport, ReplayTransport
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.tools import get_all_tools
+
+from .simulator import SimulatorConfig, SimulatorServer
+
+DEFAULT_CALLS = 200
+DEFAULT_WARMUP = 10
+DEFAULT_CONCURRENCY = (1, 8, 32)
+DEFAULT_THRESHOLD = 0.10
+SEED_JOBS = 64
+
+JOB_CONFIG = json.dumps({
+    "env": {"job.mode": "STREAMING"},
+    "source": [{"plugin_name": "FakeSource", "plugin_output": "fake", "row.num": 1000,
+                "schema": {"fields": {"name": "string", "age": "int"}}}],
+    "transform": [],
+    "sink": [{"plugin_name": "Console", "plugin_input": ["fake"]}],
+})
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Workload:
+    """Arguments for each tool, against jobs submitted to the simulator."""
+
+    def __init__(self, server: SimulatorServer, config_path: str):
+        self.server = server
+        self.config_path = config_path
+        simulator = server.simulator
+        self.running = [simulator.submit(JOB_CONFIG, "json")["jobId"] for _ in range(SEED_JOBS)]
+        self.stopped = [simulator.submit(JOB_CONFIG, "json")["jobId"] for _ in range(SEED_JOBS)]
+        for job_id in self.stopped:
+            simulator.stop(job_id)
+
+    def fresh_jobs(self, count: int) -> List[str]:
+        """Submit jobs for a tool call to stop."""
+        return [self.server.simulator.submit(JOB_CONFIG, "json")["jobId"] for _ in range(count)]
+
+    def arguments(self, tool: str, i: int) -> Dict[str, Any]:
+        running = self.running[i % SEED_JOBS]
+        stopped = self.stopped[i % SEED_JOBS]
+        if tool == "update-connection-settings":
+            return {"url": self.server.url}
+        if tool == "submit-job":
+            return {"job_content": JOB_CONFIG, "jobName": f"bench-{i}", "format": "json"}
+        if tool == "submit-job-upload":
+            return {"config_file": self.config_path, "jobName": f"bench-upload-{i}", "format": "json"}
+        if tool == "submit-jobs":
+            return {"request_body": [
+                dict(json.loads(JOB_CONFIG), params={"jobName": f"bench-batch-{i}-{n}"}) for n in range(5)
+            ]}
+        if tool == "stop-job":
+            return {"jobId": self.fresh_jobs(1)[0]}
+        if tool == "stop-jobs":
+            return {"jobIds": self.fresh_jobs(5)}
+        if tool == "rolling-restart":
+            return {"jobs": [{"jobId": job_id, "job_content": JOB_CONFIG, "format": "json"}
+                             for job_id in self.fresh_jobs(1)],
+                    "pollInterval": 0.01}
+        if tool == "wait-for-job":
+            return {"jobId": stopped, "pollInterval": 0.01}
+        if tool in ("get-job-info", "get-running-job", "analyze-job-dag"):
+            return {"jobId": running}
+        if tool == "get-finished-jobs":
+            return {"state": "CANCELED"}
+        if tool == "export-snapshot":
+            return {"fileName": f"bench-{i}.jsonl.gz", "includeJobInfo": False}
+        if tool == "find-jobs":
+            return {"query": 'state in (RUNNING, CANCELED) and name ~ "*" and SourceReceivedCount >= 0'}
+        return {}
+
+
+def benchmark_simulator_config(**overrides: Any) -> SimulatorConfig:
+    """Simulated cluster that answers instantly, never fails and has slots to spare."""
+    config = {
+        "slots_per_worker": 1_000_000,
+        "scheduling_delay": 0.0,
+        "stop_delay": 0.0,
+    }
+    config.update(overrides)
+    return SimulatorConfig(**config)
+
+
+async def run_tool(
+    tool: Callable,
+    arguments: Callable[[int], Dict[str, Any]],
+    calls: int,
+    concurrency: int,
+    warmup: int,
+    trace_memory: bool,
+) -> Dict[str, Any]:
+    """Call a tool ``calls`` times with at most ``concurrency`` calls in flight."""
+    for i in range(warmup):
+        await tool(**arguments(i))
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def call(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await tool(**arguments(i))
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(calls)))
+    duration = time.perf_counter() - start
+    traced_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    if trace_memory:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "calls": calls,
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "throughput_per_s": round(calls / duration, 2) if duration else 0.0,
+        "latency_ms": {
+            "mean": round(1000 * sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50": round(1000 * percentile(latencies, 50), 3),
+            "p95": round(1000 * percentile(latencies, 95), 3),
+            "p99": round(1000 * percentile(latencies, 99), 3),
+            "max": round(1000 * latencies[-1], 3) if latencies else 0.0,
+        },
+        "memory_mb": {
+            "peak_rss": round(peak_rss_mb(), 2),
+            "traced_peak": round(traced_peak / (1024 * 1024), 3) if traced_peak is not None else None,
+        },
+    }
+
+
+async def run_benchmarks(
+    concurrency_levels: Sequence[int] = DEFAULT_CONCURRENCY,
+    calls: int = DEFAULT_CALLS,
+    warmup: int = DEFAULT_WARMUP,
+    tools: Optional[Sequence[str]] = None,
+    trace_memory: bool = False,
+    simulator_config: Optional[SimulatorConfig] = None,
+    transport: Optional[httpx.BaseTransport] = None,
+) -> Dict[str, Any]:
+    """Benchmark the tools against a fresh simulated SeaTunnel cluster.
+
+    Args:
+        concurrency_levels: Numbers of concurrent calls to benchmark each tool at.
+        calls: Number of measured calls per tool and concurrency level.
+        warmup: Number of unmeasured calls per tool and concurrency level.
+        tools: Names of the tools to benchmark; all tools by default.
+        trace_memory: Also report the Python heap peak, measured with
+            tracemalloc, which slows calls down considerably.
+        simulator_config: Simulated cluster; by default one without delays,
+            faults or slot shortage.
+        transport: HTTP transport of the client, e.g. to record or replay
+            the requests; the simulator still provides the job IDs.
+
+    Returns:
+        Run metadata and one result per tool and concurrency level.
+    """
+    if simulator_config is None:
+        simulator_config = benchmark_simulator_config()
+    results = []
+    with SimulatorServer(simulator_config) as server, tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "job.json")
+        with open(config_path, "w") as f:
+            f.write(JOB_CONFIG)
+        workload = Workload(server, config_path)
+        client = SeaTunnelClient(base_url=server.url, transport=transport)
+        try:
+            for tool in get_all_tools(client, export_dir=tmp_dir):
+                name = tool.__name__
+                if tools and name not in tools:
+                    continue
+                for concurrency in concurrency_levels:
+                    result = await run_tool(
+                        tool,
+                        lambda i: workload.arguments(name, i),
+                        calls,
+                        concurrency,
+                        warmup,
+                        trace_memory,
+                    )
+                    results.append({"tool": name, "concurrency": concurrency, **result})
+        finally:
+            client.close()
+
+    return {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "calls": calls,
+            "warmup": warmup,
+            "simulator": asdict(simulator_config),
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Compare two runs.
+
+    Args:
+        results: Current run.
+        baseline: Earlier run.
+        threshold: Relative change counted as a regression, e.g. 0.1 for 10%.
+
+    Returns:
+        Descriptions of the regressions: throughput down or p95 latency up by
+        more than ``threshold``.
+    """
+    previous = {(r["tool"], r["concurrency"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results["results"]:
+        before = previous.get((result["tool"], result["concurrency"]))
+        if before is None:
+            continue
+        label = f"{result['tool']} @ {result['concurrency']}"
+        if result["throughput_per_s"] < before["throughput_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{label}: throughput {before['throughput_per_s']} -> {result['throughput_per_s']} calls/s"
+            )
+        if result["latency_ms"]["p95"] > before["latency_ms"]["p95"] * (1 + threshold):
+            regressions.append(
+                f"{label}: p95 {before['latency_ms']['p95']} -> {result['latency_ms']['p95']} ms"
+            )
+    return regressions
+
+
+def format_table(results: Dict[str, Any]) -> str:
+    """Format results as a text table."""
+    lines = [
+        f"{'tool':<36} {'conc':>5} {'calls/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'errors':>7} {'rss MiB':>9}"
+    ]
+    for r in results["results"]:
+        latency = r["latency_ms"]
+        lines.append(
+            f"{r['tool']:<36} {r['concurrency']:>5} {r['throughput_per_s']:>10} {latency['p50']:>9} "
+            f"{latency['p95']:>9} {latency['p99']:>9} {r['errors']:>7} {r['memory_mb']['peak_rss']:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SeaTunnel MCP tools against a simulated SeaTunnel")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY),
+                        help="Concurrency levels (default: 1 8 32)")
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS, help="Measured calls per tool and level")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Warm-up calls per tool and level")
+    parser.add_argument("--tools", nargs="+", help="Tools to benchmark (default: all)")
+    parser.add_argument("--trace-memory", action="store_true", help="Report the Python heap peak (slow)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median simulated REST API latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a simulated HTTP 500")
+    parser.add_argument("--history", type=int, default=0, help="Number of finished jobs in the simulator")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", help="Cassette to record the REST API traffic to")
+    cassette.add_argument("--replay", help="Cassette to answer the REST API requests from")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="Divide the replayed latencies by this factor; 0 answers at once (default: 1)")
+    parser.add_argument("--output", help="File to save the results to as JSON")
+    parser.add_argument("--baseline", help="Earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative change counted as a regression (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    simulator_config = benchmark_simulator_config(
+        latency_ms=args.latency_ms, error_rate=args.error_rate, history=args.history
+    )
+    writer = CassetteWriter(args.record) if args.record else None
+    transport: Optional[httpx.BaseTransport] = None
+    if writer is not None:
+        transport = RecordingTransport(writer)
+    elif args.replay:
+        transport = ReplayTransport(Cassette.load(args.replay), args.replay_speed)
+    try:
+        results = asyncio.run(run_benchmarks(
+            args.concurrency, args.calls, args.warmup, args.tools, args.trace_memory, simulator_config, transport
+        ))
+    finally:
+        if writer is not None:
+            writer.close()
+    print(format_table(results))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
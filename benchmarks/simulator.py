@@ -0,0 +1,713 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Simulated SeaTunnel cluster behind the REST API V2.
+
+Implements the endpoints of ``RESTful API V2.openapi.json`` on top of a
+model of a cluster, so that ``SeaTunnelClient`` and the tools can be run at
+production scale without one:
+
+* Jobs go through the engine's states: CREATED, then PENDING while there are
+  not enough free slots, SCHEDULED, RUNNING, and FINISHED (batch jobs) or
+  FAILED; stops go through CANCELING or DOING_SAVEPOINT to CANCELED or
+  SAVEPOINT_DONE.
+* Each worker offers a fixed number of slots, and a job holds as many as its
+  parallelism from scheduling until it ends.
+* Row and byte counters grow while a job runs.
+* Responses are delayed following a log-normal latency distribution, and can
+  fail with HTTP errors or dropped connections at configurable rates.
+* Finished job histories of millions of jobs are kept in compact arrays.
+
+The cluster advances lazily on every request, from a clock that can run
+faster than real time. All randomness comes from one seeded generator.
+
+Run it standalone to point an MCP server at it::
+
+    python -m benchmarks.simulator --port 8090 --history 100000 --latency-ms 20 --error-rate 0.01
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+TERMINAL_STATES = ("FINISHED", "CANCELED", "FAILED", "SAVEPOINT_DONE", "UNKNOWABLE")
+
+# History statuses are stored as indexes into this tuple.
+HISTORY_STATES = ("FINISHED", "FAILED", "CANCELED")
+HISTORY_WEIGHTS = (0.8, 0.1, 0.1)
+
+FIRST_JOB_ID = 900000000000000000
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour of the simulated cluster. Durations are in simulated seconds."""
+
+    seed: int = 0
+    workers: int = 3
+    slots_per_worker: int = 8
+    # Simulated seconds per real second
+    time_scale: float = 1.0
+    scheduling_delay: float = 0.5
+    stop_delay: float = 0.2
+    batch_duration: float = 30.0
+    # Probability that a job fails at a random point while running
+    failure_probability: float = 0.0
+    rows_per_second: float = 1000.0
+    bytes_per_row: int = 100
+    # Number of finished jobs the cluster starts with
+    history: int = 0
+    # Median and log-normal sigma of response latencies, in milliseconds
+    latency_ms: float = 0.0
+    latency_sigma: float = 0.5
+    # Median latency by endpoint template, e.g. {"/finished-jobs/{state}": 200}
+    endpoint_latency_ms: Dict[str, float] = field(default_factory=dict)
+    # Probability of an HTTP 500 response, overall and by endpoint template
+    error_rate: float = 0.0
+    endpoint_error_rates: Dict[str, float] = field(default_factory=dict)
+    # Probability of closing the connection without a response
+    disconnect_rate: float = 0.0
+
+    @property
+    def total_slots(self) -> int:
+        return self.workers * self.slots_per_worker
+
+
+class SimulatorError(Exception):
+    """Request rejected by the simulated cluster."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class SimJob:
+    """A submitted job and the simulated times of its state changes."""
+
+    __slots__ = (
+        "job_id", "name", "mode", "parallelism", "plugins", "env", "start_with_savepoint",
+        "status", "created_at", "running_at", "end_at", "fail_at", "finished_at",
+        "rows_per_second", "slots",
+    )
+
+    def __init__(self, job_id: str, name: str, mode: str, parallelism: int,
+                 plugins: Dict[str, List[str]], env: Dict[str, Any], start_with_savepoint: bool,
+                 created_at: float, rows_per_second: float):
+        self.job_id = job_id
+        self.name = name
+        self.mode = mode
+        self.parallelism = parallelism
+        self.plugins = plugins
+        self.env = env
+        self.start_with_savepoint = start_with_savepoint
+        self.status = "CREATED"
+        self.created_at = created_at
+        self.running_at: Optional[float] = None
+        self.end_at: Optional[float] = None
+        self.fail_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.rows_per_second = rows_per_second
+        self.slots = 0
+
+    def running_seconds(self, now: float) -> float:
+        if self.running_at is None or now < self.running_at:
+            return 0.0
+        return min(now, self.finished_at if self.finished_at is not None else now) - self.running_at
+
+
+def _format_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def parse_job_config(content: str, format: Optional[str]) -> Tuple[str, int, Dict[str, List[str]], Dict[str, Any]]:
+    """Extract the job mode, parallelism, plugins and env of a job config.
+
+    JSON configs are parsed; for HOCON and YAML the values are picked out with
+    regular expressions, which is enough for the simulation.
+
+    Returns:
+        Mode (BATCH or STREAMING), parallelism, plugin names by section, env.
+    """
+    plugins: Dict[str, List[str]] = {"source": [], "transform": [], "sink": []}
+    env: Dict[str, Any] = {}
+    config: Any = None
+    if format == "json" or content.lstrip().startswith("{"):
+        try:
+            config = json.loads(content)
+        except ValueError:
+            config = None
+    if isinstance(config, dict):
+        env = dict(config.get("env") or {})
+        for section in plugins:
+            for plugin in config.get(section) or []:
+                if isinstance(plugin, dict) and plugin.get("plugin_name"):
+                    plugins[section].append(str(plugin["plugin_name"]))
+    else:
+        mode_match = re.search(r"job\.mode\s*[=:]\s*\"?(\w+)", content)
+        parallelism_match = re.search(r"parallelism\s*[=:]\s*(\d+)", content)
+        if mode_match:
+            env["job.mode"] = mode_match.group(1)
+        if parallelism_match:
+            env["parallelism"] = int(parallelism_match.group(1))
+        for section in plugins:
+            block = re.search(section + r"\s*[:{]\s*\n?\s*(\w+)\s*[{:]", content)
+            if block:
+                plugins[section].append(block.group(1))
+
+    plugins["source"] = plugins["source"] or ["FakeSource"]
+    plugins["sink"] = plugins["sink"] or ["Console"]
+    mode = str(env.get("job.mode", "BATCH")).upper()
+    try:
+        parallelism = max(1, int(env.get("parallelism", 1)))
+    except (TypeError, ValueError):
+        parallelism = 1
+    return mode, parallelism, plugins, env
+
+
+class SeaTunnelSimulator:
+    """Model of a SeaTunnel cluster, advanced lazily on every call."""
+
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self.rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._epoch = time.time()
+        self._started = time.monotonic()
+        self._ids = itertools.count(FIRST_JOB_ID + self.config.history)
+        self.jobs: Dict[str, SimJob] = {}
+        self._active: Dict[str, SimJob] = {}
+        self._pending: Deque[SimJob] = deque()
+        self._events: List[Tuple[float, int, SimJob]] = []
+        self._event_ids = itertools.count()
+        self.free_slots = self.config.total_slots
+        self.requests = 0
+        self._build_history()
+
+    # -- clock and state -------------------------------------------------
+
+    def now(self) -> float:
+        """Simulated time, in seconds since the epoch."""
+        return self._epoch + (time.monotonic() - self._started) * self.config.time_scale
+
+    def _build_history(self) -> None:
+        count = self.config.history
+        self._history_status = bytearray(
+            self.rng.choices(range(len(HISTORY_STATES)), HISTORY_WEIGHTS, k=count)
+        )
+        self._history_finished = array("d")
+        self._history_rows = array("q")
+        finished = self._epoch - count * 10.0
+        for _ in range(count):
+            finished += self.rng.expovariate(0.1)
+            self._history_finished.append(finished)
+            self._history_rows.append(int(self.rng.expovariate(1.0 / 1_000_000)))
+
+    def _history_job(self, index: int) -> Dict[str, Any]:
+        job_id = str(FIRST_JOB_ID + index)
+        finished = self._history_finished[index]
+        rows = self._history_rows[index]
+        return {
+            "jobId": job_id,
+            "jobName": f"history-{index}",
+            "jobStatus": HISTORY_STATES[self._history_status[index]],
+            "errorMsg": "java.lang.RuntimeException: simulated failure"
+            if self._history_status[index] == 1 else None,
+            "createTime": _format_time(finished - 60.0),
+            "finishTime": _format_time(finished),
+            "jobDag": self._job_dag(job_id, {"source": ["FakeSource"], "transform": [], "sink": ["Console"]}, 1),
+            "metrics": self._metrics(rows, rows, 60.0),
+        }
+
+    def _finish(self, job: SimJob, status: str, at: float) -> None:
+        job.status = status
+        job.finished_at = at
+        self.free_slots += job.slots
+        job.slots = 0
+        self._active.pop(job.job_id, None)
+
+    def _at(self, when: Optional[float], job: SimJob) -> None:
+        """Have ``advance`` look at a job again at a simulated time."""
+        if when is not None:
+            heapq.heappush(self._events, (when, next(self._event_ids), job))
+
+    def _update(self, job: SimJob, now: float) -> None:
+        """Apply the state changes of a job due by now."""
+        if job.status == "SCHEDULED" and job.running_at is not None and now >= job.running_at:
+            job.status = "RUNNING"
+        if job.status == "RUNNING":
+            if job.fail_at is not None and now >= job.fail_at:
+                self._finish(job, "FAILED", job.fail_at)
+            elif job.end_at is not None and now >= job.end_at:
+                self._finish(job, "FINISHED", job.end_at)
+        elif job.status in ("CANCELING", "DOING_SAVEPOINT") and job.end_at is not None and now >= job.end_at:
+            self._finish(job, "CANCELED" if job.status == "CANCELING" else "SAVEPOINT_DONE", job.end_at)
+
+    def advance(self) -> float:
+        """Apply the state changes due by now. Called with the lock held."""
+        now = self.now()
+        # Events can be stale after a stop; _update only acts on what is due.
+        while self._events and self._events[0][0] <= now:
+            self._update(heapq.heappop(self._events)[2], now)
+
+        # Schedule waiting jobs in submission order as slots free up
+        while self._pending and self._pending[0].parallelism <= self.free_slots:
+            self._schedule(self._pending.popleft(), now)
+        return now
+
+    def _schedule(self, job: SimJob, now: float) -> None:
+        config = self.config
+        job.slots = job.parallelism
+        self.free_slots -= job.slots
+        job.status = "SCHEDULED"
+        job.running_at = now + config.scheduling_delay
+        if now >= job.running_at:
+            job.status = "RUNNING"
+        if job.mode == "BATCH":
+            job.end_at = job.running_at + config.batch_duration * self.rng.uniform(0.5, 1.5)
+        if self.rng.random() < config.failure_probability:
+            span = (job.end_at - job.running_at) if job.end_at else config.batch_duration
+            job.fail_at = job.running_at + self.rng.uniform(0.0, span)
+        self._at(job.running_at, job)
+        self._at(job.end_at, job)
+        self._at(job.fail_at, job)
+
+    # -- responses -------------------------------------------------------
+
+    def _metrics(self, source_rows: int, sink_rows: int, seconds: float) -> Dict[str, str]:
+        bytes_per_row = self.config.bytes_per_row
+        qps = source_rows / seconds if seconds > 0 else 0.0
+        return {
+            "SourceReceivedCount": str(source_rows),
+            "SinkWriteCount": str(sink_rows),
+            "SourceReceivedQPS": f"{qps:.2f}",
+            "SinkWriteQPS": f"{sink_rows / seconds if seconds > 0 else 0.0:.2f}",
+            "SourceReceivedBytes": str(source_rows * bytes_per_row),
+            "SinkWriteBytes": str(sink_rows * bytes_per_row),
+            "SourceReceivedBytesPerSeconds": f"{qps * bytes_per_row:.2f}",
+            "SinkWriteBytesPerSeconds": f"{(sink_rows / seconds if seconds > 0 else 0.0) * bytes_per_row:.2f}",
+        }
+
+    @staticmethod
+    def _job_dag(job_id: str, plugins: Dict[str, List[str]], parallelism: int) -> Dict[str, Any]:
+        vertices = []
+        for section, kind in (("source", "source"), ("transform", "transform"), ("sink", "sink")):
+            for index, plugin in enumerate(plugins[section]):
+                vertex_id = len(vertices) + 1
+                vertices.append({
+                    "vertexId": vertex_id,
+                    "type": kind,
+                    "vertexName": f"{kind.capitalize()}[{index}]-{plugin}",
+                    "parallelism": parallelism,
+                    "tablePaths": ["fake"],
+                })
+        edges = [
+            {"inputVertexId": str(vertex["vertexId"]), "targetVertexId": str(vertex["vertexId"] + 1)}
+            for vertex in vertices[:-1]
+        ]
+        return {"jobId": job_id, "pipelineEdges": {"1": edges}, "vertexInfoMap": vertices}
+
+    def _job_info(self, job: SimJob, now: float) -> Dict[str, Any]:
+        seconds = job.running_seconds(now)
+        source_rows = int(seconds * job.rows_per_second * job.parallelism)
+        # The sink trails the source by about a second while the job runs
+        sink_rows = source_rows if job.finished_at is not None else max(
+            0, source_rows - int(job.rows_per_second * job.parallelism))
+        info = {
+            "jobId": job.job_id,
+            "jobName": job.name,
+            "jobStatus": job.status,
+            "envOptions": job.env,
+            "createTime": _format_time(job.created_at),
+            "jobDag": self._job_dag(job.job_id, job.plugins, job.parallelism),
+            "pluginJarsUrls": [],
+            "isStartWithSavePoint": job.start_with_savepoint,
+            "metrics": self._metrics(source_rows, sink_rows, seconds),
+        }
+        if job.finished_at is not None:
+            info["finishTime"] = _format_time(job.finished_at)
+            info["errorMsg"] = "java.lang.RuntimeException: simulated failure" if job.status == "FAILED" else None
+        return info
+
+    # -- API operations --------------------------------------------------
+
+    def submit(
+        self,
+        content: str = "",
+        format: Optional[str] = None,
+        job_id: Optional[str] = None,
+        job_name: Optional[str] = None,
+        start_with_savepoint: bool = False,
+    ) -> Dict[str, Any]:
+        """Submit a job; ``job_id`` can resubmit a stopped job under its ID."""
+        mode, parallelism, plugins, env = parse_job_config(content, format)
+        with self._lock:
+            now = self.advance()
+            if parallelism > self.config.total_slots:
+                raise SimulatorError(
+                    500, f"Job parallelism {parallelism} exceeds the {self.config.total_slots} slots of the cluster")
+            job_id = str(job_id) if job_id is not None else str(next(self._ids))
+            existing = self.jobs.get(job_id)
+            if existing is not None and existing.status not in TERMINAL_STATES:
+                raise SimulatorError(500, f"Job {job_id} is already running")
+            job = SimJob(
+                job_id, job_name or f"SeaTunnel_Job_{job_id}", mode, parallelism, plugins, env,
+                start_with_savepoint, now,
+                self.config.rows_per_second * self.rng.uniform(0.5, 1.5),
+            )
+            self.jobs[job_id] = job
+            self._active[job_id] = job
+            if not self._pending and parallelism <= self.free_slots:
+                self._schedule(job, now)
+            else:
+                job.status = "PENDING"
+                self._pending.append(job)
+            return {"jobId": job_id, "jobName": job.name}
+
+    def stop(self, job_id: str, with_savepoint: bool = False) -> Dict[str, Any]:
+        """Stop a job, with or without a savepoint."""
+        with self._lock:
+            now = self.advance()
+            job = self.jobs.get(str(job_id))
+            if job is None or job.status in TERMINAL_STATES:
+                raise SimulatorError(500, f"Job {job_id} is not running")
+            if job in self._pending:
+                self._pending.remove(job)
+            if job.status in ("CANCELING", "DOING_SAVEPOINT"):
+                return {"jobId": job.job_id}
+            job.status = "DOING_SAVEPOINT" if with_savepoint else "CANCELING"
+            job.end_at = now + self.config.stop_delay
+            job.fail_at = None
+            self._at(job.end_at, job)
+            self.advance()
+            return {"jobId": job.job_id}
+
+    def job_info(self, job_id: str, running_only: bool = False) -> Dict[str, Any]:
+        """Get a job by ID; unknown jobs, and stopped ones with ``running_only``, give ``{}``."""
+        with self._lock:
+            now = self.advance()
+            job = self.jobs.get(job_id)
+            if job is not None:
+                if running_only and job.status in TERMINAL_STATES:
+                    return {}
+                return self._job_info(job, now)
+        if running_only or not job_id.isdigit():
+            return {}
+        index = int(job_id) - FIRST_JOB_ID
+        if 0 <= index < self.config.history:
+            return self._history_job(index)
+        return {}
+
+    def running_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = self.advance()
+            return [self._job_info(job, now) for job in self._active.values()]
+
+    def finished_jobs(self, state: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = self.advance()
+            jobs = [
+                self._job_info(job, now) for job in self.jobs.values()
+                if job.status == state
+            ]
+        if state in HISTORY_STATES:
+            code = HISTORY_STATES.index(state)
+            jobs += [
+                self._history_job(index) for index, status in enumerate(self._history_status) if status == code
+            ]
+        return jobs
+
+    def overview(self) -> Dict[str, Any]:
+        with self._lock:
+            self.advance()
+            counts: Dict[str, int] = {}
+            for job in self.jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            running = len(self._active)
+            free_slots = self.free_slots
+        for code, state in enumerate(HISTORY_STATES):
+            counts[state] = counts.get(state, 0) + self._history_status.count(code)
+        return {
+            "projectVersion": "2.3.10",
+            "gitCommitAbbrev": "DeadD0d0",
+            "totalSlot": str(self.config.total_slots),
+            "unassignedSlot": str(free_slots),
+            "works": str(self.config.workers),
+            "runningJobs": str(running),
+            "finishedJobs": str(counts.get("FINISHED", 0)),
+            "failedJobs": str(counts.get("FAILED", 0)),
+            "cancelledJobs": str(counts.get("CANCELED", 0)),
+        }
+
+    def system_monitoring_information(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = self.advance()
+            used_slots = self.config.total_slots - self.free_slots
+        uptime = now - self._epoch
+        nodes = []
+        for node in range(self.config.workers + 1):
+            # The master holds no slots; workers share the used slots evenly
+            share = 0.0 if node == 0 else used_slots / max(1, self.config.total_slots)
+            heap_used = 256 + 3072 * share + 64 * math.sin(uptime / 30.0 + node)
+            nodes.append({
+                "isMaster": "true" if node == 0 else "false",
+                "host": f"seatunnel-{node}",
+                "port": "5801",
+                "processors": "8",
+                "physical.memory.total": "16.0G",
+                "physical.memory.free": f"{16.0 - 4.0 * share - 2.0:.1f}G",
+                "heap.memory.used": f"{max(heap_used, 128):.1f}M",
+                "heap.memory.max": "4.0G",
+                "load.process": f"{5.0 + 80.0 * share:.2f}%",
+                "load.system": f"{10.0 + 70.0 * share:.2f}%",
+                "thread.count": str(100 + int(40 * share * self.config.slots_per_worker)),
+                "gc.minor.count": str(int(uptime * (1 + 10 * share))),
+                "gc.major.count": str(int(uptime / 600)),
+            })
+        return nodes
+
+    # -- fault injection -------------------------------------------------
+
+    def fault(self, template: str) -> Tuple[float, Optional[str]]:
+        """Draw the latency and fault of one request.
+
+        Returns:
+            Seconds to delay the response, and ``"error"``, ``"disconnect"`` or None.
+        """
+        config = self.config
+        with self._lock:
+            self.requests += 1
+            median = config.endpoint_latency_ms.get(template, config.latency_ms)
+            delay = self.rng.lognormvariate(math.log(median), config.latency_sigma) / 1000.0 if median > 0 else 0.0
+            roll = self.rng.random()
+        if roll < config.disconnect_rate:
+            return delay, "disconnect"
+        if roll < config.disconnect_rate + config.endpoint_error_rates.get(template, config.error_rate):
+            return delay, "error"
+        return delay, None
+
+
+_TEMPLATES = (
+    (re.compile(r"^/job-info/([^/]+)$"), "/job-info/{jobId}"),
+    (re.compile(r"^/running-job/([^/]+)$"), "/running-job/{jobId}"),
+    (re.compile(r"^/finished-jobs/([^/]+)$"), "/finished-jobs/{state}"),
+)
+
+
+def _route(path: str) -> Tuple[str, Optional[str]]:
+    for pattern, template in _TEMPLATES:
+        match = pattern.match(path)
+        if match:
+            return template, match.group(1)
+    return path, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so that the client's connection pool is exercised as in production
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+    simulator: SeaTunnelSimulator
+
+    def _reply(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0)) if method == "POST" else b""
+        template, path_param = _route(parts.path)
+
+        delay, fault = self.simulator.fault(template)
+        if delay:
+            time.sleep(delay)
+        if fault == "disconnect":
+            self.close_connection = True
+            return
+        if fault == "error":
+            self._reply({"status": "fail", "message": "Simulated server error"}, 500)
+            return
+
+        try:
+            self._reply(self._dispatch(method, template, path_param, params, body))
+        except SimulatorError as e:
+            self._reply({"status": "fail", "message": str(e)}, e.status)
+        except (ValueError, KeyError) as e:
+            self._reply({"status": "fail", "message": f"Bad request: {e}"}, 400)
+
+    def _dispatch(self, method: str, template: str, path_param: Optional[str],
+                  params: Dict[str, str], body: bytes) -> Any:
+        simulator = self.simulator
+        if method == "GET":
+            if template == "/overview":
+                return simulator.overview()
+            if template == "/running-jobs":
+                return simulator.running_jobs()
+            if template == "/system-monitoring-information":
+                return simulator.system_monitoring_information()
+            if template == "/job-info/{jobId}":
+                return simulator.job_info(path_param)
+            if template == "/running-job/{jobId}":
+                return simulator.job_info(path_param, running_only=True)
+            if template == "/finished-jobs/{state}":
+                return simulator.finished_jobs(path_param.upper())
+        elif template == "/submit-job":
+            return simulator.submit(
+                body.decode(), params.get("format"), params.get("jobId"), params.get("jobName"),
+                params.get("isStartWithSavePoint") == "true",
+            )
+        elif template == "/submit-job/upload":
+            return simulator.submit(
+                self._uploaded_file(body), params.get("format"), params.get("jobId"), params.get("jobName"),
+                params.get("isStartWithSavePoint") == "true",
+            )
+        elif template == "/submit-jobs":
+            return [
+                simulator.submit(
+                    json.dumps(job), "json", job.get("params", {}).get("jobId"),
+                    job.get("params", {}).get("jobName"),
+                    str(job.get("params", {}).get("isStartWithSavePoint")).lower() == "true",
+                )
+                for job in json.loads(body or b"[]")
+            ]
+        elif template == "/stop-job":
+            request = json.loads(body or b"{}")
+            return simulator.stop(str(request["jobId"]), bool(request.get("isStopWithSavePoint")))
+        raise SimulatorError(404, f"Unknown endpoint {method} {template}")
+
+    def _uploaded_file(self, body: bytes) -> str:
+        """Get the content of the first file of a multipart/form-data body."""
+        match = re.search(r"boundary=\"?([^\";]+)", self.headers.get("Content-Type", ""))
+        if not match:
+            return body.decode(errors="replace")
+        for part in body.split(b"--" + match.group(1).encode()):
+            headers, _, content = part.partition(b"\r\n\r\n")
+            if b"filename=" in headers:
+                return content.rsplit(b"\r\n", 1)[0].decode(errors="replace")
+        return ""
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class SimulatorServer:
+    """Simulated SeaTunnel REST API served from a background thread.
+
+    Usable as a context manager::
+
+        with SimulatorServer(SimulatorConfig(history=100000)) as server:
+            client = SeaTunnelClient(base_url=server.url)
+    """
+
+    def __init__(self, config: Optional[SimulatorConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.simulator = SeaTunnelSimulator(config)
+        handler = type("Handler", (_Handler,), {"simulator": self.simulator})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SimulatorServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="seatunnel-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "SimulatorServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = SimulatorConfig()
+    parser = argparse.ArgumentParser(description="Simulated SeaTunnel REST API V2")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to listen on")
+    parser.add_argument("--port", type=int, default=8090, help="Port to listen on")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument("--workers", type=int, default=defaults.workers, help="Number of worker nodes")
+    parser.add_argument("--slots-per-worker", type=int, default=defaults.slots_per_worker, help="Slots per worker")
+    parser.add_argument("--time-scale", type=float, default=defaults.time_scale,
+                        help="Simulated seconds per real second")
+    parser.add_argument("--batch-duration", type=float, default=defaults.batch_duration,
+                        help="Median running time of batch jobs in seconds")
+    parser.add_argument("--failure-probability", type=float, default=defaults.failure_probability,
+                        help="Probability that a job fails while running")
+    parser.add_argument("--history", type=int, default=defaults.history, help="Number of finished jobs to start with")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="Median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=defaults.latency_sigma,
+                        help="Log-normal sigma of the response latency")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="Probability of HTTP 500")
+    parser.add_argument("--disconnect-rate", type=float, default=defaults.disconnect_rate,
+                        help="Probability of dropping the connection")
+    args = parser.parse_args(argv)
+
+    config = SimulatorConfig(
+        seed=args.seed,
+        workers=args.workers,
+        slots_per_worker=args.slots_per_worker,
+        time_scale=args.time_scale,
+        batch_duration=args.batch_duration,
+        failure_probability=args.failure_probability,
+        history=args.history,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        disconnect_rate=args.disconnect_rate,
+    )
+    server = SimulatorServer(config, args.host, args.port)
+    print(f"Simulated SeaTunnel REST API at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
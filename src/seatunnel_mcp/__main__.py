@@ -19,40 +19,164 @@
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 
+import httpx
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import Response
 
-from .client import SeaTunnelClient
+from . import logs, metrics, tracing
+from .batching import DEFAULT_MAX_BATCH_SIZE, SubmitJobBatcher
+from .cassette import transport_factory
+from .chunking import DEFAULT_MAX_BUFFER_BYTES, DEFAULT_MAX_RESPONSE_BYTES, DEFAULT_TTL, ContinuationBuffer
+from .profiling import DEFAULT_OUTPUT_DIR, DEFAULT_SAMPLE_EVERY, SamplingProfiler
+from .profiles import DEFAULT_MAX_CLIENTS, DEFAULT_PROFILE, ClientRegistry, SessionClient, load_profiles
+from .federation import DEFAULT_DEADLINE, Federation
+from .limits import DEFAULT_MAX_WAIT, UpstreamLimits, parse_limits
+from .monitoring import DEFAULT_STALL_POLL_INTERVAL, DEFAULT_STALL_POLLS, StallDetector
+from .resources import DEFAULT_POLL_INTERVAL, JobStateWatcher, register_resources
+from .schema import ConnectionProfile
+from .snapshot import DEFAULT_EXPORT_DIR
 from .tools import get_all_tools
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 # Default values
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8080
 DEFAULT_API_URL = "http://localhost:8090"  # Default SeaTunnel API URL
+DEFAULT_TRANSPORT = "stdio"
+DEFAULT_WORKERS = 1
+DEFAULT_TIMEOUT_KEEP_ALIVE = 5  # Seconds, same as uvicorn
 
+TRANSPORTS = ("stdio", "sse", "streamable-http")
 
-def main():
-    """Run the SeaTunnel MCP server."""
-    # Get configuration from environment
+
+def setup() -> None:
+    """Set up logging and load environment variables.
+
+    Done on startup rather than at import time, and a no-op for the logging
+    the CLI has already configured.
+    """
+    load_dotenv()
+    if not logs.is_configured():
+        logs.configure_logging(
+            os.environ.get("SEATUNNEL_MCP_LOG_LEVEL", "info"),
+            os.environ.get("SEATUNNEL_MCP_LOG_FORMAT", "text"),
+            logs.parse_sampling(os.environ.get("SEATUNNEL_MCP_LOG_SAMPLING", "")),
+        )
+
+
+def create_limits() -> Optional[UpstreamLimits]:
+    """Create the rate limits and bulkheads of the upstream requests from the environment, if any."""
+    rate = os.environ.get("SEATUNNEL_RATE_LIMIT")
+    endpoint_rates = parse_limits(os.environ.get("SEATUNNEL_ENDPOINT_RATE_LIMITS", ""))
+    bulkheads = parse_limits(os.environ.get("SEATUNNEL_BULKHEADS", ""), integer=True)
+    if not (rate and float(rate) > 0) and not endpoint_rates and not bulkheads:
+        return None
+    burst = os.environ.get("SEATUNNEL_RATE_BURST")
+    return UpstreamLimits(
+        rate=float(rate) if rate and float(rate) > 0 else None,
+        burst=float(burst) if burst else None,
+        endpoint_rates=endpoint_rates,
+        bulkheads=bulkheads,
+        max_wait=float(os.environ.get("SEATUNNEL_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT)),
+    )
+
+
+def create_transport_factory() -> Optional[Callable[[ConnectionProfile], httpx.BaseTransport]]:
+    """Create the factory of the clients' transports recording or replaying a cassette, if configured."""
+    return transport_factory(
+        record=os.environ.get("SEATUNNEL_MCP_RECORD"),
+        replay=os.environ.get("SEATUNNEL_MCP_REPLAY"),
+        speed=float(os.environ.get("SEATUNNEL_MCP_REPLAY_SPEED", 1.0)),
+    )
+
+
+def create_server() -> FastMCP:
+    """Create the MCP server with all tools registered, configured from the environment."""
     host = os.environ.get("MCP_HOST", DEFAULT_HOST)
     port = int(os.environ.get("MCP_PORT", DEFAULT_PORT))
     api_url = os.environ.get("SEATUNNEL_API_URL", DEFAULT_API_URL)
     api_key = os.environ.get("SEATUNNEL_API_KEY", None)
+    workers = int(os.environ.get("MCP_WORKERS", DEFAULT_WORKERS))
+    # With several workers a follow-up request may land on a different
+    # process than the one that created the session, so streamable HTTP has
+    # to run without server-side sessions: every request gets a new one.
+    stateless = workers > 1
+
+    # Optional OpenTelemetry tracing; must be enabled before the tools are created
+    if os.environ.get("SEATUNNEL_MCP_TRACING", "").lower() in ("1", "true", "yes"):
+        tracing.enable()
+
+    # Optional sampling profiler of the tools and client methods
+    profiler = None
+    if os.environ.get("SEATUNNEL_MCP_PROFILE_TOOLS", "").lower() in ("1", "true", "yes"):
+        profiler = SamplingProfiler(
+            output_dir=os.environ.get("SEATUNNEL_MCP_PROFILE_DIR", DEFAULT_OUTPUT_DIR),
+            sample_every=int(os.environ.get("SEATUNNEL_MCP_PROFILE_SAMPLE_EVERY", DEFAULT_SAMPLE_EVERY)),
+        )
+        profiler.instrument_client()
+        profiler.start()
+        logger.info(f"Profiling 1 in {profiler.sample_every} tool calls into {profiler.output_dir}")
+
+    # Connection profiles: the default one comes from SEATUNNEL_API_URL/KEY,
+    # more can be defined as JSON in SEATUNNEL_PROFILES.
+    profiles = [ConnectionProfile(name=DEFAULT_PROFILE, url=api_url, api_key=api_key)]
+    if os.environ.get("SEATUNNEL_PROFILES"):
+        profiles += load_profiles(os.environ["SEATUNNEL_PROFILES"])
+    registry = ClientRegistry(
+        profiles,
+        default_profile=os.environ.get("SEATUNNEL_DEFAULT_PROFILE", DEFAULT_PROFILE),
+        max_clients=int(os.environ.get("SEATUNNEL_MAX_CLIENTS", DEFAULT_MAX_CLIENTS)),
+        limits=create_limits(),
+        transport_factory=create_transport_factory(),
+    )
+
+    # Opt-in federation of several profiles, queried together by the federated tools
+    federation = None
+    if os.environ.get("SEATUNNEL_FEDERATION"):
+        federation = Federation(
+            registry,
+            [name.strip() for name in os.environ["SEATUNNEL_FEDERATION"].split(",") if name.strip()],
+            deadline=float(os.environ.get("SEATUNNEL_FEDERATION_DEADLINE", DEFAULT_DEADLINE)),
+        )
 
-    # Create SeaTunnel client
-    client = SeaTunnelClient(base_url=api_url, api_key=api_key)
+    # Create SeaTunnel client, routed per session through the registry
+    client = SessionClient(registry)
+
+    # Opt-in micro-batching of concurrent submit-job calls into /submit-jobs
+    submit_batcher = None
+    batch_window_ms = os.environ.get("SEATUNNEL_SUBMIT_BATCH_WINDOW_MS")
+    if batch_window_ms:
+        submit_batcher = SubmitJobBatcher(
+            client,
+            window_ms=float(batch_window_ms),
+            max_batch_size=int(os.environ.get("SEATUNNEL_SUBMIT_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH_SIZE)),
+        )
+
+    # Chunk oversized results of the list tools behind continuation tokens; 0
+    # disables it. Continuations are buffered per session, so a stateless
+    # server could never serve them.
+    continuations = None
+    max_response_bytes = int(os.environ.get("SEATUNNEL_MCP_MAX_RESPONSE_BYTES", DEFAULT_MAX_RESPONSE_BYTES))
+    if max_response_bytes > 0 and not stateless:
+        continuations = ContinuationBuffer(
+            max_response_bytes=max_response_bytes,
+            ttl=float(os.environ.get("SEATUNNEL_MCP_CONTINUATION_TTL", DEFAULT_TTL)),
+            max_buffer_bytes=int(os.environ.get("SEATUNNEL_MCP_CONTINUATION_BUFFER_BYTES", DEFAULT_MAX_BUFFER_BYTES)),
+        )
+
+    # Stalled-job detection polls the running jobs in the background once
+    # asked. Like the resources it is shared by all sessions, so it follows
+    # the default connection profile.
+    stall_detector = StallDetector(
+        registry.get_client(registry.default_profile),
+        poll_interval=float(os.environ.get("SEATUNNEL_STALL_POLL_INTERVAL", DEFAULT_STALL_POLL_INTERVAL)),
+        stall_polls=int(os.environ.get("SEATUNNEL_STALL_POLLS", DEFAULT_STALL_POLLS)),
+    )
 
     # Create MCP server
     server = FastMCP(
@@ -61,18 +185,103 @@ def main():
         log_level="INFO",
         host=host,
         port=port,
+        stateless_http=stateless,
     )
 
-    # Register all tools
-    tools = get_all_tools(client)
+    # Register all tools, except those bound to a session when there are none
+    tools = get_all_tools(
+        client,
+        submit_batcher,
+        registry,
+        profiler,
+        continuations,
+        stall_detector,
+        federation,
+        export_dir=os.environ.get("SEATUNNEL_MCP_EXPORT_DIR", DEFAULT_EXPORT_DIR),
+        stateless=stateless,
+    )
     for tool_fn in tools:
         # 直接添加函数作为工具
         server.add_tool(tool_fn)
 
-    # Run server
-    logger.info(f"Starting SeaTunnel MCP server at http://{host}:{port}")
-    server.run()
+    # Register job state resources. They are shared by all sessions, so they
+    # always reflect the default connection profile.
+    watcher = JobStateWatcher(
+        registry.get_client(registry.default_profile),
+        poll_interval=float(os.environ.get("SEATUNNEL_RESOURCE_POLL_INTERVAL", DEFAULT_POLL_INTERVAL)),
+    )
+    register_resources(server, watcher, subscriptions=not stateless)
+
+    # Expose metrics next to the MCP endpoint of the HTTP transports
+    @server.custom_route("/metrics", methods=["GET"])
+    async def metrics_endpoint(request: Request) -> Response:
+        return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+    return server
+
+
+def create_app() -> Any:
+    """Create the ASGI application for the configured HTTP transport.
+
+    Used as the uvicorn application factory, so every worker process builds
+    its own server, client and caches.
+    """
+    setup()
+    server = create_server()
+    if os.environ.get("MCP_TRANSPORT", DEFAULT_TRANSPORT) == "sse":
+        return server.sse_app()
+    return server.streamable_http_app()
+
+
+def main():
+    """Run the SeaTunnel MCP server."""
+    setup()
+    if os.environ.get("MCP_METRICS_PORT"):
+        metrics_host = os.environ.get("MCP_METRICS_HOST", DEFAULT_HOST)
+        metrics.start_http_server(int(os.environ["MCP_METRICS_PORT"]), metrics_host)
+        logger.info(f"Serving metrics at http://{metrics_host}:{os.environ['MCP_METRICS_PORT']}/metrics")
+
+    transport = os.environ.get("MCP_TRANSPORT", DEFAULT_TRANSPORT)
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Invalid MCP_TRANSPORT: {transport} (expected one of {', '.join(TRANSPORTS)})")
+
+    if transport == "stdio":
+        logger.info("Starting SeaTunnel MCP server on stdio")
+        create_server().run()
+        return
+
+    import uvicorn
+
+    host = os.environ.get("MCP_HOST", DEFAULT_HOST)
+    port = int(os.environ.get("MCP_PORT", DEFAULT_PORT))
+    workers = int(os.environ.get("MCP_WORKERS", DEFAULT_WORKERS))
+    limit_concurrency = os.environ.get("MCP_LIMIT_CONCURRENCY")
+    timeout_keep_alive = int(os.environ.get("MCP_TIMEOUT_KEEP_ALIVE", DEFAULT_TIMEOUT_KEEP_ALIVE))
+
+    if transport == "sse" and workers > 1:
+        # The SSE stream and the POSTed messages of a session must reach the same process.
+        raise ValueError("The sse transport does not support multiple workers; use streamable-http")
+    if workers > 1 and os.environ.get("SEATUNNEL_MCP_RECORD"):
+        # Every worker would overwrite the same cassette
+        raise ValueError("Recording a cassette requires a single worker")
+
+    # Multiple workers need an import string so that each process creates its own app.
+    app: Any = f"{__package__}.__main__:create_app" if workers > 1 else create_app()
+
+    logger.info(f"Starting SeaTunnel MCP server ({transport}, {workers} worker(s)) at http://{host}:{port}")
+    uvicorn.run(
+        app,
+        factory=workers > 1,
+        host=host,
+        port=port,
+        workers=workers,
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
+        timeout_keep_alive=timeout_keep_alive,
+        # Leave the handlers to our logging pipeline; uvicorn's own write synchronously
+        log_config=None,
+        log_level="info",
+    )
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
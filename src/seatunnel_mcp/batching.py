@@ -0,0 +1,204 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Micro-batching of concurrent job submissions into /submit-jobs."""
+
+import asyncio
+import json
+import logging
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import httpx
+
+from .client import SeaTunnelAPI
+from .concurrency import run_sync
+from .jobs import job_list
+from .profiles import SessionClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH_SIZE = 50
+
+
+class SubmitJobBatcher:
+    """Gather ``submit_job`` calls arriving within a short window into one batch.
+
+    Only JSON job configurations can be batched, because ``/submit-jobs`` takes
+    a JSON array of job configs. Other formats are submitted individually.
+    """
+
+    def __init__(
+        self,
+        client: SeaTunnelAPI,
+        window_ms: float = DEFAULT_WINDOW_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            client: SeaTunnel client instance.
+            window_ms: Milliseconds to wait for more submissions after the first one.
+            max_batch_size: Maximum number of jobs sent in one ``/submit-jobs`` request.
+        """
+        self.client = client
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        # Pending submissions and flush timers, keyed by the target client so
+        # that sessions on different profiles never share a batch.
+        self._pending: weakref.WeakKeyDictionary[
+            SeaTunnelAPI, List[Tuple[Dict[str, Any], asyncio.Future]]
+        ] = weakref.WeakKeyDictionary()
+        self._flush_handles: weakref.WeakKeyDictionary[
+            SeaTunnelAPI, asyncio.TimerHandle
+        ] = weakref.WeakKeyDictionary()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit_job(
+        self,
+        job_content: str,
+        jobName: Optional[str] = None,
+        jobId: Optional[Union[str, int]] = None,
+        isStartWithSavePoint: Optional[bool] = None,
+        format: str = "hocon",
+    ) -> Dict[str, Any]:
+        """Submit a job, batching it with concurrent submissions where possible.
+
+        Args:
+            job_content: Job configuration content.
+            jobName: Optional job name.
+            jobId: Optional job ID.
+            isStartWithSavePoint: Whether to start with savepoint.
+            format: Job configuration format (hocon, json, yaml).
+
+        Returns:
+            Response from the API for this job.
+        """
+        target = self.client.resolve() if isinstance(self.client, SessionClient) else self.client
+        job = self._to_batch_entry(job_content, jobName, jobId, isStartWithSavePoint, format)
+        if job is None:
+            return await run_sync(
+                target.submit_job,
+                job_content=job_content,
+                jobName=jobName,
+                jobId=jobId,
+                isStartWithSavePoint=isStartWithSavePoint,
+                format=format,
+            )
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Dict[str, Any]] = loop.create_future()
+        pending = self._pending.setdefault(target, [])
+        pending.append((job, future))
+        if len(pending) >= self.max_batch_size:
+            self._flush(target)
+        elif target not in self._flush_handles:
+            self._flush_handles[target] = loop.call_later(self.window, self._flush, target)
+        return await future
+
+    @staticmethod
+    def _to_batch_entry(
+        job_content: str,
+        jobName: Optional[str],
+        jobId: Optional[Union[str, int]],
+        isStartWithSavePoint: Optional[bool],
+        format: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Build a ``/submit-jobs`` entry, or return None if the job cannot be batched."""
+        if (format or "").lower() != "json":
+            return None
+        try:
+            job = json.loads(job_content)
+        except ValueError:
+            return None
+        if not isinstance(job, dict):
+            return None
+
+        params = dict(job.get("params") or {})
+        if jobName:
+            params["jobName"] = jobName
+        if jobId is not None:
+            params["jobId"] = str(jobId)
+        if isStartWithSavePoint is not None:
+            params["isStartWithSavePoint"] = str(isStartWithSavePoint).lower()
+        if params:
+            job["params"] = params
+        return job
+
+    def _flush(self, target: SeaTunnelAPI) -> None:
+        """Send the pending submissions for one target client as one batch."""
+        handle = self._flush_handles.pop(target, None)
+        if handle is not None:
+            handle.cancel()
+        # Jobs of cancelled calls must not be started
+        batch = [entry for entry in self._pending.pop(target, []) if not entry[1].cancelled()]
+        if batch:
+            task = asyncio.ensure_future(self._send(target, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self, target: SeaTunnelAPI, batch: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        """Submit a batch and resolve each caller's future with its own result."""
+        jobs = [job for job, _ in batch]
+        try:
+            results = job_list(await run_sync(target.submit_jobs, request_body=jobs))
+            if len(results) != len(batch):
+                raise ValueError(f"Expected {len(batch)} results from /submit-jobs, got {len(results)}")
+        except httpx.HTTPStatusError as e:
+            if len(batch) > 1 and self._can_retry(jobs, e):
+                # Retry individually so that one bad job does not fail the others
+                logger.warning(f"Batch submission of {len(batch)} jobs rejected, retrying individually: {e}")
+                await asyncio.gather(*(self._send(target, [entry]) for entry in batch))
+                return
+            for _, future in batch:
+                self._resolve(future, error=e)
+            return
+        except Exception as e:
+            # Some jobs may already have been submitted, so do not retry.
+            for _, future in batch:
+                self._resolve(future, error=e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            self._resolve(future, result=result)
+
+    @staticmethod
+    def _can_retry(jobs: List[Dict[str, Any]], error: httpx.HTTPStatusError) -> bool:
+        """Whether the jobs of a failed batch can be resubmitted one by one.
+
+        ``/submit-jobs`` is not atomic: a server error may come after some jobs
+        of the batch were started. Only a client error rejects the request
+        before anything is applied, and only jobs with an explicit ID cannot be
+        started twice by a retry.
+        """
+        if 400 <= error.response.status_code < 500:
+            return True
+        return all((job.get("params") or {}).get("jobId") is not None for job in jobs)
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None
+    ) -> None:
+        """Complete a caller's future unless the caller has gone away."""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
@@ -0,0 +1,406 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Load generator for a running SeaTunnel MCP server.
+
+Replays a weighted mix of tool calls over stdio, SSE or streamable HTTP,
+either closed-loop at a fixed concurrency or open-loop at a target rate, and
+reports throughput, error rates and latency percentiles over time.
+
+In open-loop mode latencies are measured from the time each call was
+scheduled rather than sent, so that a server falling behind shows up as
+latency instead of silently lowering the offered load.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Set, TextIO, Tuple
+
+from mcp import ClientSession
+
+from .jobs import job_list
+
+DEFAULT_MIX = "get-job-info=70,get-running-jobs=20,submit-job=10"
+DEFAULT_DURATION = 30.0
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REPORT_INTERVAL = 5.0
+DEFAULT_URLS = {
+    "streamable-http": "http://127.0.0.1:8080/mcp",
+    "sse": "http://127.0.0.1:8080/sse",
+}
+
+# Tools that need a job ID are pointed at the jobs running when the run starts.
+JOB_ID_TOOLS = ("get-job-info", "get-running-job")
+
+DEFAULT_JOB_CONFIG = json.dumps({
+    "env": {"job.mode": "batch"},
+    "source": [{"plugin_name": "FakeSource", "plugin_output": "fake", "row.num": 100,
+                "schema": {"fields": {"name": "string", "age": "int"}}}],
+    "transform": [],
+    "sink": [{"plugin_name": "Console", "plugin_input": ["fake"]}],
+})
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse a tool mix such as ``get-job-info=70,get-running-jobs=30``.
+
+    Returns:
+        Weight by tool name.
+
+    Raises:
+        ValueError: If the mix is malformed or has no positive weight.
+    """
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        name, sep, weight = part.strip().partition("=")
+        if not name or not sep:
+            raise ValueError(f"Invalid tool mix entry {part!r}, expected tool=weight")
+        mix[name.strip()] = float(weight)
+    if not mix or any(weight < 0 for weight in mix.values()) or sum(mix.values()) <= 0:
+        raise ValueError(f"Invalid tool mix {spec!r}: weights must be non-negative and not all zero")
+    return mix
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(percent / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: List[float], errors: int, seconds: float) -> Dict[str, Any]:
+    """Summarize the calls of a period.
+
+    Args:
+        latencies: Latencies of all calls, in seconds.
+        errors: Number of calls that failed.
+        seconds: Length of the period.
+    """
+    latencies = sorted(latencies)
+    calls = len(latencies)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "error_rate": round(errors / calls, 4) if calls else 0.0,
+        "throughput_per_s": round(calls / seconds, 2) if seconds > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(1000 * percentile(latencies, 50), 3),
+            "p95": round(1000 * percentile(latencies, 95), 3),
+            "p99": round(1000 * percentile(latencies, 99), 3),
+            "max": round(1000 * latencies[-1], 3) if latencies else 0.0,
+        },
+    }
+
+
+class BenchStats:
+    """Latencies and errors of a run, overall, per tool and per report interval."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.error_messages: Dict[str, int] = {}
+        self._interval_latencies: List[float] = []
+        self._interval_errors = 0
+
+    def record(self, tool: str, latency: float, error: Optional[str] = None) -> None:
+        self.latencies.setdefault(tool, []).append(latency)
+        self._interval_latencies.append(latency)
+        if error is not None:
+            self.errors[tool] = self.errors.get(tool, 0) + 1
+            self._interval_errors += 1
+            message = f"{tool}: {error[:200]}"
+            self.error_messages[message] = self.error_messages.get(message, 0) + 1
+
+    def interval(self, seconds: float) -> Dict[str, Any]:
+        """Summarize and reset the calls since the previous interval."""
+        summary = summarize(self._interval_latencies, self._interval_errors, seconds)
+        self._interval_latencies = []
+        self._interval_errors = 0
+        return summary
+
+    def summary(self, seconds: float) -> Dict[str, Any]:
+        all_latencies = [latency for latencies in self.latencies.values() for latency in latencies]
+        return {
+            "overall": summarize(all_latencies, sum(self.errors.values()), seconds),
+            "tools": {
+                tool: summarize(latencies, self.errors.get(tool, 0), seconds)
+                for tool, latencies in sorted(self.latencies.items())
+            },
+            "top_errors": dict(sorted(self.error_messages.items(), key=lambda item: -item[1])[:10]),
+        }
+
+
+@asynccontextmanager
+async def connect(
+    transport: str,
+    url: Optional[str] = None,
+    server_command: Optional[Sequence[str]] = None,
+    errlog: TextIO = sys.stderr,
+) -> AsyncIterator[ClientSession]:
+    """Open an initialized MCP client session.
+
+    Args:
+        transport: ``stdio``, ``sse`` or ``streamable-http``.
+        url: Server URL for the HTTP transports.
+        server_command: Command starting the server for stdio.
+        errlog: Where the stdio server's stderr goes.
+    """
+    async with AsyncExitStack() as stack:
+        if transport == "stdio":
+            from mcp.client.stdio import StdioServerParameters, stdio_client
+
+            command = list(server_command or [])
+            if not command:
+                raise ValueError("The stdio transport needs a server command")
+            # Pass the whole environment on, e.g. SEATUNNEL_API_URL
+            params = StdioServerParameters(command=command[0], args=command[1:], env=dict(os.environ))
+            read, write = await stack.enter_async_context(stdio_client(params, errlog=errlog))
+        elif transport == "sse":
+            from mcp.client.sse import sse_client
+
+            read, write = await stack.enter_async_context(sse_client(url or DEFAULT_URLS["sse"]))
+        elif transport == "streamable-http":
+            from mcp.client.streamable_http import streamablehttp_client
+
+            read, write, _ = await stack.enter_async_context(
+                streamablehttp_client(url or DEFAULT_URLS["streamable-http"])
+            )
+        else:
+            raise ValueError(f"Unknown transport: {transport}")
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        yield session
+
+
+class Workload:
+    """Tool choice and arguments for each call."""
+
+    def __init__(
+        self,
+        mix: Dict[str, float],
+        arguments: Optional[Dict[str, Dict[str, Any]]] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the workload.
+
+        Args:
+            mix: Weight by tool name.
+            arguments: Arguments by tool name, overriding the defaults.
+            seed: Random seed of the tool choice.
+        """
+        self.tools = [tool for tool, weight in mix.items() if weight > 0]
+        self.weights = [mix[tool] for tool in self.tools]
+        self.overrides = arguments or {}
+        self.rng = random.Random(seed)
+        self.job_ids: List[str] = []
+        self._calls = 0
+
+    async def prepare(self, session: ClientSession) -> None:
+        """Look up running jobs for the tools that need a job ID."""
+        if not any(tool in JOB_ID_TOOLS and "jobId" not in self.overrides.get(tool, {}) for tool in self.tools):
+            return
+        result = await session.call_tool("get-running-jobs", {})
+        if result.isError:
+            return
+        # Lists come back as one text content per item
+        jobs = []
+        for content in result.content:
+            try:
+                payload = json.loads(getattr(content, "text", ""))
+            except ValueError:
+                continue
+            jobs.extend(job_list(payload))
+        self.job_ids = [str(job["jobId"]) for job in jobs if "jobId" in job]
+
+    def next_call(self) -> Tuple[str, Dict[str, Any]]:
+        """Pick the next tool and its arguments."""
+        tool = self.rng.choices(self.tools, self.weights)[0]
+        self._calls += 1
+        if tool in self.overrides:
+            return tool, self.overrides[tool]
+        if tool in JOB_ID_TOOLS:
+            return tool, {"jobId": self.job_ids[self._calls % len(self.job_ids)] if self.job_ids else "0"}
+        if tool == "submit-job":
+            return tool, {"job_content": DEFAULT_JOB_CONFIG, "jobName": f"bench-{self._calls}", "format": "json"}
+        if tool == "get-finished-jobs":
+            return tool, {"state": "FINISHED"}
+        return tool, {}
+
+
+async def _call(session: ClientSession, tool: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Call a tool; return an error message if it failed."""
+    try:
+        result = await session.call_tool(tool, arguments)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    if result.isError:
+        text = result.content[0].text if result.content and hasattr(result.content[0], "text") else ""
+        return text or "tool error"
+    return None
+
+
+async def run_bench(
+    sessions: Sequence[ClientSession],
+    workload: Workload,
+    duration: float = DEFAULT_DURATION,
+    concurrency: Optional[int] = DEFAULT_CONCURRENCY,
+    rate: Optional[float] = None,
+    report_interval: float = DEFAULT_REPORT_INTERVAL,
+    report: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Replay the workload against the sessions.
+
+    Args:
+        sessions: Initialized client sessions; calls are spread over them.
+        workload: Tool mix and arguments.
+        duration: Seconds to run for.
+        concurrency: Number of calls kept in flight (closed loop).
+        rate: Target calls per second (open loop); overrides ``concurrency``.
+        report_interval: Seconds between two interval reports.
+        report: Called with each interval report.
+
+    Returns:
+        Interval reports and the summary of the whole run.
+
+    Raises:
+        ValueError: If the rate is not positive.
+    """
+    if rate is not None and rate <= 0:
+        raise ValueError(f"Invalid rate {rate}: must be positive")
+    stats = BenchStats()
+    timeline: List[Dict[str, Any]] = []
+    start = time.perf_counter()
+    deadline = start + duration
+    session_index = 0
+
+    def next_session() -> ClientSession:
+        nonlocal session_index
+        session_index += 1
+        return sessions[session_index % len(sessions)]
+
+    async def timed_call(scheduled: float) -> None:
+        tool, arguments = workload.next_call()
+        error = await _call(next_session(), tool, arguments)
+        stats.record(tool, time.perf_counter() - scheduled, error)
+
+    async def closed_loop() -> None:
+        while time.perf_counter() < deadline:
+            await timed_call(time.perf_counter())
+
+    async def open_loop(rate: float) -> None:
+        interval = 1.0 / rate
+        in_flight: Set[asyncio.Future] = set()
+        # Scheduled from the start rather than by adding up intervals, so
+        # that rounding errors cannot add a call at the deadline
+        for index in itertools.count():
+            scheduled = start + index * interval
+            if scheduled >= deadline:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(timed_call(scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def reporter() -> None:
+        last = start
+        while True:
+            await asyncio.sleep(report_interval)
+            now = time.perf_counter()
+            entry = {"elapsed_s": round(now - start, 1), **stats.interval(now - last)}
+            last = now
+            timeline.append(entry)
+            if report is not None:
+                report(entry)
+
+    reporting = asyncio.ensure_future(reporter())
+    try:
+        if rate is not None:
+            await open_loop(rate)
+        else:
+            await asyncio.gather(*(closed_loop() for _ in range(max(1, concurrency or 1))))
+    finally:
+        reporting.cancel()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "config": {
+            "mix": dict(zip(workload.tools, workload.weights)),
+            "duration_s": duration,
+            "concurrency": None if rate else concurrency,
+            "rate_per_s": rate,
+            "sessions": len(sessions),
+        },
+        "timeline": timeline,
+        "summary": stats.summary(elapsed),
+    }
+
+
+def format_interval(entry: Dict[str, Any]) -> str:
+    latency = entry["latency_ms"]
+    return (
+        f"[{entry['elapsed_s']:>7.1f}s] {entry['throughput_per_s']:>9.1f} calls/s  "
+        f"errors {entry['error_rate']:>6.1%}  p50 {latency['p50']:>8.1f} ms  "
+        f"p95 {latency['p95']:>8.1f} ms  p99 {latency['p99']:>8.1f} ms"
+    )
+
+
+def format_summary(result: Dict[str, Any]) -> str:
+    summary = result["summary"]
+    lines = [f"{'tool':<36} {'calls':>8} {'errors':>7} {'calls/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    rows = list(summary["tools"].items()) + [("TOTAL", summary["overall"])]
+    for tool, stats in rows:
+        latency = stats["latency_ms"]
+        lines.append(
+            f"{tool:<36} {stats['calls']:>8} {stats['errors']:>7} {stats['throughput_per_s']:>9} "
+            f"{latency['p50']:>9} {latency['p95']:>9} {latency['p99']:>9}"
+        )
+    if summary["top_errors"]:
+        lines.append("\nMost frequent errors:")
+        lines.extend(f"  {count:>6} x {message}" for message, count in summary["top_errors"].items())
+    return "\n".join(lines)
+
+
+async def bench(
+    transport: str,
+    url: Optional[str] = None,
+    server_command: Optional[Sequence[str]] = None,
+    sessions: int = 1,
+    mix: str = DEFAULT_MIX,
+    arguments: Optional[Dict[str, Dict[str, Any]]] = None,
+    seed: Optional[int] = None,
+    errlog: TextIO = sys.stderr,
+    **options: Any,
+) -> Dict[str, Any]:
+    """Connect to a server and run a benchmark; see ``run_bench`` for the options."""
+    workload = Workload(parse_mix(mix), arguments, seed)
+    async with AsyncExitStack() as stack:
+        clients = [
+            await stack.enter_async_context(connect(transport, url, server_command, errlog))
+            for _ in range(max(1, sessions))
+        ]
+        await workload.prepare(clients[0])
+        return await run_bench(clients, workload, **options)
@@ -0,0 +1,198 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Bulk job operations: parallel stop and rolling restart with savepoints."""
+
+import asyncio
+import fnmatch
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .client import SeaTunnelAPI
+from .concurrency import DEFAULT_MAX_CONCURRENCY, bounded_gather, run_sync
+from .jobs import TERMINAL_STATES, job_list, job_status
+from .progress import progress_reporter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAVE_SIZE = 10
+DEFAULT_POLL_INTERVAL = 2.0
+DEFAULT_STOP_TIMEOUT = 300.0
+
+
+async def select_running_job_ids(
+    client: SeaTunnelAPI, job_name_pattern: Optional[str] = None
+) -> List[str]:
+    """Select the IDs of running jobs, optionally filtered by job name.
+
+    Args:
+        client: SeaTunnel client instance.
+        job_name_pattern: Optional shell-style glob matched against ``jobName``.
+
+    Returns:
+        List of matching job IDs.
+    """
+    jobs = job_list(await run_sync(client.get_running_jobs))
+    return [
+        str(job["jobId"])
+        for job in jobs
+        if "jobId" in job
+        and (job_name_pattern is None or fnmatch.fnmatchcase(str(job.get("jobName", "")), job_name_pattern))
+    ]
+
+
+async def stop_jobs(
+    client: SeaTunnelAPI,
+    job_ids: Sequence[Union[str, int]],
+    isStopWithSavePoint: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Stop many jobs concurrently.
+
+    Args:
+        client: SeaTunnel client instance.
+        job_ids: IDs of the jobs to stop.
+        isStopWithSavePoint: Whether to stop with savepoint.
+        max_concurrency: Maximum number of ``/stop-job`` calls in flight.
+
+    Returns:
+        Dict with the stopped job IDs and per-job failures.
+    """
+    reporter = progress_reporter()
+    done = 0
+
+    async def stop_one(job_id: Union[str, int]) -> Dict[str, Any]:
+        nonlocal done
+        try:
+            return await run_sync(client.stop_job, jobId=job_id, isStartWithSavePoint=isStopWithSavePoint)
+        finally:
+            done += 1
+            reporter.report(done, len(job_ids), message=f"{done}/{len(job_ids)} jobs stopped")
+
+    results = await bounded_gather(stop_one, job_ids, max_concurrency)
+
+    stopped: List[str] = []
+    failed: List[Dict[str, Any]] = []
+    for job_id, result in zip(job_ids, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to stop job {job_id}: {result}")
+            failed.append({"jobId": str(job_id), "error": str(result)})
+        else:
+            stopped.append(str(job_id))
+
+    return {"total": len(job_ids), "stopped": stopped, "failed": failed}
+
+
+async def wait_for_terminal_state(
+    client: SeaTunnelAPI,
+    job_id: Union[str, int],
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    timeout: float = DEFAULT_STOP_TIMEOUT,
+    report_progress: bool = True,
+) -> str:
+    """Poll a job until it reaches a terminal state.
+
+    Args:
+        client: SeaTunnel client instance.
+        job_id: Job ID.
+        poll_interval: Seconds between polls.
+        timeout: Maximum number of seconds to wait.
+        report_progress: Whether to report polling iterations as progress.
+
+    Returns:
+        The terminal job status.
+
+    Raises:
+        TimeoutError: If the job does not reach a terminal state in time.
+    """
+    reporter = progress_reporter()
+    deadline = time.monotonic() + timeout
+    polls = 0
+    while True:
+        status = job_status(await run_sync(client.get_job_info, jobId=job_id))
+        if status in TERMINAL_STATES:
+            return status
+        polls += 1
+        if report_progress:
+            reporter.report(polls, message=f"Job {job_id} is {status or 'UNKNOWN'} after {polls} poll(s)")
+        if time.monotonic() + poll_interval > deadline:
+            raise TimeoutError(f"Job {job_id} still {status or 'UNKNOWN'} after {timeout}s")
+        await asyncio.sleep(poll_interval)
+
+
+async def rolling_restart(
+    client: SeaTunnelAPI,
+    jobs: Sequence[Dict[str, Any]],
+    wave_size: int = DEFAULT_WAVE_SIZE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    stop_timeout: float = DEFAULT_STOP_TIMEOUT,
+) -> Dict[str, Any]:
+    """Restart jobs in waves: stop with savepoint, wait, resubmit from the savepoint.
+
+    The REST API does not return a job's configuration, so each entry must
+    carry the configuration to resubmit.
+
+    Args:
+        client: SeaTunnel client instance.
+        jobs: Entries with ``jobId`` and ``job_content``, and optionally
+            ``jobName`` and ``format``.
+        wave_size: Number of jobs restarted concurrently per wave.
+        poll_interval: Seconds between job state polls while waiting for a stop.
+        stop_timeout: Maximum number of seconds to wait for each stop.
+
+    Returns:
+        Dict with the restarted job IDs and per-job failures. Jobs of a wave
+        are only resubmitted once their savepoint is done; later waves start
+        after the previous wave has been resubmitted. A job that stops without
+        a savepoint is reported as failed and left stopped.
+    """
+    reporter = progress_reporter()
+
+    async def restart_one(job: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = job["jobId"]
+        await run_sync(client.stop_job, jobId=job_id, isStartWithSavePoint=True)
+        status = await wait_for_terminal_state(
+            client, job_id, poll_interval, stop_timeout, report_progress=False
+        )
+        if status != "SAVEPOINT_DONE":
+            raise RuntimeError(f"Job {job_id} ended as {status} without a savepoint; not resubmitted")
+        return await run_sync(
+            client.submit_job,
+            job_content=job["job_content"],
+            jobName=job.get("jobName"),
+            jobId=job_id,
+            isStartWithSavePoint=True,
+            format=job.get("format", "hocon"),
+        )
+
+    wave_size = max(1, wave_size)
+    restarted: List[str] = []
+    failed: List[Dict[str, Any]] = []
+    for start in range(0, len(jobs), wave_size):
+        wave = jobs[start:start + wave_size]
+        results = await bounded_gather(restart_one, wave, wave_size)
+        for job, result in zip(wave, results):
+            job_id = str(job.get("jobId"))
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to restart job {job_id}: {result}")
+                failed.append({"jobId": job_id, "error": str(result)})
+            else:
+                restarted.append(job_id)
+        done = len(restarted) + len(failed)
+        reporter.report(done, len(jobs), message=f"{done}/{len(jobs)} jobs restarted", force=True)
+
+    return {"total": len(jobs), "restarted": restarted, "failed": failed}
@@ -0,0 +1,200 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Cancellation of blocking SeaTunnel requests whose caller went away.
+
+Blocking client calls run in worker threads, which asyncio cannot cancel.
+Each call therefore runs under a :class:`CancelScope`, passed to its thread
+through a context variable. Cancelling the awaiting coroutine, e.g. because
+the MCP client cancelled the tool call or closed its session, cancels the
+scope: requests not sent yet fail before sending, and the socket of a request
+in flight is shut down, so that the blocked read returns at once and the
+connection leaves the pool instead of holding a slot until the response.
+"""
+
+import contextlib
+import contextvars
+import logging
+import socket
+import threading
+from typing import Any, Iterator, Optional, Set
+
+import httpcore
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCancelled(Exception):
+    """Raised in a worker thread whose request was cancelled by its caller."""
+
+
+class CancelScope:
+    """Cancellation state of one blocking call, shared with its worker thread."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._streams: Set[Any] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the scope was cancelled."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the scope and abort the network streams in use."""
+        with self._lock:
+            self._event.set()
+            streams = list(self._streams)
+        for stream in streams:
+            _abort(stream)
+
+    def check(self) -> None:
+        """Raise :class:`RequestCancelled` if the scope was cancelled."""
+        if self._event.is_set():
+            raise RequestCancelled("The request was cancelled by its caller")
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep, waking up early with :class:`RequestCancelled` on cancellation."""
+        if self._event.wait(seconds):
+            self.check()
+
+    @contextlib.contextmanager
+    def using(self, stream: Any) -> Iterator[None]:
+        """Register a network stream to abort on cancellation while it is in use."""
+        with self._lock:
+            self.check()
+            self._streams.add(stream)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._streams.discard(stream)
+
+
+_scope: contextvars.ContextVar[Optional[CancelScope]] = contextvars.ContextVar("cancel_scope", default=None)
+
+
+def current_scope() -> Optional[CancelScope]:
+    """Get the cancel scope of the current call, if any."""
+    return _scope.get()
+
+
+@contextlib.contextmanager
+def scope() -> Iterator[CancelScope]:
+    """Run the block, and the worker threads it starts, under a new cancel scope."""
+    cancel_scope = CancelScope()
+    token = _scope.set(cancel_scope)
+    try:
+        yield cancel_scope
+    finally:
+        _scope.reset(token)
+
+
+def check() -> None:
+    """Raise :class:`RequestCancelled` if the current call was cancelled."""
+    cancel_scope = _scope.get()
+    if cancel_scope is not None:
+        cancel_scope.check()
+
+
+def sleep(seconds: float) -> None:
+    """Sleep, waking up early with :class:`RequestCancelled` if the current call is cancelled."""
+    cancel_scope = _scope.get()
+    if cancel_scope is None:
+        threading.Event().wait(seconds)
+    else:
+        cancel_scope.sleep(seconds)
+
+
+def _abort(stream: Any) -> None:
+    sock = stream.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        # Already closed by the worker thread
+        pass
+
+
+class _CancellableStream(httpcore.NetworkStream):
+    """Network stream registering itself with the current cancel scope while blocked in it."""
+
+    def __init__(self, stream: httpcore.NetworkStream):
+        self._stream = stream
+
+    @contextlib.contextmanager
+    def _using(self) -> Iterator[None]:
+        cancel_scope = _scope.get()
+        if cancel_scope is None:
+            yield
+        else:
+            with cancel_scope.using(self._stream):
+                yield
+
+    def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        with self._using():
+            return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        with self._using():
+            self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(self, *args: Any, **kwargs: Any) -> httpcore.NetworkStream:
+        with self._using():
+            return _CancellableStream(self._stream.start_tls(*args, **kwargs))
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+class CancellableBackend(httpcore.NetworkBackend):
+    """Network backend whose streams can be aborted from another thread on cancellation."""
+
+    def __init__(self, backend: httpcore.NetworkBackend):
+        self._backend = backend
+
+    def connect_tcp(self, *args: Any, **kwargs: Any) -> httpcore.NetworkStream:
+        check()
+        return _CancellableStream(self._backend.connect_tcp(*args, **kwargs))
+
+    def connect_unix_socket(self, *args: Any, **kwargs: Any) -> httpcore.NetworkStream:
+        check()
+        return _CancellableStream(self._backend.connect_unix_socket(*args, **kwargs))
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+def install(http_client: Any) -> bool:
+    """Make the in-flight requests of an ``httpx.Client`` abortable on cancellation.
+
+    Returns:
+        Whether the client's transport supports it; requests of other
+        transports are only cancelled before they are sent.
+    """
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    backend = getattr(pool, "_network_backend", None)
+    if pool is None or backend is None:
+        logger.debug("In-flight requests cannot be aborted with this transport")
+        return False
+    if not isinstance(backend, CancellableBackend):
+        pool._network_backend = CancellableBackend(backend)
+    return True
@@ -0,0 +1,262 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Recording and replay of SeaTunnel REST API interactions.
+
+A :class:`RecordingTransport` writes every request it sends and the response
+it gets, with its latency, to a cassette: gzip-compressed JSON lines if the
+path ends with ``.gz``. A :class:`ReplayTransport` answers requests from a
+cassette without any network, after the recorded latency divided by
+``speed`` (``0`` answers at once).
+
+Requests are matched on method, path and query and a hash of the body, then
+on method and path, then on method and endpoint template, so that a cassette
+recorded on one cluster also answers requests for the job IDs of another.
+The responses recorded for a match are replayed in turn, repeating once they
+run out. Request headers, including the API key, are not recorded.
+"""
+
+import atexit
+import base64
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from . import cancellation
+from .metrics import endpoint_template
+from .schema import ConnectionProfile
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+# Response headers worth replaying; the rest describe the recorded connection
+RECORDED_HEADERS = ("content-type",)
+
+
+class CassetteMiss(httpx.TransportError):
+    """Raised when a cassette has no response for a request."""
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.GzipFile(path, mode), encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _body_key(request: httpx.Request) -> str:
+    # Multipart bodies differ in their random boundary on every request
+    if request.headers.get("content-type", "").startswith("multipart/"):
+        return ""
+    content = request.read()
+    return hashlib.sha1(content).hexdigest()[:16] if content else ""
+
+
+def _keys(method: str, path: str, body: str) -> Tuple[Tuple[str, ...], ...]:
+    """Match keys of a request, from the most to the least specific."""
+    endpoint = path.split("?", 1)[0]
+    return (
+        ("exact", method, path, body),
+        ("path", method, path),
+        ("template", method, endpoint_template(endpoint)),
+    )
+
+
+class CassetteWriter:
+    """Thread-safe writer of interactions, shared by the recording transports of all clients."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = _open(path, "w")
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._write({"version": CASSETTE_VERSION, "recordedAt": time.strftime("%Y-%m-%dT%H:%M:%S%z")})
+        # An unclosed gzip file lacks its trailer; the reader tolerates that,
+        # but closing at exit keeps the file well-formed.
+        atexit.register(self.close)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+        # Each interaction is readable even if the process dies
+        self._file.flush()
+
+    def record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        """Write one interaction."""
+        content = response.content
+        try:
+            body: Dict[str, Any] = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        record = {
+            "at": 0.0,
+            "method": request.method,
+            "path": request.url.raw_path.decode("ascii"),
+            "body": _body_key(request),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "elapsed": round(elapsed, 6),
+            **body,
+        }
+        with self._lock:
+            if self._file.closed:
+                return
+            record["at"] = round(time.monotonic() - self._start - elapsed, 6)
+            self._write(record)
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class Cassette:
+    """Recorded interactions, indexed for replay."""
+
+    def __init__(self, interactions: List[Dict[str, Any]]):
+        self.interactions = interactions
+        self._index: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for interaction in interactions:
+            for key in _keys(interaction["method"], interaction["path"], interaction.get("body", "")):
+                self._index[key].append(interaction)
+        self._cursors: Dict[Tuple[str, ...], Iterator[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Load a cassette file.
+
+        A file cut short, e.g. by a recording process that was killed, is
+        read up to its last complete interaction.
+        """
+        interactions = []
+        with _open(path, "r") as f:
+            try:
+                for line in f:
+                    record = json.loads(line)
+                    if "version" in record:
+                        if record["version"] != CASSETTE_VERSION:
+                            raise ValueError(f"Unsupported cassette version {record['version']} in {path}")
+                        continue
+                    interactions.append(record)
+            except (EOFError, json.JSONDecodeError):
+                logger.warning(f"Cassette {path} is truncated; replaying its {len(interactions)} complete interactions")
+        return cls(interactions)
+
+    def next_interaction(self, request: httpx.Request) -> Dict[str, Any]:
+        """Get the next recorded interaction matching a request.
+
+        Raises:
+            CassetteMiss: If no interaction matches the request.
+        """
+        path = request.url.raw_path.decode("ascii")
+        with self._lock:
+            for key in _keys(request.method, path, _body_key(request)):
+                if key in self._index:
+                    cursor = self._cursors.get(key)
+                    if cursor is None:
+                        cursor = self._cursors[key] = itertools.cycle(self._index[key])
+                    return next(cursor)
+        raise CassetteMiss(f"No recorded response for {request.method} {path}", request=request)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport sending requests upstream and recording them to a cassette."""
+
+    def __init__(self, writer: CassetteWriter, transport: Optional[httpx.BaseTransport] = None):
+        self.writer = writer
+        self.transport = transport or httpx.HTTPTransport()
+
+    @property
+    def _pool(self) -> Any:
+        # The connection pool of the wrapped transport, for pool metrics and cancellation
+        return getattr(self.transport, "_pool", None)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = self.transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        self.writer.record(request, response, time.perf_counter() - start)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Transport answering requests from a cassette."""
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0):
+        """Initialize the transport.
+
+        Args:
+            cassette: Recorded interactions.
+            speed: Factor the recorded latencies are divided by; 1 replays
+                them as recorded, 0 answers at once.
+        """
+        self.cassette = cassette
+        self.speed = speed
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.next_interaction(request)
+        if self.speed > 0 and interaction.get("elapsed"):
+            cancellation.sleep(interaction["elapsed"] / self.speed)
+        if "base64" in interaction:
+            content = base64.b64decode(interaction["base64"])
+        else:
+            content = interaction.get("text", "").encode("utf-8")
+        return httpx.Response(
+            interaction["status"], headers=interaction.get("headers"), content=content, request=request
+        )
+
+
+def transport_factory(
+    record: Optional[str] = None, replay: Optional[str] = None, speed: float = 1.0
+) -> Optional[Callable[[ConnectionProfile], httpx.BaseTransport]]:
+    """Get a factory of the transports of the clients, if recording or replaying.
+
+    Args:
+        record: Cassette to record the requests of every client to.
+        replay: Cassette to answer the requests of every client from.
+        speed: Replay speed, see :class:`ReplayTransport`.
+
+    Raises:
+        ValueError: If both recording and replaying are requested.
+    """
+    if record and replay:
+        raise ValueError("Cannot record and replay a cassette at the same time")
+    if record:
+        writer = CassetteWriter(record)
+        logger.info(f"Recording SeaTunnel REST API interactions to {record}")
+        return lambda profile: RecordingTransport(writer, httpx.HTTPTransport(limits=httpx.Limits(
+            max_connections=profile.max_connections, max_keepalive_connections=profile.max_connections,
+        )))
+    if replay:
+        cassette = Cassette.load(replay)
+        logger.info(f"Replaying {len(cassette.interactions)} SeaTunnel REST API interactions from {replay}")
+        return lambda profile: ReplayTransport(cassette, speed)
+    return None
@@ -0,0 +1,233 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Chunking of oversized tool results behind continuation tokens.
+
+A result whose JSON exceeds the byte budget is cut into chunks: lists into
+pages of whole items, anything else (or lists with an item over the budget)
+into slices of its JSON text. The first chunk is returned with a
+continuation token, and the rest is buffered for the ``fetch-continuation``
+tool. Buffers are per MCP session, expire after a TTL of inactivity, and are
+capped in bytes: the oldest continuations are evicted first, and a single
+result over the cap is truncated.
+
+Serializing a result to measure it is done in a worker thread, since list
+results can hold thousands of jobs. Buffers only live as long as their MCP
+session, so chunking is of no use to stateless servers, where every request
+gets a new session.
+"""
+
+import bisect
+import functools
+import itertools
+import json
+import secrets
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp.server.lowlevel.server import request_ctx
+
+from .concurrency import run_sync
+
+DEFAULT_MAX_RESPONSE_BYTES = 1024 * 1024
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_BUFFER_BYTES = 32 * 1024 * 1024
+
+
+def _current_session() -> Optional[Any]:
+    try:
+        return request_ctx.get().session
+    except LookupError:
+        return None
+
+
+class _Continuation:
+    """Rest of a chunked result, either whole items or JSON text."""
+
+    __slots__ = ("items", "offsets", "text", "position", "start", "truncated", "expires")
+
+    def __init__(self, items: Optional[List[Any]] = None, sizes: Optional[List[int]] = None, text: str = ""):
+        self.items = items
+        # JSON bytes before each item, so that chunk bounds are found by bisection
+        self.offsets = list(itertools.accumulate(sizes, initial=0)) if sizes is not None else None
+        self.text = text
+        self.position = 0
+        # Position of the first buffered item or character in the whole result
+        self.start = 0
+        self.truncated = False
+        self.expires = 0.0
+
+    @property
+    def end(self) -> int:
+        return len(self.items) if self.items is not None else len(self.text)
+
+    def remaining_bytes(self) -> int:
+        if self.offsets is not None:
+            return self.offsets[-1] - self.offsets[self.position]
+        return len(self.text) - self.position
+
+    def chunk(self, max_bytes: int) -> Dict[str, Any]:
+        """Take the next chunk of at most ``max_bytes`` JSON bytes."""
+        first = self.position
+        if self.items is not None and self.offsets is not None:
+            # At least one item per chunk; callers ensure every item fits the budget
+            last = bisect.bisect_right(self.offsets, self.offsets[first] + max_bytes) - 1
+            last = min(max(last, first + 1), len(self.items))
+            chunk: Dict[str, Any] = {"items": self.items[first:last]}
+        else:
+            last = min(first + max_bytes, len(self.text))
+            chunk = {"text": self.text[first:last]}
+        self.position = last
+        chunk["offset"] = self.start + first
+        chunk["total"] = self.start + self.end
+        if self.truncated and last >= self.end:
+            chunk["truncated"] = True
+        return chunk
+
+    def rebase(self, max_bytes: int) -> None:
+        """Keep only what has not been returned yet, at most ``max_bytes`` of it."""
+        first = self.position
+        if self.items is not None and self.offsets is not None:
+            last = bisect.bisect_right(self.offsets, self.offsets[first] + max_bytes) - 1
+            self.truncated = last < len(self.items)
+            self.items = self.items[first:last]
+            self.offsets = [offset - self.offsets[first] for offset in self.offsets[first:last + 1]]
+        else:
+            self.truncated = len(self.text) - first > max_bytes
+            self.text = self.text[first:first + max_bytes]
+        self.start += first
+        self.position = 0
+
+
+class ContinuationBuffer:
+    """Per-session buffer of the rest of oversized tool results."""
+
+    def __init__(
+        self,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        ttl: float = DEFAULT_TTL,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            max_response_bytes: JSON bytes of a tool result or chunk at most.
+            ttl: Seconds a continuation is kept after its last use.
+            max_buffer_bytes: JSON bytes buffered per session at most.
+        """
+        if max_response_bytes < 1:
+            raise ValueError("max_response_bytes must be at least 1")
+        self.max_response_bytes = max_response_bytes
+        self.ttl = ttl
+        self.max_buffer_bytes = max_buffer_bytes
+        self.now = time.monotonic
+        self._sessions: "weakref.WeakKeyDictionary[Any, OrderedDict[str, _Continuation]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Calls outside of an MCP request, e.g. in tests
+        self._no_session: "OrderedDict[str, _Continuation]" = OrderedDict()
+
+    def _entries(self) -> "OrderedDict[str, _Continuation]":
+        session = _current_session()
+        if session is None:
+            entries = self._no_session
+        else:
+            entries = self._sessions.setdefault(session, OrderedDict())
+        now = self.now()
+        for token in [token for token, entry in entries.items() if entry.expires <= now]:
+            del entries[token]
+        return entries
+
+    def buffered_bytes(self) -> int:
+        """JSON bytes buffered for the current session."""
+        return sum(entry.remaining_bytes() for entry in self._entries().values())
+
+    def guard(self, result: Any) -> Any:
+        """Return the result, or its first chunk if it exceeds the byte budget."""
+        split = self._split(result)
+        return result if split is None else self._store(*split)
+
+    def _split(self, result: Any) -> Optional[Tuple[Dict[str, Any], _Continuation]]:
+        """Cut the first chunk off a result over the byte budget.
+
+        Touches no shared state, so that it can run in a worker thread.
+
+        Returns:
+            The first chunk and the continuation of the rest, or None if the
+            result is within the budget.
+        """
+        if isinstance(result, list):
+            # Each item plus its separator, and the brackets
+            sizes = [len(json.dumps(item, default=str)) + 1 for item in result]
+            if sum(sizes) + 1 <= self.max_response_bytes:
+                return None
+            if max(sizes) + 1 <= self.max_response_bytes:
+                return self._first_chunk(_Continuation(items=result, sizes=sizes), self.max_response_bytes - 1)
+            # An item over the budget on its own: fall back to slices of the JSON text
+        text = json.dumps(result, default=str)
+        if not isinstance(result, list) and len(text) <= self.max_response_bytes:
+            return None
+        return self._first_chunk(_Continuation(text=text), self.max_response_bytes)
+
+    def fetch(self, token: str) -> Dict[str, Any]:
+        """Return the next chunk of a continuation.
+
+        Raises:
+            ValueError: If the token is unknown, expired or exhausted.
+        """
+        entries = self._entries()
+        entry = entries.get(token)
+        if entry is None:
+            raise ValueError(f"Unknown or expired continuation token: {token}")
+        entries.move_to_end(token)
+        chunk = entry.chunk(self.max_response_bytes - 1 if entry.items is not None else self.max_response_bytes)
+        if entry.position >= entry.end:
+            del entries[token]
+            chunk["continuation"] = None
+        else:
+            entry.expires = self.now() + self.ttl
+            chunk["continuation"] = token
+        return chunk
+
+    def _first_chunk(self, entry: _Continuation, max_bytes: int) -> Tuple[Dict[str, Any], _Continuation]:
+        chunk = entry.chunk(max_bytes)
+        entry.rebase(self.max_buffer_bytes)
+        return chunk, entry
+
+    def _store(self, chunk: Dict[str, Any], entry: _Continuation) -> Dict[str, Any]:
+        """Buffer the rest of a result for the current session and link its first chunk to it."""
+        entries = self._entries()
+        buffered = sum(other.remaining_bytes() for other in entries.values())
+        while entries and buffered + entry.remaining_bytes() > self.max_buffer_bytes:
+            buffered -= entries.popitem(last=False)[1].remaining_bytes()
+        token = secrets.token_urlsafe(16)
+        entry.expires = self.now() + self.ttl
+        entries[token] = entry
+        chunk["continuation"] = token
+        return chunk
+
+    def wrap_tool(self, func: Callable) -> Callable:
+        """Wrap a tool function so that its oversized results are chunked."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await func(*args, **kwargs)
+            split = await run_sync(self._split, result)
+            return result if split is None else self._store(*split)
+
+        return wrapper
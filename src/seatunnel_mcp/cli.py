@@ -26,25 +26,31 @@ import logging
 import json
 from typing import Optional, Dict, Any, List
 
-from dotenv import load_dotenv
-
 from . import __version__
-from .__main__ import main as run_server
+from .logs import LOG_FORMATS, configure_logging, parse_sampling
 
+# 注意: 服务器相关模块 (mcp、httpx、pydantic 等) 导入开销较大，只在 run 命令中按需导入，
+# 以保证 --version、init、configure-claude 等命令以及每个会话启动时的冷启动速度。
+
+
+def setup_logging(level: str, log_format: Optional[str] = None, sampling: Optional[str] = None) -> None:
+    """设置日志。
+
+    日志记录经队列交给后台线程输出，不阻塞请求处理。
 
-def setup_logging(level: str) -> None:
-    """设置日志级别。
-    
     Args:
         level: 日志级别 (debug, info, warning, error, critical)
+        log_format: 日志格式 text 或 json (默认: 环境变量 SEATUNNEL_MCP_LOG_FORMAT，或 text)
+        sampling: 按 logger 采样 debug 日志，格式为 logger=N,... (默认: 环境变量 SEATUNNEL_MCP_LOG_SAMPLING)
     """
     numeric_level = getattr(logging, level.upper(), None)
     if not isinstance(numeric_level, int):
         raise ValueError(f"无效的日志级别: {level}")
-    
-    logging.basicConfig(
-        level=numeric_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+
+    configure_logging(
+        numeric_level,
+        log_format or os.environ.get("SEATUNNEL_MCP_LOG_FORMAT", "text"),
+        parse_sampling(sampling if sampling is not None else os.environ.get("SEATUNNEL_MCP_LOG_SAMPLING", "")),
     )
 
 
@@ -133,6 +139,104 @@ def configure_mcp_for_claude_desktop(config_file: Optional[str] = None) -> None:
     print(f"已为 Claude Desktop 配置 SeaTunnel MCP 服务器: {config_file}")
 
 
+def run_bench(args: argparse.Namespace) -> None:
+    """压测运行中的 MCP 服务器，并打印吞吐量、错误率和延迟分位数。
+
+    Args:
+        args: bench 子命令的参数
+    """
+    import asyncio
+    import shlex
+
+    from .bench import (
+        DEFAULT_CONCURRENCY,
+        DEFAULT_MIX,
+        bench,
+        format_interval,
+        format_summary,
+    )
+
+    # 每次调用都会产生 HTTP 请求日志，压测时只保留警告
+    for name in ("httpx", "mcp.client"):
+        logging.getLogger(name).setLevel(max(logging.WARNING, logging.getLogger().level))
+
+    arguments = None
+    if args.arguments:
+        with open(args.arguments, "r") as f:
+            arguments = json.load(f)
+
+    load = f"{args.rate} 次/秒" if args.rate else f"并发 {args.concurrency or DEFAULT_CONCURRENCY}"
+    print(f"压测 {args.transport} 服务器 {args.duration:g} 秒 ({load}, {args.sessions} 个会话)")
+    with open(args.server_log or os.devnull, "a") as server_log:
+        result = asyncio.run(bench(
+            args.transport,
+            url=args.url,
+            server_command=shlex.split(args.server_command),
+            sessions=args.sessions,
+            mix=args.mix or DEFAULT_MIX,
+            arguments=arguments,
+            seed=args.seed,
+            errlog=server_log,
+            duration=args.duration,
+            concurrency=args.concurrency or DEFAULT_CONCURRENCY,
+            rate=args.rate,
+            report_interval=args.report_interval,
+            report=lambda entry: print(format_interval(entry)),
+        ))
+    print()
+    print(format_summary(result))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"\n结果已保存到 {args.output}")
+
+
+def run_export_snapshot(args: argparse.Namespace) -> None:
+    """导出集群快照，用于离线容量分析。
+
+    Args:
+        args: export-snapshot 子命令的参数
+    """
+    import asyncio
+
+    from dotenv import load_dotenv
+
+    from .client import SeaTunnelClient
+    from .concurrency import DEFAULT_MAX_CONCURRENCY
+    from .snapshot import default_file_name, export_snapshot_to
+
+    # 每个作业详情都会产生 HTTP 请求日志，导出时只保留警告
+    logging.getLogger("httpx").setLevel(max(logging.WARNING, logging.getLogger().level))
+
+    if args.env_file:
+        load_dotenv(args.env_file)
+    else:
+        load_dotenv()
+    api_url = args.api_url or os.environ.get("SEATUNNEL_API_URL", "http://localhost:8090")
+    api_key = args.api_key or os.environ.get("SEATUNNEL_API_KEY")
+    output = args.output or default_file_name(args.format or "jsonl")
+    concurrency = args.concurrency or DEFAULT_MAX_CONCURRENCY
+
+    print(f"导出 {api_url} 的快照到 {output} (并发 {concurrency})")
+    client = SeaTunnelClient(base_url=api_url, api_key=api_key, max_connections=max(concurrency, 1))
+    try:
+        summary = asyncio.run(export_snapshot_to(
+            client,
+            output,
+            format=args.format,
+            include_job_info=not args.no_job_info,
+            max_concurrency=concurrency,
+        ))
+    finally:
+        client.close()
+    records = ", ".join(f"{kind}={count}" for kind, count in sorted(summary["records"].items()))
+    print(f"完成: {summary['jobs']} 个作业, {summary['bytes']} 字节, 用时 {summary['seconds']:g} 秒")
+    print(f"记录: {records}")
+    if summary["errors"]:
+        print(f"警告: {summary['errors']} 次获取失败，详见快照中的 error 记录")
+
+
 def main() -> None:
     """命令行入口点。"""
     parser = argparse.ArgumentParser(description="SeaTunnel MCP 服务器命令行工具")
@@ -141,6 +245,9 @@ def main() -> None:
     parser.add_argument("-v", "--version", action="store_true", help="显示版本信息")
     parser.add_argument("--log-level", choices=["debug", "info", "warning", "error", "critical"],
                       default="info", help="设置日志级别 (默认: info)")
+    parser.add_argument("--log-format", choices=LOG_FORMATS, help="日志格式，json 为每行一个 JSON 对象 (默认: text)")
+    parser.add_argument("--log-sampling", help="按 logger 采样 debug 日志，每 N 条保留 1 条，"
+                                               "格式为 logger=N,... (如 seatunnel_mcp.client=100)")
     
     # 子命令
     subparsers = parser.add_subparsers(dest="command", help="命令")
@@ -152,7 +259,61 @@ def main() -> None:
     run_parser.add_argument("--api-url", help="SeaTunnel API URL (默认: 从环境变量获取)")
     run_parser.add_argument("--api-key", help="SeaTunnel API 密钥 (默认: 从环境变量获取)")
     run_parser.add_argument("--env-file", help="环境变量文件路径 (默认: .env)")
+    run_parser.add_argument("--transport", choices=["stdio", "sse", "streamable-http"],
+                          help="传输方式 (默认: 从环境变量获取，否则为 stdio)")
+    run_parser.add_argument("--workers", type=int, help="uvicorn 工作进程数，仅用于 streamable-http (默认: 1)")
+    run_parser.add_argument("--limit-concurrency", type=int, help="每个工作进程的最大并发连接数 (默认: 不限制)")
+    run_parser.add_argument("--keep-alive", type=int, help="HTTP keep-alive 超时秒数 (默认: 5)")
+    run_parser.add_argument("--tracing", action="store_true", help="启用 OpenTelemetry 链路追踪 (需要 opentelemetry-api)")
+    run_parser.add_argument("--profile-tools", action="store_true", help="启用工具调用的采样性能分析")
+    run_parser.add_argument("--profile-sample-every", type=int, help="每 N 次调用采样一次 (默认: 10)")
+    run_parser.add_argument("--profile-dir", help="火焰图堆栈文件的输出目录 (默认: profiles)")
+    run_parser.add_argument("--max-response-bytes", type=int,
+                            help="工具结果的最大字节数，超出时分块返回并附带续取令牌，0 表示不限制 (默认: 1048576)")
+    run_parser.add_argument("--rate-limit", type=float, help="每个 SeaTunnel 集群每秒的最大请求数 (默认: 不限制)")
+    run_parser.add_argument("--rate-burst", type=float, help="超出速率限制的突发请求数 (默认: 等于速率)")
+    run_parser.add_argument("--endpoint-rate-limits", help="按接口或接口类别限制每秒请求数，格式为 key=rate,... "
+                            "(如 expensive=2,/job-info/{jobId}=50)")
+    run_parser.add_argument("--bulkheads", help="按接口类别限制并发请求数，格式为 class=N,... "
+                            "类别为 expensive、submit、default (如 expensive=4)")
+    run_parser.add_argument("--limit-max-wait", type=float, help="请求等待速率限制和并发限制的最长秒数 (默认: 10)")
+    cassette_group = run_parser.add_mutually_exclusive_group()
+    cassette_group.add_argument("--record", help="将 SeaTunnel REST API 的请求和响应录制到文件，.gz 结尾时压缩")
+    cassette_group.add_argument("--replay", help="从录制文件回放 SeaTunnel REST API 的响应，不访问网络")
+    run_parser.add_argument("--replay-speed", type=float,
+                            help="回放加速倍数，1 为按录制时的延迟回放，0 为立即响应 (默认: 1)")
     
+    # 压测
+    bench_parser = subparsers.add_parser("bench", help="压测运行中的 MCP 服务器")
+    bench_parser.add_argument("--transport", choices=["stdio", "sse", "streamable-http"],
+                            default="streamable-http", help="传输方式 (默认: streamable-http)")
+    bench_parser.add_argument("--url", help="服务器地址 (默认: http://127.0.0.1:8080/mcp，sse 为 /sse)")
+    bench_parser.add_argument("--server-command", default=f"{sys.executable} -m {__package__}",
+                            help="stdio 方式下启动服务器的命令 (默认: 当前 Python 运行本包)")
+    bench_parser.add_argument("--server-log", help="stdio 方式下服务器日志的输出文件 (默认: 丢弃)")
+    bench_parser.add_argument("--mix", help="工具调用比例，格式为 tool=weight,... "
+                            "(默认: get-job-info=70,get-running-jobs=20,submit-job=10)")
+    bench_parser.add_argument("--arguments", help="JSON 文件，按工具名指定调用参数")
+    bench_load = bench_parser.add_mutually_exclusive_group()
+    bench_load.add_argument("--concurrency", type=int, help="并发调用数，闭环模式 (默认: 8)")
+    bench_load.add_argument("--rate", type=float, help="目标每秒调用数，开环模式")
+    bench_parser.add_argument("--sessions", type=int, default=1, help="MCP 会话数，模拟多个客户端 (默认: 1)")
+    bench_parser.add_argument("--duration", type=float, default=30.0, help="压测时长，秒 (默认: 30)")
+    bench_parser.add_argument("--report-interval", type=float, default=5.0, help="报告间隔，秒 (默认: 5)")
+    bench_parser.add_argument("--seed", type=int, help="工具选择的随机种子")
+    bench_parser.add_argument("--output", help="将结果保存为 JSON 文件")
+
+    # 导出快照
+    export_parser = subparsers.add_parser("export-snapshot", help="导出集群快照 (作业、作业详情和监控信息)")
+    export_parser.add_argument("--api-url", help="SeaTunnel API URL (默认: 从环境变量获取)")
+    export_parser.add_argument("--api-key", help="SeaTunnel API 密钥 (默认: 从环境变量获取)")
+    export_parser.add_argument("--env-file", help="环境变量文件路径 (默认: .env)")
+    export_parser.add_argument("--output", help="输出文件，.jsonl.gz 为 gzip 压缩的 JSON 行，.parquet 为 Parquet "
+                               "(默认: snapshot-<时间>.jsonl.gz)")
+    export_parser.add_argument("--format", choices=["jsonl", "parquet"], help="输出格式 (默认: 由文件名决定)")
+    export_parser.add_argument("--concurrency", type=int, help="并发获取作业详情的请求数 (默认: 16)")
+    export_parser.add_argument("--no-job-info", action="store_true", help="不导出每个作业的详情")
+
     # 初始化环境变量文件
     init_parser = subparsers.add_parser("init", help="初始化环境变量文件")
     init_parser.add_argument("--env-file", default=".env", help="环境变量文件路径 (默认: .env)")
@@ -163,8 +324,11 @@ def main() -> None:
     
     args = parser.parse_args()
     
-    # 设置日志级别
-    setup_logging(args.log_level)
+    # 设置日志
+    try:
+        setup_logging(args.log_level, args.log_format, args.log_sampling)
+    except ValueError as e:
+        parser.error(str(e))
     
     # 显示版本信息
     if args.version:
@@ -173,6 +337,10 @@ def main() -> None:
     
     # 处理命令
     if args.command == "run":
+        from dotenv import load_dotenv
+
+        from .__main__ import main as run_server
+
         # 加载环境变量
         if args.env_file:
             load_dotenv(args.env_file)
@@ -188,10 +356,78 @@ def main() -> None:
             os.environ["SEATUNNEL_API_URL"] = args.api_url
         if args.api_key:
             os.environ["SEATUNNEL_API_KEY"] = args.api_key
+        if args.transport:
+            os.environ["MCP_TRANSPORT"] = args.transport
+        if args.workers:
+            os.environ["MCP_WORKERS"] = str(args.workers)
+        if args.limit_concurrency:
+            os.environ["MCP_LIMIT_CONCURRENCY"] = str(args.limit_concurrency)
+        if args.keep_alive:
+            os.environ["MCP_TIMEOUT_KEEP_ALIVE"] = str(args.keep_alive)
+        if args.tracing:
+            os.environ["SEATUNNEL_MCP_TRACING"] = "1"
+        if args.profile_tools:
+            os.environ["SEATUNNEL_MCP_PROFILE_TOOLS"] = "1"
+        if args.profile_sample_every:
+            os.environ["SEATUNNEL_MCP_PROFILE_SAMPLE_EVERY"] = str(args.profile_sample_every)
+        if args.profile_dir:
+            os.environ["SEATUNNEL_MCP_PROFILE_DIR"] = args.profile_dir
+        if args.max_response_bytes is not None:
+            os.environ["SEATUNNEL_MCP_MAX_RESPONSE_BYTES"] = str(args.max_response_bytes)
+        from .limits import parse_limits
+
+        try:
+            parse_limits(args.endpoint_rate_limits or "")
+            parse_limits(args.bulkheads or "", integer=True)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.rate_limit is not None:
+            os.environ["SEATUNNEL_RATE_LIMIT"] = str(args.rate_limit)
+        if args.rate_burst is not None:
+            os.environ["SEATUNNEL_RATE_BURST"] = str(args.rate_burst)
+        if args.endpoint_rate_limits is not None:
+            os.environ["SEATUNNEL_ENDPOINT_RATE_LIMITS"] = args.endpoint_rate_limits
+        if args.bulkheads is not None:
+            os.environ["SEATUNNEL_BULKHEADS"] = args.bulkheads
+        if args.limit_max_wait is not None:
+            os.environ["SEATUNNEL_LIMIT_MAX_WAIT"] = str(args.limit_max_wait)
+        if args.replay_speed is not None and args.replay_speed < 0:
+            parser.error("--replay-speed 不能为负数")
+        if args.record:
+            os.environ["SEATUNNEL_MCP_RECORD"] = args.record
+        if args.replay:
+            os.environ["SEATUNNEL_MCP_REPLAY"] = args.replay
+        if args.replay_speed is not None:
+            os.environ["SEATUNNEL_MCP_REPLAY_SPEED"] = str(args.replay_speed)
+        # 日志配置也要传给 uvicorn 工作进程
+        os.environ["SEATUNNEL_MCP_LOG_LEVEL"] = args.log_level
+        if args.log_format:
+            os.environ["SEATUNNEL_MCP_LOG_FORMAT"] = args.log_format
+        if args.log_sampling is not None:
+            os.environ["SEATUNNEL_MCP_LOG_SAMPLING"] = args.log_sampling
+        # 重新设置日志，使环境变量文件中的日志配置生效
+        setup_logging(args.log_level)
         
         # 运行服务器
         run_server()
     
+    elif args.command == "bench":
+        from .bench import parse_mix
+
+        if args.rate is not None and args.rate <= 0:
+            parser.error("--rate 必须大于 0")
+        if args.concurrency is not None and args.concurrency < 1:
+            parser.error("--concurrency 必须大于 0")
+        if args.mix:
+            try:
+                parse_mix(args.mix)
+            except ValueError as e:
+                parser.error(str(e))
+        run_bench(args)
+
+    elif args.command == "export-snapshot":
+        run_export_snapshot(args)
+
     elif args.command == "init":
         create_env_file(args.env_file)
     
@@ -16,29 +16,205 @@
 
 """SeaTunnel API client for interacting with the REST API."""
 
+import contextlib
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union
+import os
+import threading
+import time
+from typing import AsyncContextManager, Dict, List, Any, Optional, Protocol, Union
 import httpx
 
+from . import cancellation, metrics
+from .cancellation import RequestCancelled
+from .limits import UpstreamLimits
+from .metrics import endpoint_template
+from .progress import ProgressReporter, progress_reporter
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 20
+
+# Endpoint template requested by each client method, for admission before
+# the method runs
+METHOD_ENDPOINTS = {
+    "submit_job": "/submit-job",
+    "submit_jobs": "/submit-jobs",
+    "submit_job_upload": "/submit-job/upload",
+    "stop_job": "/stop-job",
+    "get_job_info": "/job-info/{jobId}",
+    "get_running_job": "/running-job/{jobId}",
+    "get_running_jobs": "/running-jobs",
+    "get_finished_jobs": "/finished-jobs/{state}",
+    "get_overview": "/overview",
+    "get_system_monitoring_information": "/system-monitoring-information",
+}
+
+
+class SeaTunnelAPI(Protocol):
+    """Interface of the SeaTunnel REST API used by the tools.
+
+    Implemented by :class:`SeaTunnelClient` and by facades routing to one,
+    such as the per-session ``SessionClient``.
+    """
+
+    base_url: str
+
+    def get_connection_settings(self) -> Dict[str, Any]: ...
+
+    def update_connection_settings(self, url: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]: ...
+
+    def submit_job(
+        self,
+        job_content: str,
+        jobName: Optional[str] = None,
+        jobId: Optional[str] = None,
+        isStartWithSavePoint: Optional[bool] = None,
+        format: str = "hocon",
+    ) -> Dict[str, Any]: ...
+
+    def submit_jobs(self, request_body: Any) -> Dict[str, Any]: ...
+
+    def submit_job_upload(
+        self,
+        config_file: Union[str, Any],
+        jobName: Optional[str] = None,
+        jobId: Optional[Union[str, int]] = None,
+        isStartWithSavePoint: Optional[bool] = None,
+        format: Optional[str] = None,
+    ) -> Dict[str, Any]: ...
+
+    def stop_job(self, jobId: Union[str, int], isStartWithSavePoint: bool = False) -> Dict[str, Any]: ...
+
+    def get_job_info(self, jobId: Union[str, int]) -> Dict[str, Any]: ...
+
+    def get_running_job(self, jobId: Union[str, int]) -> Dict[str, Any]: ...
+
+    def get_running_jobs(self) -> Dict[str, Any]: ...
+
+    def get_finished_jobs(self, state: str) -> Dict[str, Any]: ...
+
+    def get_overview(self, tags: Optional[Dict[str, str]] = None) -> Dict[str, Any]: ...
+
+    def get_system_monitoring_information(self) -> Union[Dict[str, Any], List[Dict[str, Any]]]: ...
+
+
+class _UploadProgress:
+    """File-like wrapper that reports the number of bytes read for an upload."""
+
+    def __init__(self, file: Any, reporter: ProgressReporter):
+        self._file = file
+        self._reporter = reporter
+        self._bytes_read = 0
+        try:
+            self._total: Optional[int] = os.fstat(file.fileno()).st_size
+        except (AttributeError, OSError, ValueError):
+            self._total = None
+
+    def read(self, size: int = -1) -> bytes:
+        chunk: bytes = self._file.read(size)
+        if chunk:
+            self._bytes_read += len(chunk)
+            self._reporter.report(self._bytes_read, self._total, message="bytes uploaded")
+        return chunk
+
+    def seek(self, *args: Any) -> int:
+        position: int = self._file.seek(*args)
+        self._bytes_read = position
+        return position
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+
+def _log_fields(
+    method: str, endpoint: str, template: str, status: str, start: float, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Structured fields of a request's log records."""
+    job_id = (kwargs.get("params") or {}).get("jobId")
+    if job_id is None and isinstance(kwargs.get("json"), dict):
+        job_id = kwargs["json"].get("jobId")
+    if job_id is None and template.endswith("{jobId}"):
+        job_id = endpoint.rsplit("/", 1)[-1]
+    return {
+        "method": method,
+        "endpoint": template,
+        "status": status,
+        "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        "jobId": job_id,
+    }
+
 
 class SeaTunnelClient:
     """Client for interacting with the SeaTunnel REST API."""
 
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        limits: Optional[UpstreamLimits] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
         """Initialize the client.
 
         Args:
             base_url: Base URL of the SeaTunnel REST API.
             api_key: Optional API key for authentication.
+            timeout: Request timeout in seconds.
+            max_connections: Maximum number of pooled connections to the API.
+            limits: Optional rate limits and bulkheads of the requests.
+            transport: Optional HTTP transport, e.g. to record or replay the
+                requests; its own connection limits replace ``max_connections``.
         """
         self.base_url = base_url
+        self.limits = limits
+        self.transport = transport
         self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
         self.headers = {"Content-Type": "application/json"}
         if api_key:
             self.headers["Authorization"] = f"Bearer {api_key}"
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
+
+    def _get_http_client(self) -> httpx.Client:
+        """Get the long-lived HTTP client, creating it on first use.
+
+        The client keeps a connection pool, so consecutive requests reuse
+        connections instead of paying for a new TCP (and TLS) handshake.
+        """
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections,
+                        ),
+                        transport=self.transport,
+                    )
+                    metrics.track_pool(self)
+                    cancellation.install(self._http_client)
+        return self._http_client
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Get the number of active and idle pooled connections."""
+        pool = getattr(getattr(self._http_client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"active": len(connections) - idle, "idle": idle}
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        with self._http_client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
 
     def update_connection_settings(self, url: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
         """Update connection settings.
@@ -69,6 +245,19 @@ class SeaTunnelClient:
             "has_api_key": self.api_key is not None,
         }
 
+    def admit_async(self, method: str) -> AsyncContextManager[None]:
+        """Wait on the event loop for the rate limits and bulkhead of a client method's endpoint.
+
+        Its requests then pass the limits without blocking their worker thread.
+
+        Args:
+            method: Name of the client method about to run.
+        """
+        template = METHOD_ENDPOINTS.get(method)
+        if self.limits is None or template is None:
+            return contextlib.nullcontext()
+        return self.limits.limiter(self.base_url).admit_async(template)
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
         """Make a request to the SeaTunnel API.
 
@@ -82,7 +271,19 @@ class SeaTunnelClient:
 
         Raises:
             httpx.HTTPStatusError: If the request fails.
+            UpstreamLimitExceeded: If a rate limit or bulkhead does not let
+                the request through in time.
+            RequestCancelled: If the caller cancelled the request.
         """
+        template = endpoint_template(endpoint)
+        cancellation.check()
+        if self.limits is None:
+            return self._send(method, endpoint, template, **kwargs)
+        with self.limits.limiter(self.base_url).admit(template):
+            return self._send(method, endpoint, template, **kwargs)
+
+    def _send(self, method: str, endpoint: str, template: str, **kwargs: Any) -> httpx.Response:
+        """Send a request to the SeaTunnel API and record its metrics."""
         url = f"{self.base_url}{endpoint}"
         headers = kwargs.pop("headers", {})
         
@@ -98,17 +299,43 @@ class SeaTunnelClient:
             if "Authorization" in self.headers:
                 headers["Authorization"] = self.headers["Authorization"]
 
+        in_flight = metrics.UPSTREAM_IN_FLIGHT.labels(template)
+        status = "error"
+        start = time.perf_counter()
+        in_flight.inc()
         try:
-            with httpx.Client() as client:
-                response = client.request(method, url, headers=headers, **kwargs)
-                response.raise_for_status()
-                return response
+            response = self._get_http_client().request(method, url, headers=headers, **kwargs)
+            status = str(response.status_code)
+            metrics.UPSTREAM_BYTES_SENT.labels(template).inc(
+                int(response.request.headers.get("Content-Length") or 0)
+            )
+            metrics.UPSTREAM_BYTES_RECEIVED.labels(template).inc(len(response.content))
+            response.raise_for_status()
+            return response
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e, extra=_log_fields(method, endpoint, template, status, start, kwargs))
             raise
         except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
+            scope = cancellation.current_scope()
+            if scope is not None and scope.cancelled:
+                # The socket was shut down under the request to abort it
+                status = "cancelled"
+                raise RequestCancelled("The request was cancelled by its caller") from e
+            logger.error("Request error: %s", e, extra=_log_fields(method, endpoint, template, status, start, kwargs))
+            raise
+        except RequestCancelled:
+            status = "cancelled"
             raise
+        finally:
+            in_flight.dec()
+            elapsed = time.perf_counter() - start
+            metrics.UPSTREAM_LATENCY.labels(method, template).observe(elapsed)
+            metrics.UPSTREAM_REQUESTS.labels(method, template, status).inc()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s %s -> %s in %.1f ms", method, endpoint, status, elapsed * 1000,
+                    extra=_log_fields(method, endpoint, template, status, start, kwargs),
+                )
 
     def submit_job(
         self,
@@ -207,12 +434,18 @@ class SeaTunnelClient:
         # If config_file is a string, assume it's a file path and open the file
         file_to_close = None
         try:
+            files: Dict[str, Any]
             if isinstance(config_file, str):
                 file_to_close = open(config_file, 'rb')
                 files = {'config_file': file_to_close}
             else:
                 # Assume it's already a file-like object
                 files = {'config_file': config_file}
+
+            # Report upload progress if the tool call asked for it
+            reporter = progress_reporter()
+            if reporter.enabled:
+                files = {'config_file': _UploadProgress(files['config_file'], reporter)}
             
             response = self._make_request(
                 "POST",
@@ -303,11 +536,11 @@ class SeaTunnelClient:
         response = self._make_request("GET", "/overview", params=params)
         return response.json()
 
-    def get_system_monitoring_information(self) -> Dict[str, Any]:
+    def get_system_monitoring_information(self) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Get system monitoring information.
 
         Returns:
-            Response from the API.
+            Response from the API, a record per cluster node.
         """
         response = self._make_request("GET", "/system-monitoring-information")
         return response.json() 
\ No newline at end of file
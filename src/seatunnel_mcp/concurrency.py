@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Helpers for running blocking SeaTunnel client calls concurrently."""
+
+import asyncio
+import contextlib
+from typing import Any, AsyncContextManager, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from . import cancellation
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+async def run_sync(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Run a blocking function in a worker thread.
+
+    Cancelling the call also cancels the SeaTunnel requests of the worker
+    thread: pending ones are not sent, and one in flight is aborted. A
+    ``SeaTunnelClient`` method first waits for its rate limits and bulkhead
+    on the event loop, so that no worker thread blocks on them.
+
+    Args:
+        func: Blocking callable, typically a ``SeaTunnelClient`` method.
+        *args: Positional arguments for the callable.
+        **kwargs: Keyword arguments for the callable.
+
+    Returns:
+        Return value of the callable.
+    """
+    async with _admission(func):
+        with cancellation.scope() as cancel_scope:
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            except asyncio.CancelledError:
+                cancel_scope.cancel()
+                raise
+
+
+def _admission(func: Callable[..., Any]) -> AsyncContextManager[None]:
+    """Admission of a bound client method by its client, or none for other callables."""
+    admit: Optional[Callable[[str], AsyncContextManager[None]]] = getattr(
+        getattr(func, "__self__", None), "admit_async", None
+    )
+    if admit is None:
+        return contextlib.nullcontext()
+    return admit(getattr(func, "__name__", ""))
+
+
+async def bounded_gather(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Any]:
+    """Apply an async function to every item with bounded fan-out.
+
+    Args:
+        func: Coroutine function applied to each item.
+        items: Items to process.
+        max_concurrency: Maximum number of calls in flight at once.
+
+    Returns:
+        Results in the order of ``items``. Exceptions raised by ``func`` are
+        returned in place of the result instead of being raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def guarded(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(guarded(item) for item in items), return_exceptions=True)
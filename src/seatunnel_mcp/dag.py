@@ -0,0 +1,314 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Analysis of job DAGs: per-vertex throughput, backpressure and bottlenecks."""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client import SeaTunnelAPI
+from .concurrency import run_sync
+
+# Parsed DAGs kept, least recently analyzed first out
+DEFAULT_MAX_GRAPHS = 256
+
+# Job-level metric, and its per-table breakdown, counting the records of each vertex type
+VERTEX_COUNTERS = {
+    "source": ("SourceReceivedCount", "TableSourceReceivedCount"),
+    "sink": ("SinkWriteCount", "TableSinkWriteCount"),
+}
+VERTEX_RATES = {
+    "source": ("SourceReceivedQPS", "TableSourceReceivedQPS"),
+    "sink": ("SinkWriteQPS", "TableSinkWriteQPS"),
+}
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class JobGraph:
+    """Indexed form of a job DAG.
+
+    Vertices are addressed by their position; ``upstream`` and ``downstream``
+    hold the positions of their neighbours. For every sink, the sources that
+    feed it and the transforms in between are resolved once at parse time.
+    """
+
+    __slots__ = (
+        "ids", "names", "types", "parallelism", "tables", "upstream", "downstream", "pipelines", "single", "feeds",
+    )
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.types: List[str] = []
+        self.parallelism: List[int] = []
+        self.tables: List[Tuple[str, ...]] = []
+        self.upstream: List[List[int]] = []
+        self.downstream: List[List[int]] = []
+        self.pipelines = 0
+        # Vertex types with a single vertex, which the job-level metrics describe
+        self.single: frozenset = frozenset()
+        # Sink position -> (source positions, transform positions in between)
+        self.feeds: Dict[int, Tuple[Tuple[int, ...], Tuple[int, ...]]] = {}
+
+    def vertex_values(self, metrics: Dict[str, Any], names: Dict[str, Tuple[str, str]]) -> List[float]:
+        """Get a value per vertex from the job metrics, NaN where it is unknown.
+
+        A vertex takes the sum of its tables from the per-table breakdown, or
+        the job-level value if it is the only vertex of its type.
+        """
+        values = []
+        for position, kind in enumerate(self.types):
+            value = math.nan
+            if kind in names:
+                total, per_table = names[kind]
+                breakdown = metrics.get(per_table)
+                if isinstance(breakdown, dict) and any(table in breakdown for table in self.tables[position]):
+                    value = sum(_number(breakdown.get(table, 0)) for table in self.tables[position])
+                elif kind in self.single:
+                    value = _number(metrics.get(total))
+            values.append(value)
+        return values
+
+
+def parse_job_dag(dag: Dict[str, Any]) -> JobGraph:
+    """Parse the ``jobDag`` of a job info payload into a :class:`JobGraph`.
+
+    ``vertexInfoMap`` may be a list of vertices or a mapping keyed by vertex
+    ID; ``pipelineEdges`` maps each pipeline to its edges.
+
+    Raises:
+        ValueError: If the DAG has no vertices.
+    """
+    vertices = dag.get("vertexInfoMap") if isinstance(dag, dict) else None
+    if isinstance(vertices, dict):
+        vertices = [dict(vertex, vertexId=vertex.get("vertexId", key)) for key, vertex in vertices.items()]
+    if not isinstance(vertices, list) or not vertices:
+        raise ValueError("The job has no DAG to analyze")
+
+    graph = JobGraph()
+    index: Dict[str, int] = {}
+    for vertex in vertices:
+        if not isinstance(vertex, dict):
+            continue
+        index[str(vertex.get("vertexId"))] = len(graph.ids)
+        graph.ids.append(str(vertex.get("vertexId")))
+        graph.names.append(str(vertex.get("vertexName", "")))
+        graph.types.append(str(vertex.get("type", "")).lower())
+        parallelism = _number(vertex.get("parallelism"))
+        graph.parallelism.append(int(parallelism) if parallelism >= 1 else 1)
+        graph.tables.append(tuple(str(table) for table in vertex.get("tablePaths") or ()))
+        graph.upstream.append([])
+        graph.downstream.append([])
+
+    pipelines = dag.get("pipelineEdges") or {}
+    graph.pipelines = len(pipelines)
+    for edges in pipelines.values():
+        for edge in edges or ():
+            source = index.get(str(edge.get("inputVertexId")))
+            target = index.get(str(edge.get("targetVertexId")))
+            # Edges to vertices missing from the map cannot be analyzed
+            if source is None or target is None or target in graph.downstream[source]:
+                continue
+            graph.downstream[source].append(target)
+            graph.upstream[target].append(source)
+
+    graph.single = frozenset(kind for kind in graph.types if graph.types.count(kind) == 1)
+    for position, kind in enumerate(graph.types):
+        if kind != "sink":
+            continue
+        sources, through, seen = set(), set(), {position}
+        stack = list(graph.upstream[position])
+        while stack:
+            vertex = stack.pop()
+            if vertex in seen:
+                continue
+            seen.add(vertex)
+            if graph.types[vertex] == "source":
+                sources.add(vertex)
+            else:
+                through.add(vertex)
+            stack.extend(graph.upstream[vertex])
+        graph.feeds[position] = (tuple(sorted(sources)), tuple(sorted(through)))
+    return graph
+
+
+class _Sample:
+    __slots__ = ("graph", "created", "time", "counts", "gaps")
+
+    def __init__(self, graph: JobGraph, created: Any):
+        self.graph = graph
+        self.created = created
+        self.time = 0.0
+        self.counts: Optional[List[float]] = None
+        self.gaps: Dict[int, float] = {}
+
+
+class DagAnalyzer:
+    """Analyze job DAGs against their current metrics.
+
+    The DAG of a job never changes while it exists, so it is parsed once and
+    cached per cluster and job; later analyses only apply fresh metrics. A
+    job resubmitted under the same ID gets a new create time and is parsed
+    again. The previous counters of each job are kept to measure rates.
+    """
+
+    def __init__(self, max_graphs: int = DEFAULT_MAX_GRAPHS):
+        """Initialize the analyzer.
+
+        Args:
+            max_graphs: Number of parsed DAGs to keep.
+        """
+        self.max_graphs = max_graphs
+        self.now = time.monotonic
+        self._samples: "OrderedDict[Tuple[str, str], _Sample]" = OrderedDict()
+
+    def analyze(self, cluster: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze a job from its ``/job-info`` payload.
+
+        Args:
+            cluster: Key of the cluster the job belongs to, e.g. its URL.
+            info: Job info including ``jobDag`` and ``metrics``.
+
+        Returns:
+            The vertices with their counts and rates, the backpressure hints
+            and the bottleneck vertex.
+        """
+        key = (cluster, str(info.get("jobId")))
+        sample = self._samples.get(key)
+        if sample is None or sample.created != info.get("createTime"):
+            sample = _Sample(parse_job_dag(info.get("jobDag") or {}), info.get("createTime"))
+            self._samples[key] = sample
+        self._samples.move_to_end(key)
+        while len(self._samples) > self.max_graphs:
+            self._samples.popitem(last=False)
+
+        graph = sample.graph
+        metrics: Dict[str, Any] = info["metrics"] if isinstance(info.get("metrics"), dict) else {}
+        now = self.now()
+        counts = graph.vertex_values(metrics, VERTEX_COUNTERS)
+        elapsed = now - sample.time
+        previous = sample.counts if sample.counts is not None and elapsed > 0 else None
+        if previous is not None:
+            # Counters going backwards mean a restart, which gives no rate
+            rates = [
+                (count - last) / elapsed if count >= last else math.nan
+                for count, last in zip(counts, previous)
+            ]
+        else:
+            rates = graph.vertex_values(metrics, VERTEX_RATES)
+
+        vertices = []
+        for position, vertex_id in enumerate(graph.ids):
+            vertex: Dict[str, Any] = {
+                "vertexId": vertex_id,
+                "name": graph.names[position],
+                "type": graph.types[position],
+                "parallelism": graph.parallelism[position],
+                "upstream": [graph.ids[up] for up in graph.upstream[position]],
+            }
+            if not math.isnan(counts[position]):
+                vertex["count"] = counts[position]
+            if not math.isnan(rates[position]):
+                vertex["records_per_second"] = round(rates[position], 3)
+            vertices.append(vertex)
+
+        backpressure = []
+        gaps: Dict[int, float] = {}
+        for sink, (sources, through) in graph.feeds.items():
+            gap = sum(counts[source] for source in sources) - counts[sink] if sources else math.nan
+            if math.isnan(gap):
+                continue
+            gaps[sink] = gap
+            last_gap = sample.gaps.get(sink)
+            growth = (gap - last_gap) / elapsed if previous is not None and last_gap is not None else math.nan
+            if gap > 0:
+                hint: Dict[str, Any] = {
+                    "sink": graph.ids[sink],
+                    "sources": [graph.ids[source] for source in sources],
+                    "through": [graph.ids[vertex] for vertex in through],
+                    "gap": gap,
+                }
+                if not math.isnan(growth):
+                    hint["gap_per_second"] = round(growth, 3)
+                backpressure.append(hint)
+
+        sample.time, sample.counts, sample.gaps = now, counts, gaps
+        result: Dict[str, Any] = {
+            "jobId": info.get("jobId"),
+            "jobName": info.get("jobName"),
+            "jobStatus": info.get("jobStatus"),
+            "pipelines": graph.pipelines,
+            "vertices": vertices,
+            "backpressure": backpressure,
+            "bottleneck": self._bottleneck(graph, rates, backpressure),
+        }
+        if previous is None:
+            result["note"] = "Rates are measured between calls; call again to see whether gaps grow"
+        return result
+
+    @staticmethod
+    def _bottleneck(graph: JobGraph, rates: List[float], backpressure: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Find the vertex most likely limiting the job.
+
+        Records piling up in front of a sink point at the sink or a transform
+        feeding it; the fastest growing gap wins. Without a growing gap, the
+        vertex with the lowest rate per parallel instance limits the job.
+        """
+        growing = [hint for hint in backpressure if hint.get("gap_per_second", 0) > 0]
+        if growing:
+            worst = max(growing, key=lambda hint: hint["gap_per_second"])
+            position = graph.ids.index(worst["sink"])
+            return {
+                "vertexId": worst["sink"],
+                "name": graph.names[position],
+                "reason": (
+                    f"Records pile up in front of it at {worst['gap_per_second']:g}/s"
+                    + (f"; the transforms {', '.join(worst['through'])} in between may be slow too"
+                       if worst["through"] else "")
+                ),
+            }
+        measured = [
+            (rate / graph.parallelism[position], position)
+            for position, rate in enumerate(rates) if not math.isnan(rate)
+        ]
+        if not measured:
+            return None
+        rate, position = min(measured)
+        return {
+            "vertexId": graph.ids[position],
+            "name": graph.names[position],
+            "reason": f"Lowest throughput per parallel instance ({rate:g} records/s)",
+        }
+
+
+async def analyze_job_dag(client: SeaTunnelAPI, analyzer: DagAnalyzer, job_id: str) -> Dict[str, Any]:
+    """Fetch a job and analyze its DAG.
+
+    Raises:
+        ValueError: If the job does not exist or has no DAG.
+    """
+    info = await run_sync(client.get_job_info, job_id)
+    if not isinstance(info, dict) or not info.get("jobDag"):
+        raise ValueError(f"Job {job_id} was not found or has no DAG")
+    return analyzer.analyze(client.base_url, info)
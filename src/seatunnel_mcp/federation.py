@@ -0,0 +1,232 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Federated views over several SeaTunnel clusters.
+
+Each cluster is a connection profile of the registry. Listings are fetched
+from all clusters concurrently and merged, with every job tagged by its
+cluster; clusters that fail or miss the deadline are reported next to the
+partial result. Job-specific calls are routed to the cluster that owns the
+job, known from earlier listings or found by asking every cluster.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .concurrency import run_sync
+from .jobs import job_list
+from .profiles import ClientRegistry
+
+DEFAULT_DEADLINE = 10.0
+DEFAULT_MAX_KNOWN_JOBS = 100_000
+
+# Overview fields that describe a cluster rather than count something
+_OVERVIEW_LABELS = frozenset({"projectVersion", "gitCommitAbbrev"})
+
+
+def _merge_overviews(overviews: Dict[str, Any]) -> Dict[str, Any]:
+    """Sum the numeric fields of the cluster overviews."""
+    totals: Dict[str, Any] = {}
+    for overview in overviews.values():
+        if not isinstance(overview, dict):
+            continue
+        for key, value in overview.items():
+            if key in _OVERVIEW_LABELS:
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+            totals[key] = totals.get(key, 0) + (int(number) if number.is_integer() else number)
+    return totals
+
+
+class Federation:
+    """Concurrent fan-out of SeaTunnel calls over several connection profiles."""
+
+    def __init__(
+        self,
+        registry: ClientRegistry,
+        clusters: Iterable[str],
+        deadline: float = DEFAULT_DEADLINE,
+        max_known_jobs: int = DEFAULT_MAX_KNOWN_JOBS,
+    ):
+        """Initialize the federation.
+
+        Args:
+            registry: Client registry holding a profile per cluster.
+            clusters: Names of the federated profiles.
+            deadline: Seconds to wait for the clusters of a fan-out; slower
+                ones are left out of the result.
+            max_known_jobs: Number of jobs whose owning cluster is remembered.
+
+        Raises:
+            ValueError: If no cluster is given or one is not a known profile.
+        """
+        known = {profile["name"] for profile in registry.list_profiles()}
+        self.clusters = list(dict.fromkeys(clusters))
+        if not self.clusters:
+            raise ValueError("A federation needs at least one cluster")
+        unknown = [name for name in self.clusters if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown connection profiles in the federation: {', '.join(unknown)}")
+        self.registry = registry
+        self.deadline = deadline
+        self.max_known_jobs = max_known_jobs
+        self._owners: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def owner(self, job_id: Any) -> Optional[str]:
+        """Get the cluster last seen owning a job, if any."""
+        with self._lock:
+            return self._owners.get(str(job_id))
+
+    def _remember(self, cluster: str, jobs: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            for job in jobs:
+                job_id = str(job.get("jobId"))
+                self._owners[job_id] = cluster
+                self._owners.move_to_end(job_id)
+            while len(self._owners) > self.max_known_jobs:
+                self._owners.popitem(last=False)
+
+    async def fan_out(
+        self, method: str, *args: Any, clusters: Optional[List[str]] = None, **kwargs: Any
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Call a client method on every cluster concurrently, within the deadline.
+
+        Calls still running at the deadline are abandoned; their worker
+        threads finish within the client timeout, but their results are
+        dropped.
+
+        Args:
+            method: ``SeaTunnelClient`` method name.
+            *args: Positional arguments of the method.
+            clusters: Clusters to call; all of them by default.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            The results by cluster, and the errors by cluster of the clusters
+            that failed or timed out.
+        """
+        tasks = self._start(method, clusters or self.clusters, *args, **kwargs)
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for task in pending:
+            task.cancel()
+            errors[tasks[task]] = f"No response within {self.deadline:g}s"
+        for task in done:
+            if task.exception() is not None:
+                errors[tasks[task]] = str(task.exception())
+            else:
+                results[tasks[task]] = task.result()
+        return results, errors
+
+    def _start(self, method: str, clusters: List[str], *args: Any, **kwargs: Any) -> Dict["asyncio.Future[Any]", str]:
+        """Start a client method call on each cluster, returning the clusters by call."""
+        return {
+            asyncio.ensure_future(run_sync(getattr(self.registry.get_client(name), method), *args, **kwargs)): name
+            for name in clusters
+        }
+
+    @staticmethod
+    def _report(view: Dict[str, Any], results: Dict[str, Any], errors: Dict[str, str]) -> Dict[str, Any]:
+        view["clusters"] = sorted(results)
+        if errors:
+            view["errors"] = dict(sorted(errors.items()))
+        return view
+
+    async def overview(self) -> Dict[str, Any]:
+        """Get the overview of every cluster, and their totals."""
+        results, errors = await self.fan_out("get_overview")
+        return self._report(
+            {"totals": _merge_overviews(results), "overviews": dict(sorted(results.items()))}, results, errors
+        )
+
+    async def _jobs(self, method: str, *args: Any) -> Dict[str, Any]:
+        results, errors = await self.fan_out(method, *args)
+        merged: List[Dict[str, Any]] = []
+        for cluster in self.clusters:
+            if cluster not in results:
+                continue
+            jobs = job_list(results[cluster])
+            self._remember(cluster, jobs)
+            merged.extend({**job, "cluster": cluster} for job in jobs)
+        return self._report({"jobs": merged}, results, errors)
+
+    async def running_jobs(self) -> Dict[str, Any]:
+        """Get the running jobs of every cluster, tagged by cluster."""
+        return await self._jobs("get_running_jobs")
+
+    async def finished_jobs(self, state: str) -> Dict[str, Any]:
+        """Get the finished jobs in a state of every cluster, tagged by cluster."""
+        return await self._jobs("get_finished_jobs", state)
+
+    async def locate(self, job_id: Any) -> str:
+        """Find the cluster owning a job.
+
+        Jobs seen in earlier listings are routed directly; others are looked
+        up on every cluster concurrently, and the first cluster that knows
+        the job wins, without waiting for the others.
+
+        Raises:
+            ValueError: If no cluster knows the job within the deadline.
+        """
+        cluster = self.owner(job_id)
+        if cluster is not None:
+            return cluster
+        tasks = self._start("get_job_info", self.clusters, job_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        pending = set(tasks)
+        try:
+            while pending and loop.time() < deadline:
+                done, pending = await asyncio.wait(
+                    pending, timeout=deadline - loop.time(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    info = task.result()
+                    if isinstance(info, dict) and info.get("jobId") is not None:
+                        self._remember(tasks[task], [info])
+                        return tasks[task]
+        finally:
+            for task in pending:
+                task.cancel()
+        raise ValueError(f"Job {job_id} was not found on any of the clusters {', '.join(self.clusters)}")
+
+    async def call_owner(self, method: str, job_id: Any, cluster: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
+        """Call a job-specific client method on the cluster owning the job.
+
+        Args:
+            method: ``SeaTunnelClient`` method taking ``jobId``.
+            job_id: Job ID.
+            cluster: Owning cluster, if known; located otherwise.
+            **kwargs: Further keyword arguments of the method.
+
+        Returns:
+            The result, tagged with the cluster.
+        """
+        if cluster is None:
+            cluster = await self.locate(job_id)
+        elif cluster not in self.clusters:
+            raise ValueError(f"Unknown cluster: {cluster}")
+        result = await run_sync(getattr(self.registry.get_client(cluster), method), jobId=job_id, **kwargs)
+        return {**result, "cluster": cluster} if isinstance(result, dict) else {"result": result, "cluster": cluster}
@@ -0,0 +1,73 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Helpers for working with SeaTunnel job payloads."""
+
+import math
+from typing import Any, Dict, List
+
+# Job states after which a job will not make any further progress.
+TERMINAL_STATES = frozenset(
+    {"FINISHED", "CANCELED", "FAILED", "SAVEPOINT_DONE", "UNKNOWABLE"}
+)
+
+# States accepted by the /finished-jobs/{state} endpoint.
+FINISHED_STATES = ("FINISHED", "CANCELED", "FAILED", "UNKNOWABLE")
+
+
+def job_list(payload: Any) -> List[Dict[str, Any]]:
+    """Normalize a job listing response into a list of job dicts.
+
+    The REST API returns a bare list for job listings, but older versions and
+    some proxies wrap it in an object (e.g. ``{"jobs": [...]}``).
+
+    Args:
+        payload: Decoded JSON response of a job listing endpoint.
+
+    Returns:
+        List of job dicts. Non-dict entries are skipped.
+    """
+    if isinstance(payload, dict):
+        for key in ("jobs", "data", "result"):
+            if isinstance(payload.get(key), list):
+                payload = payload[key]
+                break
+        else:
+            return [payload] if "jobId" in payload else []
+    if not isinstance(payload, list):
+        return []
+    return [job for job in payload if isinstance(job, dict)]
+
+
+def job_status(job: Dict[str, Any]) -> str:
+    """Get the upper-cased status of a job dict, or an empty string if unknown."""
+    return str(job.get("jobStatus") or job.get("status") or "").upper()
+
+
+def job_metric(job: Dict[str, Any], name: str) -> float:
+    """Get a job metric as a number, or NaN if it is missing or not numeric.
+
+    The REST API reports metrics as strings, e.g. ``{"SourceReceivedCount": "42"}``.
+    NaN makes every comparison false, so jobs without the metric never match.
+    """
+    metrics = job.get("metrics")
+    value = metrics.get(name) if isinstance(metrics, dict) else None
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
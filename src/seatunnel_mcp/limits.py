@@ -0,0 +1,411 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Rate limits and concurrency bulkheads for requests to the SeaTunnel REST API.
+
+Every upstream (base URL) gets a token bucket for all of its requests, and
+optionally one per endpoint or endpoint class. Bulkheads cap the concurrent
+requests of each endpoint class, so that expensive listings cannot take all
+the connections that cheap lookups and submissions need. A request waits at
+most ``max_wait`` seconds for its tokens and bulkhead slot, then fails with
+:class:`UpstreamLimitExceeded`.
+
+Calls made through :func:`~.concurrency.run_sync` wait on the event loop
+with :meth:`UpstreamLimiter.admit_async` before they take a worker thread,
+so that calls queued behind a full bulkhead do not occupy the threads that
+the calls of other classes need.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional
+
+from . import cancellation, metrics
+
+DEFAULT_MAX_WAIT = 10.0
+
+# Endpoint classes sharing a bulkhead; other endpoints belong to "default"
+ENDPOINT_CLASSES = {
+    "/finished-jobs/{state}": "expensive",
+    "/system-monitoring-information": "expensive",
+    "/submit-job": "submit",
+    "/submit-jobs": "submit",
+    "/submit-job/upload": "submit",
+    "/stop-job": "submit",
+}
+DEFAULT_CLASS = "default"
+
+
+class UpstreamLimitExceeded(RuntimeError):
+    """Raised when a request cannot pass a rate limit or bulkhead in time."""
+
+
+def endpoint_class(template: str) -> str:
+    """Get the bulkhead class of an endpoint template."""
+    return ENDPOINT_CLASSES.get(template, DEFAULT_CLASS)
+
+
+def parse_limits(spec: str, integer: bool = False) -> Dict[str, float]:
+    """Parse limits given as ``key=value,...``, e.g. ``expensive=2,/job-info/{jobId}=50``.
+
+    Args:
+        spec: Comma-separated limits.
+        integer: Whether the values must be whole numbers, as for bulkheads.
+
+    Raises:
+        ValueError: If an entry is malformed or its value is not positive.
+    """
+    expected = "positive integer" if integer else "positive number"
+    limits: Dict[str, float] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        key, separator, value = entry.partition("=")
+        try:
+            limit = float(value)
+        except ValueError:
+            limit = 0.0
+        if not separator or not key.strip() or limit <= 0 or (integer and not limit.is_integer()):
+            raise ValueError(f"Invalid limit {entry!r}, expected key={expected}")
+        limits[key.strip()] = limit
+    return limits
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Initialize the bucket, full.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Capacity of the bucket; ``rate`` (but at least 1) by default.
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.now = time.monotonic
+        self._tokens = self.burst
+        self._last = self.now()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """Take a token, possibly one that is only available in the future.
+
+        Args:
+            max_wait: Longest acceptable wait for the token, in seconds.
+
+        Returns:
+            Seconds to wait before using the token, or None if that would
+            exceed ``max_wait``; no token is taken then.
+        """
+        with self._lock:
+            now = self.now()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            wait = max(0.0, (1.0 - self._tokens) / self.rate)
+            if wait > max_wait:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+    def refund(self) -> None:
+        """Give back a token taken for a request that was not sent."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1.0)
+
+
+# Set while a call admitted on the event loop runs in its worker thread
+_admitted: contextvars.ContextVar[bool] = contextvars.ContextVar("upstream_admitted", default=False)
+
+
+class _Waiter:
+    """Thread or coroutine waiting for a bulkhead slot."""
+
+    __slots__ = ("granted", "wake")
+
+    def __init__(self, wake: Callable[[], bool]):
+        self.granted = False
+        # Wakes the waiter up, returning False if it gave up already
+        self.wake = wake
+
+
+class Bulkhead:
+    """Semaphore that threads and coroutines can wait on alike, in FIFO order.
+
+    Coroutines wait without blocking their event loop; a released slot is
+    handed directly to the longest waiting thread or coroutine.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._free = limit
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    def _take_free(self) -> bool:
+        # Slots go to the waiters first
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return True
+        return False
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free, without waiting."""
+        with self._lock:
+            return self._take_free()
+
+    def acquire(self, timeout: float) -> bool:
+        """Take a slot, blocking the thread for at most ``timeout`` seconds."""
+        event = threading.Event()
+
+        def wake() -> bool:
+            event.set()
+            return True
+
+        with self._lock:
+            if self._take_free():
+                return True
+            waiter = _Waiter(wake)
+            self._waiters.append(waiter)
+        event.wait(timeout)
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    async def acquire_async(self, timeout: float) -> bool:
+        """Take a slot, waiting on the event loop for at most ``timeout`` seconds."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def resolve() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def wake() -> bool:
+            if future.done():
+                return False
+            loop.call_soon_threadsafe(resolve)
+            return True
+
+        with self._lock:
+            if self._take_free():
+                return True
+            waiter = _Waiter(wake)
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            with self._lock:
+                if waiter.granted:
+                    return True
+                self._waiters.remove(waiter)
+                return False
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot, handing it to the first waiter still waiting."""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if waiter.wake():
+                    waiter.granted = True
+                    return
+            self._free = min(self.limit, self._free + 1)
+
+
+class UpstreamLimiter:
+    """Rate limits and bulkheads of a single upstream."""
+
+    def __init__(
+        self,
+        upstream: str,
+        rate: Optional[float],
+        burst: Optional[float],
+        endpoint_rates: Dict[str, float],
+        bulkheads: Dict[str, int],
+        max_wait: float,
+    ):
+        self.upstream = upstream
+        self.max_wait = max_wait
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.endpoint_buckets = {key: TokenBucket(limit) for key, limit in endpoint_rates.items()}
+        self.bulkheads = {key: Bulkhead(int(limit)) for key, limit in bulkheads.items()}
+
+    def _reserve(self, bucket: TokenBucket, template: str, limit: str, deadline: float) -> float:
+        wait = bucket.reserve(max(0.0, deadline - time.monotonic()))
+        if wait is None:
+            metrics.UPSTREAM_THROTTLED.labels(template, limit, "rejected").inc()
+            raise UpstreamLimitExceeded(
+                f"Rate limit of {bucket.rate:g} requests/s for {limit} of {self.upstream} exceeded"
+            )
+        if wait > 0:
+            metrics.UPSTREAM_THROTTLED.labels(template, limit, "delayed").inc()
+        return wait
+
+    def _reserve_tokens(self, template: str, deadline: float) -> float:
+        """Take the tokens of a request and return how long to wait before using them.
+
+        A request rejected by one of its limits takes no tokens from the others.
+        """
+        buckets = []
+        for key in (template, endpoint_class(template)):
+            if key in self.endpoint_buckets:
+                buckets.append((key, self.endpoint_buckets[key]))
+                break
+        if self.bucket is not None:
+            buckets.append(("upstream", self.bucket))
+        wait = 0.0
+        taken: List[TokenBucket] = []
+        try:
+            for limit, bucket in buckets:
+                wait = max(wait, self._reserve(bucket, template, limit, deadline))
+                taken.append(bucket)
+        except UpstreamLimitExceeded:
+            for bucket in taken:
+                bucket.refund()
+            raise
+        return wait
+
+    def _bulkhead_full(self, template: str, kind: str) -> UpstreamLimitExceeded:
+        metrics.UPSTREAM_THROTTLED.labels(template, kind, "rejected").inc()
+        return UpstreamLimitExceeded(
+            f"Too many concurrent {kind} requests to {self.upstream}; none finished within {self.max_wait:g}s"
+        )
+
+    @contextlib.contextmanager
+    def admit(self, template: str) -> Iterator[None]:
+        """Wait for the rate limits and bulkhead of an endpoint, and hold its bulkhead slot.
+
+        A no-op in the worker thread of a call admitted with :meth:`admit_async`.
+
+        Raises:
+            UpstreamLimitExceeded: If the request cannot pass within ``max_wait``.
+        """
+        if _admitted.get():
+            yield
+            return
+        deadline = time.monotonic() + self.max_wait
+        wait = self._reserve_tokens(template, deadline)
+        if wait > 0:
+            cancellation.sleep(wait)
+        kind = endpoint_class(template)
+        bulkhead = self.bulkheads.get(kind)
+        if bulkhead is None:
+            yield
+            return
+        if not bulkhead.try_acquire():
+            metrics.UPSTREAM_THROTTLED.labels(template, kind, "delayed").inc()
+            if not bulkhead.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                raise self._bulkhead_full(template, kind)
+        try:
+            # The caller may have given up while the request waited for its slot
+            cancellation.check()
+            yield
+        finally:
+            bulkhead.release()
+
+    @contextlib.asynccontextmanager
+    async def admit_async(self, template: str) -> AsyncIterator[None]:
+        """Wait on the event loop for the rate limits and bulkhead of an endpoint.
+
+        The block, and the worker threads it starts, hold the bulkhead slot
+        and pass :meth:`admit` without waiting again.
+
+        Raises:
+            UpstreamLimitExceeded: If the request cannot pass within ``max_wait``.
+        """
+        deadline = time.monotonic() + self.max_wait
+        wait = self._reserve_tokens(template, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        kind = endpoint_class(template)
+        bulkhead = self.bulkheads.get(kind)
+        if bulkhead is not None and not bulkhead.try_acquire():
+            metrics.UPSTREAM_THROTTLED.labels(template, kind, "delayed").inc()
+            if not await bulkhead.acquire_async(timeout=max(0.0, deadline - time.monotonic())):
+                raise self._bulkhead_full(template, kind)
+        token = _admitted.set(True)
+        try:
+            yield
+        finally:
+            _admitted.reset(token)
+            if bulkhead is not None:
+                bulkhead.release()
+
+
+class UpstreamLimits:
+    """Limits applied to every upstream, each with its own buckets and bulkheads."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoint_rates: Optional[Dict[str, float]] = None,
+        bulkheads: Optional[Dict[str, float]] = None,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ):
+        """Initialize the limits.
+
+        Args:
+            rate: Requests per second to an upstream, or None for no limit.
+            burst: Requests an upstream may receive at once above the rate.
+            endpoint_rates: Requests per second by endpoint template (e.g.
+                ``/job-info/{jobId}``) or endpoint class (``expensive``,
+                ``submit`` or ``default``).
+            bulkheads: Concurrent requests by endpoint class.
+            max_wait: Longest wait of a request for the limits, in seconds.
+
+        Raises:
+            ValueError: If a bulkhead names an unknown endpoint class or does
+                not allow a whole number of at least one request.
+        """
+        unknown = set(bulkheads or ()) - set(ENDPOINT_CLASSES.values()) - {DEFAULT_CLASS}
+        if unknown:
+            raise ValueError(f"Unknown endpoint classes for bulkheads: {', '.join(sorted(unknown))}")
+        invalid = [key for key, limit in (bulkheads or {}).items() if limit < 1 or limit != int(limit)]
+        if invalid:
+            raise ValueError(f"Bulkheads must be positive integers: {', '.join(sorted(invalid))}")
+        self.rate = rate
+        self.burst = burst
+        self.endpoint_rates = dict(endpoint_rates or {})
+        self.bulkheads = {key: int(limit) for key, limit in (bulkheads or {}).items()}
+        self.max_wait = max_wait
+        self._limiters: Dict[str, UpstreamLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, upstream: str) -> UpstreamLimiter:
+        """Get the limiter of an upstream, creating it on first use."""
+        limiter = self._limiters.get(upstream)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(upstream)
+                if limiter is None:
+                    limiter = self._limiters[upstream] = UpstreamLimiter(
+                        upstream, self.rate, self.burst, self.endpoint_rates, self.bulkheads, self.max_wait,
+                    )
+        return limiter
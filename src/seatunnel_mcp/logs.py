@@ -0,0 +1,195 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Logging pipeline of the SeaTunnel MCP server.
+
+Loggers only enqueue their records; a listener thread formats them and
+writes them out, so log I/O never runs on the event loop thread. Records can
+be rendered as text or as one JSON object per line, and high-volume debug
+records can be sampled per logger before they are even enqueued.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple, Union
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_FORMATS = ("text", "json")
+
+# Fields passed through ``extra`` that the JSON format emits as top-level keys
+STRUCTURED_FIELDS = ("tool", "endpoint", "method", "status", "latency_ms", "jobId", "profile")
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only 1 in N records at or below a level, per logger.
+
+    A rate configured for a logger also applies to its children, e.g.
+    ``seatunnel_mcp`` covers ``seatunnel_mcp.client``; the most specific one
+    wins. Records above the level are always kept.
+    """
+
+    def __init__(self, rates: Dict[str, int], level: int = logging.DEBUG):
+        """Initialize the filter.
+
+        Args:
+            rates: Keep one in this many records, by logger name.
+            level: Highest level that is sampled.
+        """
+        super().__init__()
+        self.rates = rates
+        self.level = level
+        self._samplers: Dict[str, Optional[Tuple[Iterator[int], int]]] = {}
+
+    def _sampler(self, name: str) -> Optional[Tuple[Iterator[int], int]]:
+        parts = name.split(".")
+        for end in range(len(parts), 0, -1):
+            every = self.rates.get(".".join(parts[:end]))
+            if every is not None:
+                return (itertools.count(), every) if every > 1 else None
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        try:
+            sampler = self._samplers[record.name]
+        except KeyError:
+            sampler = self._samplers.setdefault(record.name, self._sampler(record.name))
+        if sampler is None:
+            return True
+        # next() on itertools.count is atomic, so this needs no lock
+        counter, every = sampler
+        return next(counter) % every == 0
+
+
+class _QueueHandler(QueueHandler):
+    """Enqueue records as they are.
+
+    ``QueueHandler.prepare`` formats the message so that records can cross
+    process boundaries; the listener runs in the same process, so that work
+    is left to its thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_sampling(spec: str) -> Dict[str, int]:
+    """Parse per-logger sampling rates such as ``seatunnel_mcp.client=100,httpx=10``.
+
+    Returns:
+        Keep one in this many debug records, by logger name.
+
+    Raises:
+        ValueError: If the specification is malformed.
+    """
+    rates: Dict[str, int] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, sep, every = part.strip().partition("=")
+        if not name or not sep or not every.strip().isdigit() or int(every) < 1:
+            raise ValueError(f"Invalid log sampling entry {part!r}, expected logger=N with N >= 1")
+        rates[name.strip()] = int(every)
+    return rates
+
+
+def configure_logging(
+    level: Union[int, str] = logging.INFO,
+    log_format: str = "text",
+    sampling: Optional[Dict[str, int]] = None,
+    stream: Optional[TextIO] = None,
+) -> QueueListener:
+    """Route all logging through a queue to a listener thread.
+
+    Replaces the handlers of the root logger, and of a previous call.
+
+    Args:
+        level: Level of the root logger.
+        log_format: ``text`` or ``json``.
+        sampling: Keep one in this many debug records, by logger name.
+        stream: Where to write the records (default: stderr).
+
+    Returns:
+        The started listener.
+    """
+    global _listener
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Invalid log format: {log_format} (expected one of {', '.join(LOG_FORMATS)})")
+    if isinstance(level, str):
+        level = level.upper()
+
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(DEFAULT_FORMAT))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    # Swap listeners only once the new one gets the records, so none are lost
+    stop_logging()
+    _listener = listener
+    return listener
+
+
+def stop_logging() -> None:
+    """Stop the listener, writing out the records still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def is_configured() -> bool:
+    """Whether ``configure_logging`` has been called in this process."""
+    return _listener is not None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,368 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Prometheus metrics for tool calls and upstream SeaTunnel requests.
+
+Metrics are rendered in the Prometheus text exposition format. The hot path
+is kept cheap: label sets are resolved once into children that are cached by
+the caller, and each counter holds a plain integer behind its own lock, so
+calls only contend on the series they update.
+"""
+
+import bisect
+import functools
+import logging
+import re
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class _Counter:
+    """Monotonic integer counter, safe to increment from any thread."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        if amount > 0:
+            with self._lock:
+                self._value += amount
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+
+class _Gauge:
+    """Gauge holding a value that can go up and down."""
+
+    __slots__ = ("_up", "_down")
+
+    def __init__(self) -> None:
+        self._up = _Counter()
+        self._down = _Counter()
+
+    def inc(self) -> None:
+        self._up.inc()
+
+    def dec(self) -> None:
+        self._down.inc()
+
+    @property
+    def value(self) -> int:
+        return self._up.value - self._down.value
+
+
+class _Histogram:
+    """Histogram with fixed buckets."""
+
+    __slots__ = ("_upper_bounds", "_buckets", "_sum", "_lock")
+
+    def __init__(self, upper_bounds: Sequence[float]) -> None:
+        self._upper_bounds = upper_bounds
+        self._buckets = [_Counter() for _ in range(len(upper_bounds) + 1)]
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        self._buckets[bisect.bisect_left(self._upper_bounds, value)].inc()
+        with self._lock:
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        return [bucket.value for bucket in self._buckets], self._sum
+
+
+class _Metric:
+    """Metric family with a fixed set of label names."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any) -> Any:
+        """Get the child for a label set, creating it on first use.
+
+        Callers on hot paths should resolve the child once and keep it.
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self, key: Tuple[str, ...], child: Any) -> Iterable[str]:
+        yield f"{self.name}{_format_labels(self.labelnames, key)} {child.value}"
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for key, child in list(self._children.items()):
+            yield from self._samples(key, child)
+
+
+class Counter(_Metric):
+    """Counter metric family."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _Counter:
+        return _Counter()
+
+
+class Gauge(_Metric):
+    """Gauge metric family."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _Gauge:
+        return _Gauge()
+
+
+class Histogram(_Metric):
+    """Histogram metric family."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _Histogram:
+        return _Histogram(self.buckets)
+
+    def _samples(self, key: Tuple[str, ...], child: Any) -> Iterable[str]:
+        counts, total = child.snapshot()
+        names = self.labelnames + ("le",)
+        cumulative = 0
+        for upper_bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if upper_bound == float("inf") else repr(float(upper_bound))
+            yield f"{self.name}_bucket{_format_labels(names, key + (le,))} {cumulative}"
+        labels = _format_labels(self.labelnames, key)
+        yield f"{self.name}_sum{labels} {total}"
+        yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metric families and scrape-time callbacks."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._callbacks: List[Callable[[], Iterable[str]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Register a metric family."""
+        self._metrics.append(metric)
+        return metric
+
+    def register_callback(self, callback: Callable[[], Iterable[str]]) -> None:
+        """Register a function yielding exposition lines computed at scrape time."""
+        self._callbacks.append(callback)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for callback in self._callbacks:
+            lines.extend(callback())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.register(Counter(
+    "seatunnel_mcp_tool_calls_total", "Number of tool calls.", ("tool",)))
+TOOL_ERRORS = REGISTRY.register(Counter(
+    "seatunnel_mcp_tool_errors_total", "Number of tool calls that raised an error.", ("tool",)))
+TOOL_LATENCY = REGISTRY.register(Histogram(
+    "seatunnel_mcp_tool_duration_seconds", "Duration of tool calls in seconds.", ("tool",)))
+
+UPSTREAM_REQUESTS = REGISTRY.register(Counter(
+    "seatunnel_mcp_upstream_requests_total", "Number of requests to the SeaTunnel REST API.",
+    ("method", "endpoint", "status")))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "seatunnel_mcp_upstream_request_duration_seconds", "Duration of requests to the SeaTunnel REST API.",
+    ("method", "endpoint")))
+UPSTREAM_BYTES_SENT = REGISTRY.register(Counter(
+    "seatunnel_mcp_upstream_sent_bytes_total", "Request body bytes sent to the SeaTunnel REST API.",
+    ("endpoint",)))
+UPSTREAM_BYTES_RECEIVED = REGISTRY.register(Counter(
+    "seatunnel_mcp_upstream_received_bytes_total", "Response body bytes received from the SeaTunnel REST API.",
+    ("endpoint",)))
+UPSTREAM_IN_FLIGHT = REGISTRY.register(Gauge(
+    "seatunnel_mcp_upstream_in_flight_requests", "Requests to the SeaTunnel REST API in flight.",
+    ("endpoint",)))
+UPSTREAM_THROTTLED = REGISTRY.register(Counter(
+    "seatunnel_mcp_upstream_throttled_total",
+    "Requests to the SeaTunnel REST API delayed or rejected by a rate limit or bulkhead.",
+    ("endpoint", "limit", "outcome")))
+
+# Path parameters are replaced so that the endpoint label has a bounded set of values.
+_ENDPOINT_TEMPLATES = [
+    (re.compile(r"^/job-info/[^/]+$"), "/job-info/{jobId}"),
+    (re.compile(r"^/running-job/[^/]+$"), "/running-job/{jobId}"),
+    (re.compile(r"^/finished-jobs/[^/]+$"), "/finished-jobs/{state}"),
+]
+
+
+@functools.lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """Map an API endpoint to its template, e.g. ``/job-info/123`` to ``/job-info/{jobId}``."""
+    for pattern, template in _ENDPOINT_TEMPLATES:
+        if pattern.match(endpoint):
+            return template
+    return endpoint
+
+
+_pooled_clients: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def track_pool(client: Any) -> None:
+    """Report the connection pool of a client.
+
+    Args:
+        client: Object with a ``base_url`` and a ``pool_stats()`` method
+            returning the number of open and idle connections.
+    """
+    _pooled_clients.add(client)
+
+
+def _pool_samples() -> Iterable[str]:
+    yield "# HELP seatunnel_mcp_upstream_pool_connections Pooled connections to the SeaTunnel REST API."
+    yield "# TYPE seatunnel_mcp_upstream_pool_connections gauge"
+    for client in list(_pooled_clients):
+        stats = client.pool_stats()
+        for state in ("active", "idle"):
+            labels = _format_labels(("url", "state"), (client.base_url, state))
+            yield f"seatunnel_mcp_upstream_pool_connections{labels} {stats[state]}"
+
+
+REGISTRY.register_callback(_pool_samples)
+
+
+def instrument_tool(func: Callable) -> Callable:
+    """Wrap a tool function to record its calls, errors and latency.
+
+    Args:
+        func: Async tool function, with its tool name as ``__name__``.
+
+    Returns:
+        Wrapped tool function with the same name, docstring and signature.
+    """
+    name = func.__name__
+    calls = TOOL_CALLS.labels(name)
+    errors = TOOL_ERRORS.labels(name)
+    latency = TOOL_LATENCY.labels(name)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = await func(*args, **kwargs)
+            status = "ok"
+            return result
+        except BaseException:
+            errors.inc()
+            raise
+        finally:
+            calls.inc()
+            elapsed = time.perf_counter() - start
+            latency.observe(elapsed)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Tool %s -> %s in %.1f ms", name, status, elapsed * 1000,
+                    extra={"tool": name, "status": status, "latency_ms": round(elapsed * 1000, 3),
+                           "jobId": kwargs.get("jobId")},
+                )
+
+    return wrapper
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a background thread.
+
+    Used for the stdio transport, which has no HTTP server of its own.
+
+    Args:
+        port: Port to listen on.
+        host: Host to listen on.
+
+    Returns:
+        The running HTTP server.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
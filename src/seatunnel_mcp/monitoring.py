@@ -0,0 +1,345 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Ranking and health checks of running jobs by their metrics."""
+
+import asyncio
+import contextvars
+import heapq
+import logging
+import math
+import operator
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .client import SeaTunnelAPI
+from .concurrency import DEFAULT_MAX_CONCURRENCY, bounded_gather, run_sync
+from .jobs import job_list, job_metric
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP = 10
+DEFAULT_STALL_POLL_INTERVAL = 30.0
+DEFAULT_STALL_POLLS = 3
+DEFAULT_DEGRADE_RATIO = 0.5
+DEFAULT_IDLE_TIMEOUT = 3600.0
+
+# Counter whose deltas between calls give the measured rate of a job
+RATE_COUNTER = "SourceReceivedCount"
+
+
+def _lag(job: Dict[str, Any]) -> float:
+    return job_metric(job, "SourceReceivedCount") - job_metric(job, "SinkWriteCount")
+
+
+# Rankable values of a job, besides any raw metric name; "received_delta" is
+# measured between calls instead of read from the job.
+TOP_METRICS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    "records_per_second": lambda job: job_metric(job, "SourceReceivedQPS"),
+    "bytes_per_second": lambda job: job_metric(job, "SourceReceivedBytesPerSeconds"),
+    "sink_records_per_second": lambda job: job_metric(job, "SinkWriteQPS"),
+    "sink_bytes_per_second": lambda job: job_metric(job, "SinkWriteBytesPerSeconds"),
+    "lag": _lag,
+}
+
+
+class CounterDeltas:
+    """Last sample of a counter per job, turning successive samples into rates.
+
+    Samples are kept per cluster, and only for the jobs of its latest
+    listing, so finished jobs do not accumulate.
+    """
+
+    def __init__(self, counter: str = RATE_COUNTER):
+        """Initialize the tracker.
+
+        Args:
+            counter: Metric sampled for each job.
+        """
+        self.counter = counter
+        self.now = time.monotonic
+        self._samples: Dict[str, Dict[str, Any]] = {}
+
+    def update(self, cluster: str, jobs: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Record a sample of every job and return the rates since the previous one.
+
+        Args:
+            cluster: Key of the cluster the jobs belong to, e.g. its URL.
+            jobs: Jobs with their metrics.
+
+        Returns:
+            Counter increase per second by job ID, for the jobs sampled before.
+        """
+        now = self.now()
+        previous = self._samples.get(cluster, {})
+        samples: Dict[str, Any] = {}
+        rates: Dict[str, float] = {}
+        for job in jobs:
+            value = job_metric(job, self.counter)
+            if math.isnan(value):
+                continue
+            job_id = str(job.get("jobId"))
+            samples[job_id] = (now, value)
+            last = previous.get(job_id)
+            # A counter going backwards means the job was restarted
+            if last is not None and now > last[0] and value >= last[1]:
+                rates[job_id] = (value - last[1]) / (now - last[0])
+        self._samples[cluster] = samples
+        return rates
+
+
+async def running_jobs_with_metrics(
+    client: SeaTunnelAPI, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """Get the running jobs with their metrics.
+
+    The running job listing normally includes the metrics; the jobs it lists
+    without them are fetched concurrently with ``/job-info``.
+    """
+    jobs = job_list(await run_sync(client.get_running_jobs))
+    missing = [index for index, job in enumerate(jobs) if not isinstance(job.get("metrics"), dict)]
+    if missing:
+        infos = await bounded_gather(
+            lambda index: run_sync(client.get_job_info, jobs[index]["jobId"]), missing, max_concurrency
+        )
+        for index, info in zip(missing, infos):
+            if isinstance(info, dict):
+                jobs[index] = {**jobs[index], "metrics": info.get("metrics")}
+    return jobs
+
+
+async def top_jobs(
+    client: SeaTunnelAPI,
+    deltas: CounterDeltas,
+    metric: str = "records_per_second",
+    n: int = DEFAULT_TOP,
+    smallest: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Rank the running jobs by a metric.
+
+    Args:
+        client: SeaTunnel client instance.
+        deltas: Counter samples of previous calls; updated on every call, so
+            that ``received_delta`` is available from the second call on.
+        metric: A key of ``TOP_METRICS``, ``received_delta`` or a raw metric name.
+        n: Number of jobs to return.
+        smallest: Return the lowest values instead of the highest.
+        max_concurrency: Maximum number of ``/job-info`` calls in flight.
+
+    Returns:
+        The top jobs with their values, and how many jobs had no value.
+    """
+    jobs = await running_jobs_with_metrics(client, max_concurrency)
+    rates = deltas.update(str(getattr(client, "base_url", "")), jobs)
+
+    value: Callable[[Dict[str, Any]], float]
+    if metric == "received_delta":
+        value = lambda job: rates.get(str(job.get("jobId")), math.nan)  # noqa: E731
+    else:
+        value = TOP_METRICS.get(metric) or (lambda job: job_metric(job, metric))
+
+    scored = []
+    for job in jobs:
+        score = value(job)
+        if not math.isnan(score):
+            scored.append((score, job))
+    # Bounded heap selection: O(jobs * log n) rather than sorting every job
+    select = heapq.nsmallest if smallest else heapq.nlargest
+    top = select(max(0, n), scored, key=operator.itemgetter(0))
+
+    result: Dict[str, Any] = {
+        "metric": metric,
+        "jobs": [
+            {"jobId": job.get("jobId"), "jobName": job.get("jobName"), "value": score}
+            for score, job in top
+        ],
+        "running": len(jobs),
+    }
+    if len(scored) < len(jobs):
+        result["without_value"] = len(jobs) - len(scored)
+    if metric == "received_delta" and not rates and jobs:
+        result["note"] = "Rates are measured between calls; call again to get them"
+    return result
+
+
+class _JobHealth:
+    """Progress of one running job; constant size whatever the number of polls."""
+
+    __slots__ = (
+        "name", "time", "read", "write", "fast_rate", "slow_rate",
+        "idle_polls", "sink_idle_polls", "last_progress", "samples",
+    )
+
+    def __init__(self, name: Any, now: float, read: float, write: float):
+        self.name = name
+        self.time = now
+        self.read = read
+        self.write = write
+        self.fast_rate = 0.0
+        self.slow_rate = 0.0
+        self.idle_polls = 0
+        self.sink_idle_polls = 0
+        self.last_progress = now
+        self.samples = 0
+
+
+class StallDetector:
+    """Flag running jobs whose counters stopped moving or slowed down.
+
+    Every poll updates, per job, exponentially weighted moving averages of its
+    sink write rate over a short and a long window, and streaks of polls
+    without progress. A job is
+
+    * ``stalled`` when neither its read nor its write counter moved for
+      ``stall_polls`` polls,
+    * ``sink_stalled`` when it kept reading but wrote nothing for as long,
+    * ``degrading`` when its short-term write rate fell below
+      ``degrade_ratio`` times its long-term one.
+
+    Polling starts with the first check and stops after ``idle_timeout``
+    seconds without one. Streaming jobs without input also look stalled.
+    """
+
+    def __init__(
+        self,
+        client: SeaTunnelAPI,
+        poll_interval: float = DEFAULT_STALL_POLL_INTERVAL,
+        stall_polls: int = DEFAULT_STALL_POLLS,
+        degrade_ratio: float = DEFAULT_DEGRADE_RATIO,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """Initialize the detector.
+
+        Args:
+            client: SeaTunnel client instance.
+            poll_interval: Seconds between polls of the running jobs.
+            stall_polls: Polls without progress before a job counts as stalled.
+            degrade_ratio: Ratio of short- to long-term write rate below which
+                a job counts as degrading.
+            idle_timeout: Seconds without a check after which polling stops.
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self.stall_polls = stall_polls
+        self.degrade_ratio = degrade_ratio
+        self.idle_timeout = idle_timeout
+        self.fast_window = 3 * poll_interval
+        self.slow_window = 30 * poll_interval
+        self.now = time.monotonic
+        self.polls = 0
+        self.last_poll: Optional[float] = None
+        self._jobs: Dict[str, _JobHealth] = {}
+        self._last_check = 0.0
+        self._lock = asyncio.Lock()
+        self._poller: Optional[asyncio.Task] = None
+
+    def observe(self, jobs: List[Dict[str, Any]]) -> None:
+        """Update the progress of the running jobs from one listing."""
+        now = self.now()
+        previous, self._jobs = self._jobs, {}
+        for job in jobs:
+            read = job_metric(job, "SourceReceivedCount")
+            write = job_metric(job, "SinkWriteCount")
+            if math.isnan(read) or math.isnan(write):
+                continue
+            job_id = str(job.get("jobId"))
+            health = previous.get(job_id)
+            # New jobs, and restarted ones whose counters went backwards, start over
+            if health is None or read < health.read or write < health.write or now <= health.time:
+                self._jobs[job_id] = _JobHealth(job.get("jobName"), now, read, write)
+                continue
+            elapsed = now - health.time
+            rate = (write - health.write) / elapsed
+            if health.samples == 0:
+                health.fast_rate = health.slow_rate = rate
+            else:
+                health.fast_rate += (1.0 - math.exp(-elapsed / self.fast_window)) * (rate - health.fast_rate)
+                health.slow_rate += (1.0 - math.exp(-elapsed / self.slow_window)) * (rate - health.slow_rate)
+            health.samples += 1
+            moved_read, moved_write = read > health.read, write > health.write
+            health.idle_polls = 0 if moved_read or moved_write else health.idle_polls + 1
+            health.sink_idle_polls = health.sink_idle_polls + 1 if moved_read and not moved_write else 0
+            if moved_write:
+                health.last_progress = now
+            health.time, health.read, health.write = now, read, write
+            self._jobs[job_id] = health
+        self.polls += 1
+        self.last_poll = now
+
+    def findings(self) -> List[Dict[str, Any]]:
+        """Jobs currently stalled or degrading, longest without progress first."""
+        now = self.now()
+        found = []
+        for job_id, health in self._jobs.items():
+            if health.idle_polls >= self.stall_polls:
+                status = "stalled"
+            elif health.sink_idle_polls >= self.stall_polls:
+                status = "sink_stalled"
+            elif (
+                health.samples >= self.stall_polls
+                and health.slow_rate > 0
+                and health.fast_rate < self.degrade_ratio * health.slow_rate
+            ):
+                status = "degrading"
+            else:
+                continue
+            found.append({
+                "jobId": job_id,
+                "jobName": health.name,
+                "status": status,
+                "seconds_without_writes": round(now - health.last_progress, 1),
+                "write_rate": round(health.fast_rate, 3),
+                "baseline_write_rate": round(health.slow_rate, 3),
+            })
+        found.sort(key=lambda finding: -finding["seconds_without_writes"])
+        return found
+
+    async def poll_once(self) -> None:
+        """Poll the running jobs once; concurrent calls share one poll."""
+        if self._lock.locked():
+            async with self._lock:
+                return
+        async with self._lock:
+            self.observe(await running_jobs_with_metrics(self.client))
+
+    async def check(self) -> Dict[str, Any]:
+        """Report the stalled and degrading jobs, polling first if the last poll is stale."""
+        self._last_check = self.now()
+        if self._poller is None or self._poller.done():
+            # Start from an empty context so the poller does not carry the
+            # checking request's context around.
+            self._poller = asyncio.get_running_loop().create_task(
+                self._poll_loop(), context=contextvars.Context()
+            )
+        if self.last_poll is None or self.now() - self.last_poll >= self.poll_interval:
+            await self.poll_once()
+        report: Dict[str, Any] = {"running": len(self._jobs), "polls": self.polls, "jobs": self.findings()}
+        if self.polls <= self.stall_polls:
+            report["note"] = (
+                f"Progress is tracked across polls every {self.poll_interval:g}s; "
+                f"stalls show up after {self.stall_polls} polls without progress"
+            )
+        return report
+
+    async def _poll_loop(self) -> None:
+        """Poll the running jobs until nobody checked for ``idle_timeout`` seconds."""
+        while self.now() - self._last_check < self.idle_timeout:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.warning(f"Failed to poll running jobs for stalls: {e}")
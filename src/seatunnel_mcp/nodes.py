@@ -0,0 +1,356 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Pressure ranking and outlier detection of the cluster nodes.
+
+The per-node records of ``/system-monitoring-information`` are parsed into
+one column per figure, with NumPy arrays when NumPy is installed and lists
+otherwise. Nodes are ranked by their pressure, the mean of their heap usage,
+process CPU load and GC activity, and a figure of a node is an outlier when
+it lies well above the cluster median, measured in median absolute
+deviations.
+
+There is no background sampler: every analysis is a sample, and GC activity
+is the rate of the GC counters since the previous call, however long ago it
+was. It is only known from the second call on, so a node's pressure only
+joins its average pressure once its GC activity is known.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+# NumPy speeds up the columns when installed; pure Python is used otherwise
+np: Any
+try:
+    import numpy
+except ImportError:
+    np = None
+else:
+    np = numpy
+
+from .client import SeaTunnelAPI
+from .concurrency import run_sync
+
+DEFAULT_TOP = 10
+DEFAULT_HISTORY = 30
+# Robust z-score above which a figure is an outlier
+DEFAULT_OUTLIER_THRESHOLD = 3.5
+# Spread assumed around the median when the nodes are (nearly) identical,
+# as a fraction of the median, so that tiny differences are not outliers
+MIN_RELATIVE_SPREAD = 0.1
+# Scales the median absolute deviation to the standard deviation of a normal distribution
+MAD_SCALE = 1.4826
+
+# Figures reported per node; ratios are between 0 and 1
+COLUMNS = ("pressure", "heap_used_ratio", "cpu_load", "system_load", "memory_used_ratio", "threads",
+           "gc_per_second", "gc_time_ratio")
+# Figures checked for outliers
+OUTLIER_COLUMNS = ("heap_used_ratio", "cpu_load", "threads", "gc_per_second", "gc_time_ratio")
+
+_SIZE_UNITS = {"B": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_number(value: Any) -> float:
+    """Parse a monitoring figure such as ``4.0G``, ``256.5M``, ``12.50%`` or ``42``.
+
+    Sizes are returned in bytes and percentages as fractions; anything
+    unparsable is NaN.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return math.nan
+    # Checking the suffix first is faster than failing to parse it as a number
+    text = value.strip()
+    unit = text[-1:].upper()
+    try:
+        if unit == "%":
+            return float(text[:-1]) / 100
+        if unit not in _SIZE_UNITS:
+            return float(text)
+        if unit == "B" and text[-2:-1].upper() in _SIZE_UNITS:
+            text = text[:-1]
+            unit = text[-1:].upper()
+        return float(text[:-1]) * _SIZE_UNITS[unit]
+    except ValueError:
+        return math.nan
+
+
+def _field(node: Dict[str, Any], *names: str) -> float:
+    for name in names:
+        if name in node:
+            return parse_number(node[name])
+    return math.nan
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator > 0 else math.nan
+
+
+def _known_sum(*values: float) -> float:
+    """Sum of the values that are known, NaN if none is."""
+    known = [value for value in values if not math.isnan(value)]
+    return sum(known) if known else math.nan
+
+
+def _node_figures(node: Dict[str, Any]) -> Tuple[float, ...]:
+    """Heap and memory usage, loads, threads and GC counters of a node record."""
+    heap = _field(node, "heap.memory.used/max")
+    if math.isnan(heap):
+        heap = _ratio(_field(node, "heap.memory.used"), _field(node, "heap.memory.max"))
+    memory = 1 - _ratio(_field(node, "physical.memory.free"), _field(node, "physical.memory.total"))
+    # SeaTunnel reports minor.gc.count; other versions gc.minor.count. Some
+    # collectors only report one of the two families.
+    gc_count = _known_sum(_field(node, "minor.gc.count", "gc.minor.count"),
+                          _field(node, "major.gc.count", "gc.major.count"))
+    gc_time_ms = _known_sum(_field(node, "minor.gc.time", "gc.minor.time"),
+                            _field(node, "major.gc.time", "gc.major.time"))
+    return (
+        heap,
+        _field(node, "load.process"),
+        _field(node, "load.system"),
+        memory,
+        _field(node, "thread.count"),
+        gc_count,
+        gc_time_ms,
+    )
+
+
+# Column operations, on NumPy arrays when available and on lists otherwise
+
+def _column(values: Sequence[float]) -> Any:
+    return np.asarray(values, dtype=float) if np is not None else list(values)
+
+
+def _median(column: Any) -> float:
+    if np is not None:
+        return float(np.nanmedian(column)) if not np.isnan(column).all() else math.nan
+    values: List[float] = sorted(value for value in column if not math.isnan(value))
+    if not values:
+        return math.nan
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def _robust_z(column: Any) -> Tuple[float, Any]:
+    """Median of a column and the robust z-score of each value."""
+    median = _median(column)
+    if math.isnan(median):
+        return median, column
+    if np is not None:
+        deviation = float(np.nanmedian(np.abs(column - median)))
+    else:
+        deviation = _median([abs(value - median) for value in column])
+    spread = max(MAD_SCALE * deviation, MIN_RELATIVE_SPREAD * abs(median), 1e-9)
+    if np is not None:
+        return median, (column - median) / spread
+    return median, [(value - median) / spread for value in column]
+
+
+def _nanmax(column: Any) -> float:
+    if np is not None:
+        return float(np.nanmax(column)) if not np.isnan(column).all() else math.nan
+    values = [value for value in column if not math.isnan(value)]
+    return max(values) if values else math.nan
+
+
+def _pressure(heap: Any, cpu: Any, gc: Any) -> Any:
+    """Mean of the known components of each node's pressure."""
+    if np is not None:
+        components = np.vstack([heap, cpu, gc])
+        known = ~np.isnan(components)
+        count = known.sum(axis=0)
+        total = np.where(known, components, 0.0).sum(axis=0)
+        return np.divide(total, count, out=np.full(len(heap), np.nan), where=count > 0)
+    pressure = []
+    for values in zip(heap, cpu, gc):
+        known = [value for value in values if not math.isnan(value)]
+        pressure.append(sum(known) / len(known) if known else math.nan)
+    return pressure
+
+
+def _order(column: Any, n: int) -> List[int]:
+    """Indices of the n largest values, NaN last."""
+    if np is not None:
+        keys = np.where(np.isnan(column), -np.inf, column)
+        return [int(index) for index in np.argsort(-keys, kind="stable")[:n]]
+    keys = [-math.inf if math.isnan(value) else value for value in column]
+    return sorted(range(len(keys)), key=lambda index: -keys[index])[:n]
+
+
+def _above(column: Any, threshold: float) -> List[int]:
+    """Indices of the values above a threshold."""
+    if np is not None:
+        return [int(index) for index in np.flatnonzero(column > threshold)]
+    return [index for index, value in enumerate(column) if value > threshold]
+
+
+def _rounded(value: float) -> Optional[float]:
+    return None if math.isnan(value) else round(float(value), 4)
+
+
+class _NodeSamples:
+    """Recent GC counters and pressure of one node."""
+
+    __slots__ = ("gc_count", "gc_time_ms", "time", "pressure")
+
+    def __init__(self, history: int):
+        self.gc_count = math.nan
+        self.gc_time_ms = math.nan
+        self.time = math.nan
+        self.pressure: Deque[float] = deque(maxlen=history)
+
+
+class NodeHotspots:
+    """Pressure ranking of the nodes, with the GC counters and pressure of previous calls.
+
+    Every analysis is a sample; the samples of the nodes of a cluster are
+    kept for its latest node listing only, so removed nodes do not accumulate.
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY, outlier_threshold: float = DEFAULT_OUTLIER_THRESHOLD):
+        """Initialize the analyzer.
+
+        Args:
+            history: Number of calls whose pressure of each node is averaged.
+            outlier_threshold: Robust z-score above which a figure is an outlier.
+        """
+        self.history = max(1, history)
+        self.outlier_threshold = outlier_threshold
+        self.now = time.monotonic
+        self._samples: Dict[str, Dict[str, _NodeSamples]] = {}
+        self._lock = threading.Lock()
+
+    def analyze(
+        self, cluster: str, nodes: List[Dict[str, Any]], sort_by: str = "pressure", n: int = DEFAULT_TOP
+    ) -> Dict[str, Any]:
+        """Rank nodes and flag their outliers.
+
+        Args:
+            cluster: Key of the cluster the nodes belong to, e.g. its URL.
+            nodes: Records of ``/system-monitoring-information``.
+            sort_by: Column to rank the nodes by.
+            n: Number of nodes to return.
+
+        Returns:
+            A table of the top nodes, the cluster medians and the number of
+            nodes with outliers.
+
+        Raises:
+            ValueError: If ``sort_by`` is not a column.
+        """
+        if sort_by not in COLUMNS:
+            raise ValueError(f"Unknown column {sort_by!r}, expected one of {', '.join(COLUMNS)}")
+        nodes = [node for node in nodes if isinstance(node, dict)]
+        names = [f"{node.get('host')}:{node.get('port')}" for node in nodes]
+        figures = [_node_figures(node) for node in nodes]
+        heap, cpu, system, memory, threads, gc_count, gc_time_ms = zip(*figures) if figures else [()] * 7
+
+        now = self.now()
+        with self._lock:
+            previous = self._samples.get(cluster, {})
+            samples = {name: previous.get(name) or _NodeSamples(self.history) for name in names}
+            gc_rates: List[float] = []
+            gc_ratios: List[float] = []
+            # Nodes reporting GC counters whose rate is not known yet
+            gc_pending: List[bool] = []
+            for name, count, time_ms in zip(names, gc_count, gc_time_ms):
+                sample = samples[name]
+                elapsed = now - sample.time
+                # Counters going backwards mean the node was restarted
+                restarted = count < sample.gc_count or time_ms < sample.gc_time_ms
+                if elapsed > 0 and not restarted:
+                    gc_rates.append((count - sample.gc_count) / elapsed)
+                    gc_ratios.append((time_ms - sample.gc_time_ms) / 1000 / elapsed)
+                else:
+                    gc_rates.append(math.nan)
+                    gc_ratios.append(math.nan)
+                gc_pending.append(math.isnan(gc_rates[-1]) and not math.isnan(count))
+                sample.gc_count, sample.gc_time_ms, sample.time = count, time_ms, now
+            self._samples[cluster] = samples
+
+        # The counters are only needed per node; the other figures become columns
+        heap, cpu, system, memory, threads = (_column(values) for values in (heap, cpu, system, memory, threads))
+        gc_per_second, gc_time_ratio = _column(gc_rates), _column(gc_ratios)
+        # GC time is the better measure; without it the rates count relative to the busiest node
+        gc_load = gc_time_ratio
+        if math.isnan(_nanmax(gc_time_ratio)):
+            busiest = _nanmax(gc_per_second)
+            gc_load = _column([rate / busiest for rate in gc_rates]) if busiest > 0 else gc_per_second
+        pressure = _pressure(heap, cpu, gc_load)
+        columns = {
+            "pressure": pressure,
+            "heap_used_ratio": heap,
+            "cpu_load": cpu,
+            "system_load": system,
+            "memory_used_ratio": memory,
+            "threads": threads,
+            "gc_per_second": gc_per_second,
+            "gc_time_ratio": gc_time_ratio,
+        }
+
+        medians = {}
+        outliers: Dict[int, List[str]] = {}
+        for name in OUTLIER_COLUMNS:
+            medians[name], scores = _robust_z(columns[name])
+            if len(nodes) >= 3:
+                for index in _above(scores, self.outlier_threshold):
+                    outliers.setdefault(index, []).append(name)
+        medians["pressure"] = _median(pressure)
+
+        # A pressure still lacking its GC component would not compare with the
+        # later ones, so it is left out of the average
+        with self._lock:
+            for name, value, pending in zip(names, pressure.tolist() if np is not None else pressure, gc_pending):
+                if not pending:
+                    samples[name].pressure.append(value)
+
+        rows: List[List[Any]] = []
+        for index in _order(columns[sort_by], max(0, n)):
+            history = [value for value in samples[names[index]].pressure if not math.isnan(value)]
+            rows.append(
+                [names[index], "master" if str(nodes[index].get("isMaster")).lower() == "true" else "worker"]
+                + [_rounded(columns[name][index]) for name in COLUMNS]
+                + [_rounded(sum(history) / len(history)) if history else None, outliers.get(index, [])]
+            )
+        return {
+            "nodes": len(nodes),
+            "sort_by": sort_by,
+            "columns": ["node", "role", *COLUMNS, "pressure_avg", "outliers"],
+            "rows": rows,
+            "medians": {name: _rounded(value) for name, value in medians.items()},
+            "with_outliers": len(outliers),
+        }
+
+
+async def node_hotspots(
+    client: SeaTunnelAPI, hotspots: NodeHotspots, sort_by: str = "pressure", n: int = DEFAULT_TOP
+) -> Dict[str, Any]:
+    """Rank the nodes of a cluster by pressure.
+
+    Args:
+        client: SeaTunnel client instance.
+        hotspots: Analyzer keeping the samples of previous calls.
+        sort_by: Column to rank the nodes by.
+        n: Number of nodes to return.
+    """
+    records = await run_sync(client.get_system_monitoring_information)
+    return hotspots.analyze(
+        str(getattr(client, "base_url", "")), records if isinstance(records, list) else [], sort_by=sort_by, n=n
+    )
@@ -0,0 +1,248 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Named connection profiles with a bounded registry of pooled clients.
+
+Each MCP session is bound to a profile. Switching profiles or updating the
+connection settings rebinds only the calling session, so concurrent sessions
+never retarget each other's traffic. Profiles derived by updating the
+connection settings belong to the session: they are neither listed nor
+selectable by name, and are dropped with the session.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import httpx
+from mcp.server.lowlevel.server import request_ctx
+
+from .client import SeaTunnelClient
+from .limits import UpstreamLimits
+from .schema import ConnectionProfile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+DEFAULT_MAX_CLIENTS = 16
+
+
+def load_profiles(raw: str) -> List[ConnectionProfile]:
+    """Parse connection profiles from JSON.
+
+    Args:
+        raw: JSON object mapping profile names to ``url``, ``api_key``,
+            ``timeout`` and ``max_connections`` settings.
+
+    Returns:
+        List of connection profiles.
+    """
+    return [ConnectionProfile(name=name, **settings) for name, settings in json.loads(raw).items()]
+
+
+def _current_session() -> Optional[Any]:
+    """Get the MCP session of the request being handled, if any."""
+    try:
+        return request_ctx.get().session
+    except LookupError:
+        return None
+
+
+class ClientRegistry:
+    """Registry of connection profiles, each backed by its own pooled client.
+
+    Clients are created on first use and kept in an LRU of at most
+    ``max_clients`` entries. The client of the default profile is never
+    evicted, since background pollers hold on to it.
+    """
+
+    def __init__(
+        self,
+        profiles: Iterable[ConnectionProfile],
+        default_profile: str = DEFAULT_PROFILE,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        limits: Optional[UpstreamLimits] = None,
+        transport_factory: Optional[Callable[[ConnectionProfile], httpx.BaseTransport]] = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            profiles: Initial connection profiles.
+            default_profile: Profile used by sessions that have not chosen one.
+            max_clients: Maximum number of live clients.
+            limits: Optional rate limits and bulkheads shared by all clients;
+                clients of the same URL share the same limits.
+            transport_factory: Optional factory of the HTTP transport of each
+                new client, e.g. to record or replay its requests.
+        """
+        self._profiles: Dict[str, ConnectionProfile] = {p.name: p for p in profiles}
+        if default_profile not in self._profiles:
+            raise ValueError(f"Unknown default profile: {default_profile}")
+        self.default_profile = default_profile
+        self.max_clients = max(1, max_clients)
+        self.limits = limits
+        self.transport_factory = transport_factory
+        self._clients: "OrderedDict[str, SeaTunnelClient]" = OrderedDict()
+        self._sessions: "weakref.WeakKeyDictionary[Any, ConnectionProfile]" = weakref.WeakKeyDictionary()
+        self._global_profile = self._profiles[default_profile]
+        self._lock = threading.Lock()
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """List the known profiles without their API keys."""
+        current = self.current_profile().name
+        return [
+            {
+                "name": p.name,
+                "url": p.url,
+                "has_api_key": p.api_key is not None,
+                "active": p.name == current,
+            }
+            for p in self._profiles.values()
+        ]
+
+    def get_client(self, name: str) -> SeaTunnelClient:
+        """Get the pooled client of a profile, creating it if necessary.
+
+        Args:
+            name: Profile name.
+
+        Returns:
+            Client for the profile.
+        """
+        profile = self._profiles.get(name)
+        if profile is None:
+            raise ValueError(f"Unknown connection profile: {name}")
+        return self._get_client(profile)
+
+    def _get_client(self, profile: ConnectionProfile) -> SeaTunnelClient:
+        """Get the pooled client of a configured or derived profile, creating it if necessary."""
+        name = profile.name
+        with self._lock:
+            client = self._clients.get(name)
+            if client is not None:
+                self._clients.move_to_end(name)
+                return client
+
+            client = SeaTunnelClient(
+                base_url=profile.url,
+                api_key=profile.api_key,
+                timeout=profile.timeout,
+                max_connections=profile.max_connections,
+                limits=self.limits,
+                transport=self.transport_factory(profile) if self.transport_factory else None,
+            )
+            self._clients[name] = client
+            evictable = [n for n in self._clients if n not in (self.default_profile, name)]
+            for evicted_name in evictable[:max(0, len(self._clients) - self.max_clients)]:
+                evicted = self._clients.pop(evicted_name)
+                logger.debug(f"Evicting client of connection profile {evicted_name}")
+                # Give in-flight requests on the evicted client time to complete.
+                timer = threading.Timer(evicted.timeout * 2, evicted.close)
+                timer.daemon = True
+                timer.start()
+            return client
+
+    def current_profile(self) -> ConnectionProfile:
+        """Get the profile bound to the current session."""
+        session = _current_session()
+        with self._lock:
+            if session is None:
+                return self._global_profile
+            return self._sessions.get(session, self._profiles[self.default_profile])
+
+    def current_client(self) -> SeaTunnelClient:
+        """Get the client of the profile bound to the current session."""
+        return self._get_client(self.current_profile())
+
+    def use_profile(self, name: str) -> ConnectionProfile:
+        """Bind the current session to a profile.
+
+        Args:
+            name: Profile name.
+
+        Returns:
+            The selected profile.
+        """
+        profile = self._profiles.get(name)
+        if profile is None:
+            raise ValueError(f"Unknown connection profile: {name}")
+        return self._bind(profile)
+
+    def _bind(self, profile: ConnectionProfile) -> ConnectionProfile:
+        session = _current_session()
+        with self._lock:
+            if session is None:
+                self._global_profile = profile
+            else:
+                self._sessions[session] = profile
+        return profile
+
+    def update_current_connection(self, url: Optional[str] = None, api_key: Optional[str] = None) -> ConnectionProfile:
+        """Bind the current session to a profile derived from its current one.
+
+        Derived profiles are kept with the session only. Sessions with the same
+        settings share the pooled client of their derived profiles.
+
+        Args:
+            url: New base URL, or None to keep the current one.
+            api_key: New API key, or None to keep the current one.
+
+        Returns:
+            The derived profile.
+        """
+        current = self.current_profile()
+        url = url or current.url
+        api_key = api_key or current.api_key
+        if url == current.url and api_key == current.api_key:
+            return current
+
+        digest = hashlib.sha256(f"{url}\0{api_key or ''}".encode()).hexdigest()[:12]
+        profile = current.model_copy(update={"name": f"custom-{digest}", "url": url, "api_key": api_key})
+        return self._bind(profile)
+
+
+class SessionClient:
+    """``SeaTunnelClient`` facade that routes every call to the current session's profile."""
+
+    def __init__(self, registry: ClientRegistry):
+        """Initialize the facade.
+
+        Args:
+            registry: Client registry to resolve clients from.
+        """
+        self.registry = registry
+
+    def resolve(self) -> SeaTunnelClient:
+        """Get the concrete client for the current session."""
+        return self.registry.current_client()
+
+    def get_connection_settings(self) -> Dict[str, Any]:
+        """Get the connection settings of the current session."""
+        settings = self.resolve().get_connection_settings()
+        settings["profile"] = self.registry.current_profile().name
+        return settings
+
+    def update_connection_settings(self, url: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
+        """Update the connection settings of the current session only."""
+        self.registry.update_current_connection(url=url, api_key=api_key)
+        return self.get_connection_settings()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
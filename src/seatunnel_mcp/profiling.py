@@ -0,0 +1,283 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Sampling profiler for tool calls and SeaTunnel client methods.
+
+One in every ``sample_every`` tool calls and client method calls is marked
+as sampled. While sampled client calls are running, a background thread
+takes stack samples of the worker threads running them, and aggregates them
+into folded stacks (``root;caller;callee count``), the input format of
+flamegraph.pl and speedscope. The folded stacks are written to the output
+directory periodically.
+
+Tools are coroutines sharing the event loop thread, whose stack mostly shows
+the selector waiting for I/O, so that thread is never sampled. A sampled
+tool instead marks its context, and the client calls it makes in worker
+threads are all sampled, rooted at ``tool:<name>;client:<method>``.
+
+A statistical sampler is used rather than cProfile because calls run
+concurrently on the event loop and in worker threads, and only one
+deterministic profiler can be active at a time.
+"""
+
+import contextvars
+import functools
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional
+
+from .client import SeaTunnelClient
+from .tracing import CLIENT_METHODS
+
+
+DEFAULT_SAMPLE_EVERY = 10
+DEFAULT_INTERVAL = 0.005
+DEFAULT_FLUSH_INTERVAL = 60.0
+DEFAULT_OUTPUT_DIR = "profiles"
+MAX_STACK_DEPTH = 128
+
+# Label of the sampled tool call the current context belongs to
+_sampled_tool: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("sampled_tool", default=None)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)})"
+
+
+class SamplingProfiler:
+    """Sampled profiling of tool and client calls, aggregated into folded stacks."""
+
+    def __init__(
+        self,
+        output_dir: str = DEFAULT_OUTPUT_DIR,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+        interval: float = DEFAULT_INTERVAL,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            output_dir: Directory the folded stacks are written to.
+            sample_every: Profile one in every ``sample_every`` calls.
+            interval: Seconds between two stack samples.
+            flush_interval: Seconds between two writes of the folded stacks.
+        """
+        self.output_dir = output_dir
+        self.sample_every = max(1, sample_every)
+        self.interval = interval
+        self.flush_interval = flush_interval
+        self._calls = itertools.count()
+        self._active: Dict[int, List[str]] = {}
+        self._stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._originals: Dict[str, Callable] = {}
+
+    def _is_sampled(self) -> bool:
+        return next(self._calls) % self.sample_every == 0
+
+    def _begin(self, label: str, sampled: Optional[bool] = None) -> bool:
+        """Mark the current thread as running a call, if this call is sampled."""
+        if not (self._is_sampled() if sampled is None else sampled):
+            return False
+        with self._lock:
+            self._active.setdefault(threading.get_ident(), []).append(label)
+        self._wakeup.set()
+        return True
+
+    def _end(self, label: str) -> None:
+        thread_id = threading.get_ident()
+        with self._lock:
+            labels = self._active.get(thread_id)
+            if labels:
+                labels.remove(label)
+                if not labels:
+                    del self._active[thread_id]
+
+    def wrap_tool(self, func: Callable) -> Callable:
+        """Wrap an async tool function for sampled profiling.
+
+        A sampled tool call has all the client calls it makes sampled; the
+        event loop thread running the tool itself is not.
+
+        Args:
+            func: Async tool function, with its tool name as ``__name__``.
+
+        Returns:
+            Wrapped tool function with the same name, docstring and signature.
+        """
+        label = f"tool:{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not self._is_sampled():
+                return await func(*args, **kwargs)
+            token = _sampled_tool.set(label)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _sampled_tool.reset(token)
+
+        return wrapper
+
+    def _wrap_method(self, method: Callable) -> Callable:
+        name = f"client:{method.__name__}"
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tool = _sampled_tool.get()
+            label = name if tool is None else f"{tool};{name}"
+            if not self._begin(label, sampled=True if tool is not None else None):
+                return method(*args, **kwargs)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._end(label)
+
+        return wrapper
+
+    def instrument_client(self) -> None:
+        """Wrap the ``SeaTunnelClient`` methods for sampled profiling."""
+        for name in CLIENT_METHODS:
+            if name not in self._originals:
+                method = getattr(SeaTunnelClient, name)
+                self._originals[name] = method
+                setattr(SeaTunnelClient, name, self._wrap_method(method))
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        if self._thread is not None:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="tool-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling, restore ``SeaTunnelClient`` and write the folded stacks."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for name, method in self._originals.items():
+            setattr(SeaTunnelClient, name, method)
+        self._originals.clear()
+        self.flush()
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._stopped.is_set():
+            with self._lock:
+                active = {thread_id: labels[-1] for thread_id, labels in self._active.items()}
+                if not active:
+                    self._wakeup.clear()
+            if active:
+                self.sample(active)
+                time.sleep(self.interval)
+            else:
+                # Sleep until a sampled call starts, but still flush on schedule
+                self._wakeup.wait(max(0.0, next_flush - time.monotonic()))
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def sample(self, active: Dict[int, str]) -> None:
+        """Take one stack sample of each thread running a sampled call.
+
+        Args:
+            active: Root label of the sampled call, by thread ID.
+        """
+        frames = sys._current_frames()
+        for thread_id, root in active.items():
+            frame: Optional[FrameType] = frames.get(thread_id)
+            stack: List[str] = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                stack.append(root)
+                folded = ";".join(reversed(stack))
+                with self._lock:
+                    self._stacks[folded] += 1
+
+    def flush(self) -> Optional[str]:
+        """Write the aggregated folded stacks.
+
+        Returns:
+            Path of the written file, or None if there is nothing to write yet.
+        """
+        with self._lock:
+            stacks = list(self._stacks.items())
+        if not stacks:
+            return None
+        path = os.path.join(self.output_dir, f"tools-{os.getpid()}.folded")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            for stack, count in sorted(stacks):
+                f.write(f"{stack} {count}\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def summary(self, top: int = 20) -> Dict[str, Any]:
+        """Summarize the hottest functions.
+
+        Args:
+            top: Number of functions to return.
+
+        Returns:
+            Total number of samples, and the functions with the most samples
+            where they were on top of the stack (self) or anywhere in it (total).
+        """
+        with self._lock:
+            stacks = list(self._stacks.items())
+
+        total_samples = sum(count for _, count in stacks)
+        self_samples: Counter = Counter()
+        inclusive_samples: Counter = Counter()
+        roots: Counter = Counter()
+        for stack, count in stacks:
+            frames = stack.split(";")
+            roots[frames[0]] += count
+            self_samples[frames[-1]] += count
+            for function in set(frames[1:]):
+                inclusive_samples[function] += count
+
+        def percent(count: int) -> float:
+            return round(100.0 * count / total_samples, 2) if total_samples else 0.0
+
+        return {
+            "samples": total_samples,
+            "calls": dict(roots.most_common()),
+            "hotspots": [
+                {
+                    "function": function,
+                    "self_samples": count,
+                    "self_percent": percent(count),
+                    "total_percent": percent(inclusive_samples[function]),
+                }
+                for function, count in self_samples.most_common(top)
+            ],
+        }
@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Rate-limited MCP progress notifications for long-running tools.
+
+Code running on behalf of a tool call, including client calls in worker
+threads, reports progress through ``progress_reporter()``. Reports are
+dropped unless the client asked for progress with a progress token, and are
+throttled to at most one notification per ``min_interval`` seconds.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+from mcp.server.lowlevel.server import request_ctx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_INTERVAL = 0.25
+
+
+class ProgressReporter:
+    """Send throttled progress notifications for one request."""
+
+    def __init__(
+        self,
+        session: Any = None,
+        progress_token: Any = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+    ):
+        """Initialize the reporter.
+
+        Args:
+            session: MCP server session of the request, or None to discard reports.
+            progress_token: Progress token sent by the client, or None to discard reports.
+            loop: Event loop the session runs on.
+            min_interval: Minimum number of seconds between two notifications.
+        """
+        self.session = session
+        self.progress_token = progress_token
+        self.loop = loop
+        self.min_interval = min_interval
+        self._last_sent = 0.0
+        self._progress = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether reports are sent to the client."""
+        return self.session is not None and self.progress_token is not None and self.loop is not None
+
+    def report(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+        force: bool = False,
+    ) -> None:
+        """Report progress. Safe to call from the event loop and from worker threads.
+
+        Args:
+            progress: Progress so far; notifications never go backwards.
+            total: Total amount of work, if known.
+            message: Optional human-readable message.
+            force: Send even if the last notification was sent recently, e.g. on completion.
+        """
+        loop = self.loop
+        if loop is None or not self.enabled:
+            return
+        with self._lock:
+            now = time.monotonic()
+            done = total is not None and progress >= total
+            if progress < self._progress or (not (force or done) and now - self._last_sent < self.min_interval):
+                return
+            self._progress = progress
+            self._last_sent = now
+
+        coro = self.session.send_progress_notification(
+            self.progress_token, progress, total=total, message=message
+        )
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            future = asyncio.ensure_future(coro)
+        else:
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        future.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future: Any) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"Failed to send progress notification: {future.exception()}")
+
+
+_NO_PROGRESS = ProgressReporter()
+
+_current_reporter: contextvars.ContextVar[Optional[ProgressReporter]] = contextvars.ContextVar(
+    "seatunnel_progress_reporter", default=None
+)
+
+
+def progress_reporter() -> ProgressReporter:
+    """Get the progress reporter of the tool call being handled.
+
+    The reporter is created on first use and shared by everything the tool
+    call runs afterwards, including tasks and worker threads it starts.
+
+    Returns:
+        The request's reporter, or a reporter that discards reports when the
+        call did not ask for progress.
+    """
+    reporter = _current_reporter.get()
+    if reporter is not None:
+        return reporter
+
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return _NO_PROGRESS
+    progress_token = ctx.meta.progressToken if ctx.meta is not None else None
+    if progress_token is None:
+        reporter = _NO_PROGRESS
+    else:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a worker thread before the tool call created a reporter.
+            return _NO_PROGRESS
+        reporter = ProgressReporter(ctx.session, progress_token, loop)
+    _current_reporter.set(reporter)
+    return reporter
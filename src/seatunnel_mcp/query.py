@@ -0,0 +1,376 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Filter expressions over job listings.
+
+A filter such as::
+
+    state = FAILED and name ~ "cdc_*" and finished > -1h and error contains timeout
+
+is parsed once and compiled into a single Python function, so evaluating it
+costs one call per job. Supported comparisons:
+
+* ``state``, ``name``, ``id``, ``error``: ``=``, ``!=``, ``in (A, B)``,
+  ``~`` (glob), ``=~`` (regular expression), ``contains`` (case-insensitive)
+* ``created``, ``finished``: ``<``, ``<=``, ``>``, ``>=`` against a time such
+  as ``"2025-06-10 12:00:00"`` or a duration ago such as ``-1h``
+  (units ``s``, ``m``, ``h``, ``d``)
+* any other name is a job metric, e.g. ``SourceReceivedCount > 1000``:
+  ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` against a number
+
+Comparisons combine with ``and``, ``or``, ``not`` and parentheses. Jobs
+without a time or metric never match a comparison on it. State values are
+case-insensitive.
+"""
+
+import asyncio
+import fnmatch
+import functools
+import itertools
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .client import SeaTunnelAPI
+from .concurrency import run_sync
+from .jobs import FINISHED_STATES, job_list, job_metric
+
+# Job fields by filter name
+STRING_FIELDS = {"state": "jobStatus", "name": "jobName", "id": "jobId", "error": "errorMsg"}
+TIME_FIELDS = {"created": "createTime", "finished": "finishTime"}
+
+# Timestamps of the REST API; in this format they sort like the times they denote
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<duration>-\d+(?:\.\d+)?[smhd])(?![\w.])
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)(?![\w.])
+      | (?P<op>=~|!=|<=|>=|=|<|>|~|\(|\)|,)
+      | (?P<word>[A-Za-z_][\w.\-*?]*)
+    )""",
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not", "in", "contains"}
+
+Node = Tuple[Any, ...]
+
+
+class FilterError(ValueError):
+    """Raised for an invalid filter expression."""
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise FilterError(f"Unexpected character at position {position}: {expression[position:position + 10]!r}")
+        kind = match.lastgroup or ""
+        text, start = match.group(kind), match.start(kind)
+        if kind == "string":
+            text = re.sub(r"\\(.)", r"\1", text[1:-1])
+        elif kind == "word" and text.lower() in _KEYWORDS:
+            kind, text = "keyword", text.lower()
+        tokens.append((kind, text, start))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser of filter expressions into nested tuples."""
+
+    def __init__(self, expression: str):
+        self.tokens = _tokenize(expression)
+        self.index = 0
+
+    def peek(self) -> Tuple[str, str, int]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else ("end", "", -1)
+
+    def take(self, kind: str, text: Optional[str] = None) -> bool:
+        token = self.peek()
+        if token[0] == kind and (text is None or token[1] == text):
+            self.index += 1
+            return True
+        return False
+
+    def fail(self, expected: str) -> FilterError:
+        kind, text, position = self.peek()
+        found = "end of filter" if kind == "end" else f"{text!r} at position {position}"
+        return FilterError(f"Expected {expected}, found {found}")
+
+    def parse(self) -> Node:
+        node = self.parse_or()
+        if self.peek()[0] != "end":
+            raise self.fail("'and', 'or' or end of filter")
+        return node
+
+    def parse_or(self) -> Node:
+        children = [self.parse_and()]
+        while self.take("keyword", "or"):
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else ("or", tuple(children))
+
+    def parse_and(self) -> Node:
+        children = [self.parse_not()]
+        while self.take("keyword", "and"):
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else ("and", tuple(children))
+
+    def parse_not(self) -> Node:
+        if self.take("keyword", "not"):
+            return ("not", self.parse_not())
+        if self.take("op", "("):
+            node = self.parse_or()
+            if not self.take("op", ")"):
+                raise self.fail("')'")
+            return node
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Node:
+        kind, field, _ = self.peek()
+        if kind != "word":
+            raise self.fail("a field name")
+        self.index += 1
+        kind, op, _ = self.peek()
+        if not (kind == "op" and op not in "(),") and not (kind == "keyword" and op in ("in", "contains")):
+            raise self.fail(f"an operator after {field!r}")
+        self.index += 1
+        if op == "in":
+            if not self.take("op", "("):
+                raise self.fail("'('")
+            values = [self.parse_value()]
+            while self.take("op", ","):
+                values.append(self.parse_value())
+            if not self.take("op", ")"):
+                raise self.fail("')'")
+            return ("cmp", field, op, tuple(values))
+        return ("cmp", field, op, self.parse_value())
+
+    def parse_value(self) -> Tuple[str, str]:
+        kind, text, _ = self.peek()
+        if kind not in ("string", "number", "duration", "word"):
+            raise self.fail("a value")
+        self.index += 1
+        return (kind, text)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_filter(expression: str) -> Node:
+    """Parse a filter expression into its syntax tree.
+
+    Raises:
+        FilterError: If the expression is invalid.
+    """
+    if not expression.strip():
+        raise FilterError("Empty filter")
+    return _Parser(expression).parse()
+
+
+def _time_value(value: Tuple[str, str], now: float) -> str:
+    kind, text = value
+    if kind == "duration":
+        seconds = float(text[1:-1]) * _DURATION_UNITS[text[-1]]
+        return time.strftime(TIME_FORMAT, time.localtime(now - seconds))
+    try:
+        return datetime.fromisoformat(text).strftime(TIME_FORMAT)
+    except ValueError:
+        raise FilterError(f"Invalid time {text!r}, expected e.g. \"2025-06-10 12:00:00\" or -1h") from None
+
+
+# Relative cost of evaluating a comparison, to test the cheap ones first
+def _cost(node: Node) -> int:
+    if node[0] in ("and", "or"):
+        return sum(_cost(child) for child in node[1])
+    if node[0] == "not":
+        return _cost(node[1])
+    op = node[2]
+    return {"=~": 8, "~": 6, "contains": 4}.get(op, 1 if node[1] in STRING_FIELDS else 2)
+
+
+class _Compiler:
+    """Generate the source of a predicate, with values passed as constants."""
+
+    def __init__(self, now: float):
+        self.now = now
+        self.constants: Dict[str, Any] = {"_metric": job_metric}
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def compile(self, node: Node) -> str:
+        if node[0] in ("and", "or"):
+            children = sorted(node[1], key=_cost)
+            return "(" + f" {node[0]} ".join(self.compile(child) for child in children) + ")"
+        if node[0] == "not":
+            return f"(not {self.compile(node[1])})"
+        _, field, op, value = node
+        if field in STRING_FIELDS:
+            return self.compile_string(field, op, value)
+        if field in TIME_FIELDS:
+            return self.compile_time(field, op, value)
+        return self.compile_metric(field, op, value)
+
+    def compile_string(self, field: str, op: str, value: Any) -> str:
+        key = STRING_FIELDS[field]
+        if op in ("=", "!=", "in"):
+            # Membership in a set of the accepted spellings avoids a str() or upper() call per job
+            texts = [text for _, text in value] if op == "in" else [value[1]]
+            if field == "state":
+                subject = "(job.get('jobStatus') or job.get('status'))"
+                accepted = {spelling for text in texts for spelling in (text.upper(), text.lower(), text)}
+            elif field == "id":
+                subject = f"str(job.get({key!r}))"
+                accepted = set(texts)
+            else:
+                subject = f"job.get({key!r})"
+                accepted = set(texts)
+            return f"({subject} {'not in' if op == '!=' else 'in'} {self.constant(frozenset(accepted))})"
+        if field == "state":
+            subject = "str(job.get('jobStatus') or job.get('status') or '').upper()"
+        else:
+            subject = f"str(job.get({key!r}) or '')"
+        text = value[1]
+        if op == "~":
+            # States are matched in upper case, like the subject
+            glob = text.upper() if field == "state" else text
+            return f"({self.constant(re.compile(fnmatch.translate(glob)).match)}({subject}) is not None)"
+        if op == "=~":
+            try:
+                pattern = re.compile(text, re.IGNORECASE if field == "state" else 0)
+            except re.error as e:
+                raise FilterError(f"Invalid regular expression {text!r}: {e}") from None
+            return f"({self.constant(pattern.search)}({subject}) is not None)"
+        if op == "contains":
+            return f"({self.constant(text.lower())} in {subject}.lower())"
+        raise FilterError(f"Operator {op!r} is not supported for {field!r}")
+
+    def compile_time(self, field: str, op: str, value: Any) -> str:
+        if op not in ("<", "<=", ">", ">="):
+            raise FilterError(f"Operator {op!r} is not supported for {field!r}; use <, <=, > or >=")
+        threshold = self.constant(_time_value(value, self.now))
+        variable = f"_v{len(self.constants)}"
+        return f"(bool({variable} := job.get({TIME_FIELDS[field]!r})) and str({variable}) {op} {threshold})"
+
+    def compile_metric(self, field: str, op: str, value: Any) -> str:
+        if op not in ("=", "!=", "<", "<=", ">", ">="):
+            raise FilterError(f"Operator {op!r} is not supported for metric {field!r}")
+        if value[0] != "number":
+            raise FilterError(f"Metric {field!r} must be compared with a number, not {value[1]!r}")
+        name = field[len("metrics."):] if field.startswith("metrics.") else field
+        subject = f"_metric(job, {name!r})"
+        number = self.constant(float(value[1]))
+        if op == "!=":
+            variable = f"_v{len(self.constants)}"
+            return f"(({variable} := {subject}) == {variable} and {variable} != {number})"
+        return f"({subject} {'==' if op == '=' else op} {number})"
+
+
+def compile_filter(expression: str, now: Optional[float] = None) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a filter expression into a predicate over job dicts.
+
+    Args:
+        expression: Filter expression.
+        now: Reference time of relative times such as ``-1h`` (default: now).
+
+    Returns:
+        Function returning whether a job matches.
+
+    Raises:
+        FilterError: If the expression is invalid.
+    """
+    compiler = _Compiler(time.time() if now is None else now)
+    body = compiler.compile(parse_filter(expression))
+    namespace = dict(compiler.constants)
+    exec(f"def predicate(job):\n    return {body}\n", namespace)
+    predicate: Callable[[Dict[str, Any]], bool] = namespace["predicate"]
+    return predicate
+
+
+def required_states(expression: str) -> Optional[FrozenSet[str]]:
+    """States a job must be in to match, or None if the filter does not restrict them."""
+
+    def states(node: Node) -> Optional[FrozenSet[str]]:
+        if node[0] == "cmp":
+            _, field, op, value = node
+            if field != "state":
+                return None
+            if op == "=":
+                return frozenset({value[1].upper()})
+            if op == "in":
+                return frozenset(text.upper() for _, text in value)
+            return None
+        if node[0] == "and":
+            constrained = [found for found in map(states, node[1]) if found is not None]
+            return frozenset.intersection(*constrained) if constrained else None
+        if node[0] == "or":
+            found = [states(child) for child in node[1]]
+            if any(child is None for child in found):
+                return None
+            return frozenset().union(*found)  # type: ignore[arg-type]
+        return None
+
+    return states(parse_filter(expression))
+
+
+async def find_jobs(client: SeaTunnelAPI, expression: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Find the running and finished jobs matching a filter.
+
+    Only the listings of the states the filter allows are fetched, concurrently.
+
+    Args:
+        client: SeaTunnel client instance.
+        expression: Filter expression.
+        limit: Maximum number of jobs to return.
+
+    Returns:
+        Matching jobs, running ones first.
+
+    Raises:
+        FilterError: If the expression is invalid.
+    """
+    predicate = compile_filter(expression)
+    states = required_states(expression)
+    listings = []
+    if states is None or states - set(FINISHED_STATES):
+        listings.append(run_sync(client.get_running_jobs))
+    listings.extend(
+        run_sync(client.get_finished_jobs, state=state)
+        for state in FINISHED_STATES
+        if states is None or state in states
+    )
+
+    seen = set()
+    matches: List[Dict[str, Any]] = []
+    for payload in await asyncio.gather(*listings):
+        for job in filter(predicate, job_list(payload)):
+            # A job finishing between two listings shows up in both
+            job_id = job.get("jobId")
+            if job_id is None:
+                matches.append(job)
+            elif str(job_id) not in seen:
+                seen.add(str(job_id))
+                matches.append(job)
+    return matches if limit is None else list(itertools.islice(matches, max(0, limit)))
@@ -0,0 +1,263 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""MCP resources for SeaTunnel job state, with change subscriptions.
+
+All resource reads and subscriptions are served from one internal poller per
+server process: reads within the poll interval hit a shared snapshot, and
+subscribers get a ``notifications/resources/updated`` message when the
+snapshot of a subscribed resource changes, whether the poller or a read
+refreshed it. Snapshots of unsubscribed job resources are kept for at most
+``max_snapshots`` jobs, least recently read first out.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.server import NotificationOptions, Server, request_ctx
+from pydantic import AnyUrl
+
+from .client import SeaTunnelClient
+from .concurrency import bounded_gather, run_sync
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_SNAPSHOTS = 256
+
+RUNNING_JOBS_URI = "seatunnel://running-jobs"
+OVERVIEW_URI = "seatunnel://overview"
+MONITORING_URI = "seatunnel://system-monitoring-information"
+JOB_URI_PREFIX = "seatunnel://jobs/"
+
+
+class JobStateWatcher:
+    """Shared snapshots of SeaTunnel state, refreshed by a single poller."""
+
+    def __init__(
+        self,
+        client: SeaTunnelClient,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            client: SeaTunnel client instance.
+            poll_interval: Seconds between polls of subscribed resources; also
+                the maximum age of a snapshot served to readers.
+            max_snapshots: Maximum number of unsubscribed resources whose
+                snapshots are kept.
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._subscribers: Dict[str, "weakref.WeakSet[Any]"] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._poller: Optional[asyncio.Task] = None
+
+    def _fetcher(self, uri: str) -> Callable[[], Any]:
+        """Get the client call that produces a resource."""
+        if uri == RUNNING_JOBS_URI:
+            return self.client.get_running_jobs
+        if uri == OVERVIEW_URI:
+            return self.client.get_overview
+        if uri == MONITORING_URI:
+            return self.client.get_system_monitoring_information
+        if uri.startswith(JOB_URI_PREFIX) and len(uri) > len(JOB_URI_PREFIX):
+            job_id = uri[len(JOB_URI_PREFIX):]
+            return lambda: self.client.get_job_info(jobId=job_id)
+        raise ValueError(f"Unknown resource: {uri}")
+
+    async def _refresh(self, uri: str) -> bool:
+        """Fetch a resource and store its snapshot.
+
+        Concurrent refreshes of the same resource share one upstream request.
+
+        Returns:
+            Whether the content differs from the previous snapshot.
+        """
+        task = self._inflight.get(uri)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(uri))
+            self._inflight[uri] = task
+            task.add_done_callback(lambda _: self._inflight.pop(uri, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, uri: str) -> bool:
+        """Fetch a resource from upstream, store its snapshot and notify subscribers of a change."""
+        content = json.dumps(await run_sync(self._fetcher(uri)), sort_keys=True)
+        previous = self._snapshots.get(uri)
+        self._store(uri, content)
+        changed = previous is not None and previous[0] != content
+        if changed:
+            await self._notify(uri)
+        return changed
+
+    def _store(self, uri: str, content: str) -> None:
+        """Store a snapshot, evicting the least recently used unsubscribed ones beyond the limit."""
+        self._snapshots[uri] = (content, time.monotonic())
+        self._snapshots.move_to_end(uri)
+        unsubscribed = [u for u in self._snapshots if not self._subscribers.get(u)]
+        for u in unsubscribed[:max(0, len(unsubscribed) - self.max_snapshots)]:
+            del self._snapshots[u]
+
+    async def _notify(self, uri: str) -> None:
+        """Notify the subscribers of a resource that it changed."""
+        subscribers = self._subscribers.get(uri)
+        if not subscribers:
+            return
+        for session in list(subscribers):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception as e:
+                logger.debug(f"Dropping subscriber of {uri}: {e}")
+                subscribers.discard(session)
+
+    async def read(self, uri: str) -> str:
+        """Read a resource, from the shared snapshot when it is fresh enough.
+
+        Args:
+            uri: Resource URI.
+
+        Returns:
+            JSON content of the resource.
+        """
+        snapshot = self._snapshots.get(uri)
+        if snapshot is None or time.monotonic() - snapshot[1] >= self.poll_interval:
+            await self._refresh(uri)
+            snapshot = self._snapshots[uri]
+        else:
+            self._snapshots.move_to_end(uri)
+        return snapshot[0]
+
+    async def subscribe(self, uri: str, session: Any) -> None:
+        """Subscribe a session to updates of a resource.
+
+        Args:
+            uri: Resource URI.
+            session: MCP server session to notify.
+        """
+        self._fetcher(uri)  # Validate the URI
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+        if uri not in self._snapshots:
+            await self._refresh(uri)
+        if self._poller is None or self._poller.done():
+            # Start from an empty context so the poller does not carry the
+            # subscribing request's context around.
+            self._poller = asyncio.get_running_loop().create_task(
+                self._poll_loop(), context=contextvars.Context()
+            )
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        """Unsubscribe a session from updates of a resource."""
+        subscribers = self._subscribers.get(uri)
+        if subscribers is not None:
+            subscribers.discard(session)
+
+    async def poll_once(self) -> None:
+        """Refresh all subscribed resources, notifying subscribers of changes."""
+        for uri in [uri for uri, subscribers in self._subscribers.items() if not subscribers]:
+            del self._subscribers[uri]
+        uris = list(self._subscribers)
+        results = await bounded_gather(self._refresh, uris)
+        for uri, result in zip(uris, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to refresh resource {uri}: {result}")
+
+    async def _poll_loop(self) -> None:
+        """Poll subscribed resources until there are no subscribers left."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self.poll_once()
+            if not self._subscribers:
+                return
+
+
+def _advertise_subscriptions(lowlevel: Server) -> None:
+    """Make a low-level MCP server advertise resource subscriptions.
+
+    The base server always advertises ``subscribe=False``, even with a
+    subscribe handler registered.
+    """
+    get_capabilities = lowlevel.get_capabilities
+
+    def get_subscribable_capabilities(
+        notification_options: NotificationOptions,
+        experimental_capabilities: Dict[str, Dict[str, Any]],
+    ) -> types.ServerCapabilities:
+        capabilities = get_capabilities(notification_options, experimental_capabilities)
+        if capabilities.resources is not None and types.SubscribeRequest in lowlevel.request_handlers:
+            capabilities.resources = capabilities.resources.model_copy(update={"subscribe": True})
+        return capabilities
+
+    setattr(lowlevel, "get_capabilities", get_subscribable_capabilities)
+
+
+def register_resources(server: FastMCP, watcher: JobStateWatcher, subscriptions: bool = True) -> None:
+    """Register the SeaTunnel resources and subscription handlers on a server.
+
+    Args:
+        server: MCP server.
+        watcher: Watcher serving the resources.
+        subscriptions: Whether to handle subscriptions; a stateless server
+            has no session left to notify after the subscribing request.
+    """
+    @server.resource(RUNNING_JOBS_URI, name="running-jobs", mime_type="application/json",
+                     description="All currently running jobs")
+    async def running_jobs() -> str:
+        return await watcher.read(RUNNING_JOBS_URI)
+
+    @server.resource(OVERVIEW_URI, name="overview", mime_type="application/json",
+                     description="Overview of the SeaTunnel cluster")
+    async def overview() -> str:
+        return await watcher.read(OVERVIEW_URI)
+
+    @server.resource(MONITORING_URI, name="system-monitoring-information", mime_type="application/json",
+                     description="System monitoring information of the cluster nodes")
+    async def system_monitoring_information() -> str:
+        return await watcher.read(MONITORING_URI)
+
+    @server.resource(JOB_URI_PREFIX + "{jobId}", name="job", mime_type="application/json",
+                     description="Detailed information about a job")
+    async def job(jobId: str) -> str:
+        return await watcher.read(JOB_URI_PREFIX + jobId)
+
+    if not subscriptions:
+        return
+
+    lowlevel = server._mcp_server
+    if not isinstance(lowlevel, Server):
+        logger.warning(f"Resource subscriptions disabled: unsupported MCP server {type(lowlevel).__name__}")
+        return
+    _advertise_subscriptions(lowlevel)
+
+    @lowlevel.subscribe_resource()
+    async def subscribe(uri: AnyUrl) -> None:
+        await watcher.subscribe(str(uri), request_ctx.get().session)
+
+    @lowlevel.unsubscribe_resource()
+    async def unsubscribe(uri: AnyUrl) -> None:
+        watcher.unsubscribe(str(uri), request_ctx.get().session)
@@ -21,6 +21,7 @@ from pydantic import BaseModel, Field
 
 __all__ = [
     "ConnectionSettings",
+    "ConnectionProfile",
     "SubmitJobRequest",
     "SubmitJobUploadRequest",
     "SubmitJobsRequest",
@@ -36,6 +37,16 @@ class ConnectionSettings(BaseModel):
     has_api_key: bool = Field(..., description="Whether an API key is set")
 
 
+class ConnectionProfile(BaseModel):
+    """Named connection profile for a SeaTunnel cluster."""
+
+    name: str = Field(..., description="Profile name")
+    url: str = Field(..., description="Base URL of the SeaTunnel REST API")
+    api_key: Optional[str] = Field(None, description="API key for authentication")
+    timeout: float = Field(default=30.0, description="Request timeout in seconds")
+    max_connections: int = Field(default=20, description="Maximum number of pooled connections")
+
+
 class UpdateConnectionSettings(BaseModel):
     """Update connection settings for the SeaTunnel API."""
 
@@ -0,0 +1,281 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Export of a cluster snapshot for offline analysis.
+
+A snapshot holds the overview, the monitoring information, the running and
+finished job listings and the info of every job, one record per line. Records
+are written as they arrive, and job infos are fetched by a fixed number of
+workers, so memory does not grow with the number of jobs beyond the listings
+themselves.
+
+Every record is ``{"kind": ..., "data": ...}``, with ``jobId`` or ``state``
+where it applies; the first record describes the snapshot and the last one
+summarizes it. Failed fetches are recorded as ``error`` records.
+
+Records are handed to the writer in batches in a worker thread, since
+serializing and compressing them would otherwise hold up the event loop.
+"""
+
+import asyncio
+import datetime
+import functools
+import gzip
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import IO, Any, Callable, Dict, List, Optional
+
+from .client import SeaTunnelAPI
+from .concurrency import DEFAULT_MAX_CONCURRENCY, run_sync
+from .jobs import FINISHED_STATES, job_list
+from .progress import progress_reporter
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMATS = ("jsonl", "parquet")
+DEFAULT_EXPORT_DIR = "exports"
+# Rows per Parquet row group
+DEFAULT_BATCH_SIZE = 1000
+# Records handed to the writer at once
+WRITE_BATCH_SIZE = 256
+# Requests in flight at once that a tool call may ask for
+MAX_EXPORT_CONCURRENCY = 32
+
+
+def snapshot_format(path: str) -> str:
+    """Get the snapshot format implied by a file name."""
+    return "parquet" if path.endswith(".parquet") else "jsonl"
+
+
+def default_file_name(format: str = "jsonl") -> str:
+    """Get a timestamped snapshot file name."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return f"snapshot-{stamp}.parquet" if format == "parquet" else f"snapshot-{stamp}.jsonl.gz"
+
+
+class JsonlWriter:
+    """Write records as JSON lines, gzip-compressed if the path ends with ``.gz``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: IO[str] = (
+            gzip.open(path, "wt", encoding="utf-8") if path.endswith(".gz") else open(path, "w", encoding="utf-8")
+        )
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, default=str, separators=(",", ":")))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """Write records as zstd-compressed Parquet row groups.
+
+    Columns are ``kind``, ``jobId`` and ``state``, which analyses filter on,
+    and ``data`` with the rest of the record as JSON.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires the pyarrow package: pip install seatunnel-mcp[parquet]") from e
+        self.path = path
+        self.batch_size = batch_size
+        self._pa = pa
+        self._schema = pa.schema([
+            ("kind", pa.string()), ("jobId", pa.string()), ("state", pa.string()), ("data", pa.string()),
+        ])
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+        self._rows: Dict[str, List[Optional[str]]] = {name: [] for name in self._schema.names}
+
+    def write(self, record: Dict[str, Any]) -> None:
+        rest = {key: value for key, value in record.items() if key not in ("kind", "jobId", "state")}
+        self._rows["kind"].append(record["kind"])
+        self._rows["jobId"].append(None if record.get("jobId") is None else str(record["jobId"]))
+        self._rows["state"].append(record.get("state"))
+        # Fields besides the data, such as the source of an error, are kept with it
+        payload = rest["data"] if rest.keys() == {"data"} else rest
+        self._rows["data"].append(json.dumps(payload, default=str, separators=(",", ":")))
+        if len(self._rows["kind"]) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._rows["kind"]:
+            self._writer.write_table(self._pa.table(self._rows, schema=self._schema))
+            self._rows = {name: [] for name in self._schema.names}
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def open_writer(path: str, format: Optional[str] = None) -> Any:
+    """Open a snapshot writer for a path.
+
+    Args:
+        path: Output file.
+        format: ``jsonl`` or ``parquet``; implied by the file name by default.
+
+    Raises:
+        ValueError: If the format is unknown.
+        ImportError: If Parquet is requested without pyarrow installed.
+    """
+    format = format or snapshot_format(path)
+    if format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format {format!r}, expected one of {', '.join(SNAPSHOT_FORMATS)}")
+    return ParquetWriter(path) if format == "parquet" else JsonlWriter(path)
+
+
+async def export_snapshot(
+    client: SeaTunnelAPI,
+    writer: Any,
+    include_job_info: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Write a snapshot of a cluster.
+
+    Args:
+        client: SeaTunnel client instance.
+        writer: Open snapshot writer; it is not closed.
+        include_job_info: Whether to fetch the info of every listed job.
+        max_concurrency: Maximum number of requests in flight at once.
+
+    Returns:
+        Summary with the number of records by kind, failed fetches and duration.
+    """
+    reporter = progress_reporter()
+    start = time.perf_counter()
+    counts: Counter = Counter()
+
+    batch: List[Dict[str, Any]] = []
+    # Taken in the order batches are cut, so records keep their order
+    write_lock = asyncio.Lock()
+
+    def write_all(records: List[Dict[str, Any]]) -> None:
+        for record in records:
+            writer.write(record)
+
+    def emit(kind: str, data: Any, **fields: Any) -> None:
+        batch.append({"kind": kind, **fields, "data": data})
+        counts[kind] += 1
+
+    async def flush(force: bool = False) -> None:
+        nonlocal batch
+        if not batch or (len(batch) < WRITE_BATCH_SIZE and not force):
+            return
+        records, batch = batch, []
+        async with write_lock:
+            await run_sync(write_all, records)
+
+    emit("snapshot", {
+        "url": client.base_url,
+        "capturedAt": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    })
+
+    # Cluster-wide data and listings, written in the order they arrive
+    fetches: Dict[str, Callable[[], Any]] = {
+        "overview": client.get_overview,
+        "monitoring": client.get_system_monitoring_information,
+        "running": client.get_running_jobs,
+    }
+    for state in FINISHED_STATES:
+        fetches[state] = functools.partial(client.get_finished_jobs, state=state)
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(name: str) -> Any:
+        async with semaphore:
+            try:
+                return name, await run_sync(fetches[name]), None
+            except Exception as e:
+                return name, None, e
+
+    # Job IDs in listing order, without the duplicates of jobs that finished in between
+    job_ids: Dict[str, None] = {}
+    for next_result in asyncio.as_completed([fetch(name) for name in fetches]):
+        name, result, error = await next_result
+        if error is not None:
+            logger.warning(f"Failed to fetch {name} for the snapshot: {error}")
+            emit("error", str(error), source=name)
+        elif name in ("overview", "monitoring"):
+            emit(name, result)
+        else:
+            kind, fields = ("running_job", {}) if name == "running" else ("finished_job", {"state": name})
+            for job in job_list(result):
+                emit(kind, job, jobId=job.get("jobId"), **fields)
+                if job.get("jobId") is not None:
+                    job_ids.setdefault(str(job["jobId"]), None)
+                await flush()
+            del result
+        await flush()
+
+    if include_job_info and job_ids:
+        total = len(job_ids)
+        done = 0
+        pending = iter(job_ids)
+
+        # A fixed pool of workers pulling from one iterator keeps at most
+        # max_concurrency job infos in memory.
+        async def worker() -> None:
+            nonlocal done
+            for job_id in pending:
+                try:
+                    emit("job_info", await run_sync(client.get_job_info, job_id), jobId=job_id)
+                except Exception as e:
+                    emit("error", str(e), source="job-info", jobId=job_id)
+                await flush()
+                done += 1
+                reporter.report(done, total, message=f"{done}/{total} job infos exported")
+
+        await asyncio.gather(*(worker() for _ in range(min(max(1, max_concurrency), total))))
+
+    summary = {
+        "jobs": len(job_ids),
+        "records": dict(counts),
+        "errors": counts["error"],
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    emit("summary", summary)
+    await flush(force=True)
+    return summary
+
+
+async def export_snapshot_to(
+    client: SeaTunnelAPI,
+    path: str,
+    format: Optional[str] = None,
+    include_job_info: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Write a snapshot of a cluster to a file.
+
+    Returns:
+        The summary of :func:`export_snapshot`, with the path and size of the file.
+    """
+    writer = open_writer(path, format)
+    try:
+        summary = await export_snapshot(client, writer, include_job_info, max_concurrency)
+    finally:
+        # Closing writes the last row group or the gzip trailer
+        await run_sync(writer.close)
+    return {"path": os.path.abspath(path), "bytes": os.path.getsize(path), **summary}
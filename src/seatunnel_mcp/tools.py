@@ -18,18 +18,46 @@
 
 import json
 import logging
+import os
 from typing import Dict, List, Any, Optional, Union, Callable, Iterable
 from functools import wraps
 
 from mcp.server.fastmcp.tools import Tool
 from mcp.types import TextContent, ImageContent, EmbeddedResource
 
-from .client import SeaTunnelClient
+from . import bulk, dag, monitoring, nodes, snapshot
+from . import query as query_module
+from .batching import SubmitJobBatcher
+from .chunking import ContinuationBuffer
+from .client import SeaTunnelAPI
+from .concurrency import DEFAULT_MAX_CONCURRENCY, run_sync
+from .federation import Federation
+from .metrics import instrument_tool
+from .profiles import ClientRegistry
+from .profiling import SamplingProfiler
+from .progress import progress_reporter
+from .tracing import trace_tool
 
 logger = logging.getLogger(__name__)
 
+# Tools whose effect lasts for the rest of the MCP session
+SESSION_TOOLS = (
+    "update-connection-settings",
+    "use-profile",
+)
 
-def get_connection_settings_tool(client: SeaTunnelClient) -> Callable:
+# Tools whose results can grow with the size of the cluster or its history
+CHUNKED_TOOLS = (
+    "get-running-jobs",
+    "get-finished-jobs",
+    "get-system-monitoring-information",
+    "find-jobs",
+    "get-federated-running-jobs",
+    "get-federated-finished-jobs",
+)
+
+
+def get_connection_settings_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving connection settings.
 
     Args:
@@ -49,7 +77,7 @@ def get_connection_settings_tool(client: SeaTunnelClient) -> Callable:
     return get_connection_settings
 
 
-def update_connection_settings_tool(client: SeaTunnelClient) -> Callable:
+def update_connection_settings_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for updating connection settings.
 
     Args:
@@ -77,11 +105,204 @@ def update_connection_settings_tool(client: SeaTunnelClient) -> Callable:
     return update_connection_settings
 
 
-def submit_job_tool(client: SeaTunnelClient) -> Callable:
+def list_profiles_tool(registry: ClientRegistry) -> Callable:
+    """Get a tool for listing connection profiles.
+
+    Args:
+        registry: Client registry instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def list_profiles() -> List[Dict[str, Any]]:
+        """List connection profiles."""
+        result = registry.list_profiles()
+        return result
+
+    list_profiles.__name__ = "list-profiles"
+    list_profiles.__doc__ = "List the configured SeaTunnel connection profiles and which one this session uses"
+
+    return list_profiles
+
+
+def use_profile_tool(registry: ClientRegistry) -> Callable:
+    """Get a tool for switching the connection profile of the session.
+
+    Args:
+        registry: Client registry instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def use_profile(profile: str) -> Dict[str, Any]:
+        """Switch the connection profile of the current session.
+
+        Args:
+            profile: Profile name.
+
+        Returns:
+            The selected profile's connection settings.
+        """
+        selected = registry.use_profile(profile)
+        return {"profile": selected.name, "url": selected.url, "has_api_key": selected.api_key is not None}
+
+    use_profile.__name__ = "use-profile"
+    use_profile.__doc__ = (
+        "Switch this session to another named SeaTunnel connection profile; other sessions are not affected"
+    )
+
+    return use_profile
+
+
+def federated_tools(federation: Federation) -> List[Callable]:
+    """Get the tools querying all federated clusters at once.
+
+    Args:
+        federation: Federation of the clusters.
+
+    Returns:
+        Functions that can be registered as tools.
+    """
+    clusters = ", ".join(federation.clusters)
+
+    async def get_federated_overview() -> Dict[str, Any]:
+        """Get the overview of every federated cluster and their totals."""
+        return await federation.overview()
+
+    async def get_federated_running_jobs() -> Dict[str, Any]:
+        """List the running jobs of every federated cluster."""
+        return await federation.running_jobs()
+
+    async def get_federated_finished_jobs(state: str) -> Dict[str, Any]:
+        """List the finished jobs in a state of every federated cluster.
+
+        Args:
+            state: Job state (FINISHED, CANCELED, FAILED, UNKNOWABLE).
+        """
+        return await federation.finished_jobs(state)
+
+    async def get_federated_job_info(jobId: Union[str, int], cluster: Optional[str] = None) -> Dict[str, Any]:
+        """Get a job from the federated cluster that owns it.
+
+        Args:
+            jobId: Job ID.
+            cluster: Cluster owning the job; found automatically if omitted.
+        """
+        return await federation.call_owner("get_job_info", jobId, cluster)
+
+    async def stop_federated_job(
+        jobId: Union[str, int], isStartWithSavePoint: bool = False, cluster: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Stop a job on the federated cluster that owns it.
+
+        Args:
+            jobId: Job ID.
+            isStartWithSavePoint: Whether to stop with savepoint.
+            cluster: Cluster owning the job; found automatically if omitted.
+        """
+        return await federation.call_owner("stop_job", jobId, cluster, isStartWithSavePoint=isStartWithSavePoint)
+
+    partial = f"within {federation.deadline:g}s; clusters that fail or respond later are listed under errors"
+    get_federated_overview.__name__ = "get-federated-overview"
+    get_federated_overview.__doc__ = (
+        f"Get the overview of each federated cluster ({clusters}) and the totals over all of them, "
+        f"queried concurrently {partial}"
+    )
+    get_federated_running_jobs.__name__ = "get-federated-running-jobs"
+    get_federated_running_jobs.__doc__ = (
+        f"List the running jobs of all federated clusters ({clusters}), each tagged with its cluster, "
+        f"queried concurrently {partial}"
+    )
+    get_federated_finished_jobs.__name__ = "get-federated-finished-jobs"
+    get_federated_finished_jobs.__doc__ = (
+        f"List the finished jobs in a state (FINISHED, CANCELED, FAILED, UNKNOWABLE) of all federated "
+        f"clusters ({clusters}), each tagged with its cluster, queried concurrently {partial}"
+    )
+    get_federated_job_info.__name__ = "get-federated-job-info"
+    get_federated_job_info.__doc__ = (
+        "Get detailed information about a job from whichever federated cluster owns it; the cluster is "
+        "remembered from earlier federated listings or looked up on all clusters"
+    )
+    stop_federated_job.__name__ = "stop-federated-job"
+    stop_federated_job.__doc__ = (
+        "Stop a job, with an optional isStartWithSavePoint flag, on whichever federated cluster owns it"
+    )
+
+    return [
+        get_federated_overview,
+        get_federated_running_jobs,
+        get_federated_finished_jobs,
+        get_federated_job_info,
+        stop_federated_job,
+    ]
+
+
+def get_profile_summary_tool(profiler: SamplingProfiler) -> Callable:
+    """Get a tool for summarizing the tool profiler's hotspots.
+
+    Args:
+        profiler: Sampling profiler instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def get_profile_summary(top: int = 20) -> Dict[str, Any]:
+        """Summarize the hottest functions seen by the tool profiler.
+
+        Args:
+            top: Number of functions to return.
+
+        Returns:
+            Sample counts per profiled call and the top hotspots.
+        """
+        result = profiler.summary(top)
+        return result
+
+    get_profile_summary.__name__ = "get-profile-summary"
+    get_profile_summary.__doc__ = (
+        "Get the top hotspots (self and total share of samples) of sampled tool calls and SeaTunnel client calls"
+    )
+
+    return get_profile_summary
+
+
+def fetch_continuation_tool(continuations: ContinuationBuffer) -> Callable:
+    """Get a tool for fetching the next chunk of an oversized tool result.
+
+    Args:
+        continuations: Buffer of the chunked results.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def fetch_continuation(continuation: str) -> Dict[str, Any]:
+        """Fetch the next chunk of a chunked result.
+
+        Args:
+            continuation: Continuation token of the previous chunk.
+
+        Returns:
+            The next chunk, with the token of the following one or null.
+        """
+        return continuations.fetch(continuation)
+
+    fetch_continuation.__name__ = "fetch-continuation"
+    fetch_continuation.__doc__ = (
+        "Fetch the next chunk of a result that was too large to return at once. Such results come back as "
+        "{items or text, offset, total, continuation}: pass the continuation token here until it is null. "
+        "Item chunks are pages of the result list; text chunks are pieces of its JSON to be concatenated. "
+        "Tokens expire after a few minutes of inactivity"
+    )
+
+    return fetch_continuation
+
+
+def submit_job_tool(client: SeaTunnelAPI, batcher: Optional[SubmitJobBatcher] = None) -> Callable:
     """Get a tool for submitting a job.
 
     Args:
         client: SeaTunnel client instance.
+        batcher: Optional batcher that merges concurrent submissions into /submit-jobs.
 
     Returns:
         Function that can be registered as a tool.
@@ -105,7 +326,16 @@ def submit_job_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.submit_job(
+        if batcher is not None:
+            return await batcher.submit_job(
+                job_content=job_content,
+                jobName=jobName,
+                jobId=jobId,
+                isStartWithSavePoint=isStartWithSavePoint,
+                format=format,
+            )
+        result = await run_sync(
+            client.submit_job,
             job_content=job_content,
             jobName=jobName,
             jobId=jobId,
@@ -120,7 +350,7 @@ def submit_job_tool(client: SeaTunnelClient) -> Callable:
     return submit_job
 
 
-def submit_job_upload_tool(client: SeaTunnelClient) -> Callable:
+def submit_job_upload_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for submitting a job using file upload.
 
     Args:
@@ -150,7 +380,10 @@ def submit_job_upload_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.submit_job_upload(
+        # Create the progress reporter here so the upload in the worker thread can use it
+        progress_reporter()
+        result = await run_sync(
+            client.submit_job_upload,
             config_file=config_file,
             jobName=jobName,
             jobId=jobId,
@@ -165,7 +398,7 @@ def submit_job_upload_tool(client: SeaTunnelClient) -> Callable:
     return submit_job_upload
 
 
-def submit_jobs_tool(client: SeaTunnelClient) -> Callable:
+def submit_jobs_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for submitting multiple jobs in batch.
 
     Args:
@@ -176,7 +409,7 @@ def submit_jobs_tool(client: SeaTunnelClient) -> Callable:
     """
     async def submit_jobs(
         request_body: Any
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Submit multiple jobs in batch.
 
         Args:
@@ -186,7 +419,7 @@ def submit_jobs_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.submit_jobs(request_body=request_body)
+        result = await run_sync(client.submit_jobs, request_body=request_body)
         return result
 
     submit_jobs.__name__ = "submit-jobs"
@@ -195,7 +428,7 @@ def submit_jobs_tool(client: SeaTunnelClient) -> Callable:
     return submit_jobs
 
 
-def stop_job_tool(client: SeaTunnelClient) -> Callable:
+def stop_job_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for stopping a running job.
 
     Args:
@@ -214,16 +447,146 @@ def stop_job_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.stop_job(jobId=jobId, isStartWithSavePoint=isStartWithSavePoint)
+        result = await run_sync(client.stop_job, jobId=jobId, isStartWithSavePoint=isStartWithSavePoint)
         return result
 
     stop_job.__name__ = "stop-job"
     stop_job.__doc__ = "Stop a running job by providing the jobId and optional isStartWithSavePoint flag"
-    
+
     return stop_job
 
 
-def get_job_info_tool(client: SeaTunnelClient) -> Callable:
+def stop_jobs_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for stopping many jobs concurrently.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def stop_jobs(
+        jobIds: Optional[List[Union[str, int]]] = None,
+        jobNamePattern: Optional[str] = None,
+        isStopWithSavePoint: bool = False,
+        maxConcurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Stop many jobs concurrently.
+
+        Args:
+            jobIds: IDs of the jobs to stop.
+            jobNamePattern: Glob matched against the names of running jobs, used when jobIds is not given.
+            isStopWithSavePoint: Whether to stop with savepoint.
+            maxConcurrency: Maximum number of stop requests in flight.
+
+        Returns:
+            Stopped job IDs and per-job failures.
+        """
+        job_ids: List[Union[str, int]]
+        if jobIds is not None:
+            job_ids = jobIds
+        elif jobNamePattern is not None:
+            job_ids = list(await bulk.select_running_job_ids(client, jobNamePattern))
+        else:
+            raise ValueError("Either jobIds or jobNamePattern must be provided")
+        result = await bulk.stop_jobs(
+            client,
+            job_ids,
+            isStopWithSavePoint=isStopWithSavePoint,
+            max_concurrency=maxConcurrency,
+        )
+        return result
+
+    stop_jobs.__name__ = "stop-jobs"
+    stop_jobs.__doc__ = (
+        "Stop many jobs concurrently, given a list of jobIds or a glob over running job names, "
+        "with an optional savepoint"
+    )
+
+    return stop_jobs
+
+
+def rolling_restart_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for restarting jobs in waves through savepoints.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def rolling_restart(
+        jobs: List[Dict[str, Any]],
+        waveSize: int = bulk.DEFAULT_WAVE_SIZE,
+        pollInterval: float = bulk.DEFAULT_POLL_INTERVAL,
+        stopTimeout: float = bulk.DEFAULT_STOP_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """Restart jobs in waves through savepoints.
+
+        Args:
+            jobs: Entries with jobId and job_content, and optionally jobName and format.
+            waveSize: Number of jobs restarted concurrently per wave.
+            pollInterval: Seconds between job state polls while waiting for a stop.
+            stopTimeout: Maximum number of seconds to wait for each stop.
+
+        Returns:
+            Restarted job IDs and per-job failures.
+        """
+        result = await bulk.rolling_restart(
+            client,
+            jobs,
+            wave_size=waveSize,
+            poll_interval=pollInterval,
+            stop_timeout=stopTimeout,
+        )
+        return result
+
+    rolling_restart.__name__ = "rolling-restart"
+    rolling_restart.__doc__ = (
+        "Restart jobs in waves: stop each with a savepoint, wait for the savepoint, "
+        "then resubmit its configuration with isStartWithSavePoint=true"
+    )
+
+    return rolling_restart
+
+
+def wait_for_job_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for waiting until a job has finished.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def wait_for_job(
+        jobId: Union[str, int],
+        pollInterval: float = bulk.DEFAULT_POLL_INTERVAL,
+        timeout: float = bulk.DEFAULT_STOP_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """Wait until a job reaches a terminal state.
+
+        Args:
+            jobId: Job ID. Can be a string or integer.
+            pollInterval: Seconds between job state polls.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            The job ID and its terminal status.
+        """
+        status = await bulk.wait_for_terminal_state(client, jobId, pollInterval, timeout)
+        return {"jobId": str(jobId), "jobStatus": status}
+
+    wait_for_job.__name__ = "wait-for-job"
+    wait_for_job.__doc__ = (
+        "Wait until a job reaches a terminal state (FINISHED, CANCELED, FAILED, SAVEPOINT_DONE, UNKNOWABLE), "
+        "reporting progress while polling"
+    )
+
+    return wait_for_job
+
+
+def get_job_info_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving job information.
 
     Args:
@@ -241,7 +604,7 @@ def get_job_info_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.get_job_info(jobId=jobId)
+        result = await run_sync(client.get_job_info, jobId=jobId)
         return result
     
     get_job_info.__name__ = "get-job-info"
@@ -250,7 +613,7 @@ def get_job_info_tool(client: SeaTunnelClient) -> Callable:
     return get_job_info
 
 
-def get_running_job_tool(client: SeaTunnelClient) -> Callable:
+def get_running_job_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving information about a running job.
 
     Args:
@@ -268,7 +631,7 @@ def get_running_job_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.get_running_job(jobId=jobId)
+        result = await run_sync(client.get_running_job, jobId=jobId)
         return result
     
     get_running_job.__name__ = "get-running-job"
@@ -277,7 +640,7 @@ def get_running_job_tool(client: SeaTunnelClient) -> Callable:
     return get_running_job
 
 
-def get_running_jobs_tool(client: SeaTunnelClient) -> Callable:
+def get_running_jobs_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving all running jobs.
 
     Args:
@@ -286,13 +649,13 @@ def get_running_jobs_tool(client: SeaTunnelClient) -> Callable:
     Returns:
         Function that can be registered as a tool.
     """
-    async def get_running_jobs() -> Dict[str, Any]:
+    async def get_running_jobs() -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Get all running jobs.
 
         Returns:
             Response from the API.
         """
-        result = client.get_running_jobs()
+        result = await run_sync(client.get_running_jobs)
         return result
     
     get_running_jobs.__name__ = "get-running-jobs"
@@ -301,7 +664,7 @@ def get_running_jobs_tool(client: SeaTunnelClient) -> Callable:
     return get_running_jobs
 
 
-def get_finished_jobs_tool(client: SeaTunnelClient) -> Callable:
+def get_finished_jobs_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving all finished jobs by state.
 
     Args:
@@ -310,7 +673,7 @@ def get_finished_jobs_tool(client: SeaTunnelClient) -> Callable:
     Returns:
         Function that can be registered as a tool.
     """
-    async def get_finished_jobs(state: str) -> Dict[str, Any]:
+    async def get_finished_jobs(state: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Get all finished jobs by state.
 
         Args:
@@ -319,7 +682,7 @@ def get_finished_jobs_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.get_finished_jobs(state=state)
+        result = await run_sync(client.get_finished_jobs, state=state)
         return result
     
     get_finished_jobs.__name__ = "get-finished-jobs"
@@ -328,7 +691,231 @@ def get_finished_jobs_tool(client: SeaTunnelClient) -> Callable:
     return get_finished_jobs
 
 
-def get_overview_tool(client: SeaTunnelClient) -> Callable:
+def find_jobs_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for finding jobs with a filter expression.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    async def find_jobs(query: str, limit: Optional[int] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Find running and finished jobs matching a filter expression.
+
+        Args:
+            query: Filter expression.
+            limit: Maximum number of jobs to return.
+
+        Returns:
+            Matching jobs.
+        """
+        return await query_module.find_jobs(client, query, limit)
+
+    find_jobs.__name__ = "find-jobs"
+    find_jobs.__doc__ = (
+        "Find running and finished jobs matching a filter expression, e.g. "
+        "'state = FAILED and name ~ \"cdc_*\" and finished > -1h and error contains timeout'. "
+        "Fields: state, name, id, error (=, !=, in (A, B), ~ glob, =~ regex, contains), "
+        "created, finished (<, <=, >, >= a time like \"2025-06-10 12:00:00\" or a duration ago like -1h, -30m, -2d), "
+        "and job metrics such as SourceReceivedCount or SinkWriteQPS (=, !=, <, <=, >, >= a number). "
+        "Combine with and, or, not and parentheses. Restricting state avoids fetching unneeded listings"
+    )
+
+    return find_jobs
+
+
+def top_jobs_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for ranking running jobs by a metric.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    # Shared by all calls, so that rates are measured between consecutive calls
+    deltas = monitoring.CounterDeltas()
+
+    async def top_jobs(
+        metric: str = "records_per_second", n: int = monitoring.DEFAULT_TOP, smallest: bool = False
+    ) -> Dict[str, Any]:
+        """Rank the running jobs by a metric.
+
+        Args:
+            metric: Metric to rank by.
+            n: Number of jobs to return.
+            smallest: Return the lowest values instead of the highest.
+
+        Returns:
+            The top jobs with their values.
+        """
+        return await monitoring.top_jobs(client, deltas, metric=metric, n=n, smallest=smallest)
+
+    top_jobs.__name__ = "top-jobs"
+    top_jobs.__doc__ = (
+        "Get the n running jobs with the highest (or with smallest=true, lowest) value of a metric: "
+        "records_per_second, bytes_per_second, sink_records_per_second, sink_bytes_per_second, "
+        "lag (records read but not yet written), received_delta (records read per second since the "
+        "previous top-jobs call) or any raw job metric name such as SourceReceivedCount"
+    )
+
+    return top_jobs
+
+
+def get_node_hotspots_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for ranking the cluster nodes by pressure.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    # Shared by all calls, so that GC rates and pressure history come from consecutive calls
+    hotspots = nodes.NodeHotspots()
+
+    async def get_node_hotspots(sortBy: str = "pressure", n: int = nodes.DEFAULT_TOP) -> Dict[str, Any]:
+        """Rank the cluster nodes by pressure.
+
+        Args:
+            sortBy: Column to rank the nodes by.
+            n: Number of nodes to return.
+
+        Returns:
+            A table of the top nodes with their outliers, and the cluster medians.
+        """
+        return await nodes.node_hotspots(client, hotspots, sort_by=sortBy, n=n)
+
+    get_node_hotspots.__name__ = "get-node-hotspots"
+    get_node_hotspots.__doc__ = (
+        "Rank the cluster nodes by pressure (mean of heap usage, process CPU load and GC activity) or by "
+        f"any of {', '.join(nodes.COLUMNS)}, as a compact table instead of the raw monitoring information. "
+        "Figures well above the cluster median are listed as the node's outliers. GC rates and the "
+        "average pressure are measured between calls, so call it again after a while to get them"
+    )
+
+    return get_node_hotspots
+
+
+def analyze_job_dag_tool(client: SeaTunnelAPI) -> Callable:
+    """Get a tool for analyzing the DAG of a job.
+
+    Args:
+        client: SeaTunnel client instance.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+    # Shared by all calls, so that each DAG is parsed once and rates are
+    # measured between consecutive calls
+    analyzer = dag.DagAnalyzer()
+
+    async def analyze_job_dag(jobId: str) -> Dict[str, Any]:
+        """Analyze the DAG of a job.
+
+        Args:
+            jobId: Job ID.
+
+        Returns:
+            The vertices with their throughput, backpressure hints and the bottleneck.
+        """
+        return await dag.analyze_job_dag(client, analyzer, jobId)
+
+    analyze_job_dag.__name__ = "analyze-job-dag"
+    analyze_job_dag.__doc__ = (
+        "Analyze the DAG of a job: its vertices with their record counts and records per second, "
+        "backpressure hints (records read by the sources but not yet written by a sink, and how fast "
+        "that gap grows) and the bottleneck vertex. Rates are measured between calls, so call it "
+        "again after a while to see whether gaps grow"
+    )
+
+    return analyze_job_dag
+
+
+def export_snapshot_tool(client: SeaTunnelAPI, export_dir: str = snapshot.DEFAULT_EXPORT_DIR) -> Callable:
+    """Get a tool for exporting a snapshot of the cluster to a file.
+
+    Args:
+        client: SeaTunnel client instance.
+        export_dir: Directory the snapshots are written to.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+
+    async def export_snapshot(
+        fileName: Optional[str] = None,
+        format: Optional[str] = None,
+        includeJobInfo: bool = True,
+        maxConcurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Export a snapshot of the cluster to a file.
+
+        Args:
+            fileName: Name of the file in the export directory; timestamped by default.
+            format: jsonl or parquet; implied by the file name by default.
+            includeJobInfo: Whether to export the info of every job.
+            maxConcurrency: Maximum number of requests in flight at once, at
+                most ``MAX_EXPORT_CONCURRENCY``.
+
+        Returns:
+            The path and size of the file and the number of records by kind.
+        """
+        file_name = fileName or snapshot.default_file_name(format or "jsonl")
+        if os.path.basename(file_name) != file_name or file_name.startswith("."):
+            raise ValueError(f"Invalid snapshot file name: {file_name}")
+        os.makedirs(export_dir, exist_ok=True)
+        return await snapshot.export_snapshot_to(
+            client,
+            os.path.join(export_dir, file_name),
+            format=format,
+            include_job_info=includeJobInfo,
+            max_concurrency=min(maxConcurrency, snapshot.MAX_EXPORT_CONCURRENCY),
+        )
+
+    export_snapshot.__name__ = "export-snapshot"
+    export_snapshot.__doc__ = (
+        f"Export a snapshot of the cluster for offline analysis into a file of the server's {export_dir} "
+        "directory: the overview, monitoring information, running and finished jobs of all states and "
+        "the info of every job, as gzip-compressed JSON lines (.jsonl.gz) or Parquet (.parquet, needs "
+        f"pyarrow). Job infos are fetched with up to {snapshot.MAX_EXPORT_CONCURRENCY} concurrent requests and "
+        "progress is reported"
+    )
+
+    return export_snapshot
+
+
+def get_stalled_jobs_tool(detector: monitoring.StallDetector) -> Callable:
+    """Get a tool for finding stalled and degrading running jobs.
+
+    Args:
+        detector: Stall detector tracking the running jobs.
+
+    Returns:
+        Function that can be registered as a tool.
+    """
+
+    async def get_stalled_jobs() -> Dict[str, Any]:
+        """Find the running jobs that stopped making progress or slowed down.
+
+        Returns:
+            The stalled and degrading jobs.
+        """
+        return await detector.check()
+
+    get_stalled_jobs.__name__ = "get-stalled-jobs"
+    get_stalled_jobs.__doc__ = (
+        "Find running jobs that stopped making progress or slowed down, from their read and write "
+        "counters tracked in the background: stalled (nothing read or written for several polls), "
+        "sink_stalled (reading but not writing) or degrading (write rate well below its baseline). "
+        "Tracking starts with the first call, so stalls show up after a few polls"
+    )
+
+    return get_stalled_jobs
+
+
+def get_overview_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving cluster overview.
 
     Args:
@@ -346,7 +933,7 @@ def get_overview_tool(client: SeaTunnelClient) -> Callable:
         Returns:
             Response from the API.
         """
-        result = client.get_overview(tags=tags)
+        result = await run_sync(client.get_overview, tags=tags)
         return result
     
     get_overview.__name__ = "get-overview"
@@ -355,7 +942,7 @@ def get_overview_tool(client: SeaTunnelClient) -> Callable:
     return get_overview
 
 
-def get_system_monitoring_information_tool(client: SeaTunnelClient) -> Callable:
+def get_system_monitoring_information_tool(client: SeaTunnelAPI) -> Callable:
     """Get a tool for retrieving system monitoring information.
 
     Args:
@@ -364,13 +951,13 @@ def get_system_monitoring_information_tool(client: SeaTunnelClient) -> Callable:
     Returns:
         Function that can be registered as a tool.
     """
-    async def get_system_monitoring_information() -> Dict[str, Any]:
+    async def get_system_monitoring_information() -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Get system monitoring information.
 
         Returns:
             Response from the API.
         """
-        result = client.get_system_monitoring_information()
+        result = await run_sync(client.get_system_monitoring_information)
         return result
     
     get_system_monitoring_information.__name__ = "get-system-monitoring-information"
@@ -379,26 +966,73 @@ def get_system_monitoring_information_tool(client: SeaTunnelClient) -> Callable:
     return get_system_monitoring_information
 
 
-def get_all_tools(client: SeaTunnelClient) -> List[Callable]:
+def get_all_tools(
+    client: SeaTunnelAPI,
+    submit_batcher: Optional[SubmitJobBatcher] = None,
+    registry: Optional[ClientRegistry] = None,
+    profiler: Optional[SamplingProfiler] = None,
+    continuations: Optional[ContinuationBuffer] = None,
+    stall_detector: Optional[monitoring.StallDetector] = None,
+    federation: Optional[Federation] = None,
+    export_dir: str = snapshot.DEFAULT_EXPORT_DIR,
+    stateless: bool = False,
+) -> List[Callable]:
     """Get all MCP tools.
 
     Args:
-        client: SeaTunnelClient instance.
+        client: SeaTunnel client instance.
+        submit_batcher: Optional batcher used by the submit-job tool.
+        registry: Optional client registry; enables the connection profile tools.
+        profiler: Optional sampling profiler; profiles the tools and enables
+            the get-profile-summary tool.
+        continuations: Optional continuation buffer; chunks oversized results
+            of the list tools and enables the fetch-continuation tool.
+        stall_detector: Optional stall detector used by the get-stalled-jobs
+            tool; one with the default settings is created if omitted.
+        federation: Optional federation of clusters; enables the federated tools.
+        export_dir: Directory the export-snapshot tool writes to.
+        stateless: Whether every request runs in a new MCP session, as with
+            stateless streamable HTTP; omits the tools bound to the session.
 
     Returns:
         List of all tool functions.
     """
-    return [
+    tools = [
         get_connection_settings_tool(client),
         update_connection_settings_tool(client),
-        submit_job_tool(client),
+        submit_job_tool(client, submit_batcher),
         submit_job_upload_tool(client),
         submit_jobs_tool(client),
         stop_job_tool(client),
+        stop_jobs_tool(client),
+        rolling_restart_tool(client),
+        wait_for_job_tool(client),
         get_job_info_tool(client),
         get_running_job_tool(client),
         get_running_jobs_tool(client),
         get_finished_jobs_tool(client),
+        find_jobs_tool(client),
+        top_jobs_tool(client),
+        analyze_job_dag_tool(client),
+        get_stalled_jobs_tool(stall_detector or monitoring.StallDetector(client)),
+        export_snapshot_tool(client, export_dir),
         get_overview_tool(client),
         get_system_monitoring_information_tool(client),
-    ] 
\ No newline at end of file
+        get_node_hotspots_tool(client),
+    ]
+    if registry is not None:
+        tools += [
+            list_profiles_tool(registry),
+            use_profile_tool(registry),
+        ]
+    if stateless:
+        tools = [tool for tool in tools if tool.__name__ not in SESSION_TOOLS]
+    if federation is not None:
+        tools += federated_tools(federation)
+    if continuations is not None:
+        tools = [continuations.wrap_tool(tool) if tool.__name__ in CHUNKED_TOOLS else tool for tool in tools]
+        tools.append(fetch_continuation_tool(continuations))
+    if profiler is not None:
+        tools = [profiler.wrap_tool(tool) for tool in tools]
+        tools.append(get_profile_summary_tool(profiler))
+    return [trace_tool(instrument_tool(tool)) for tool in tools] 
\ No newline at end of file
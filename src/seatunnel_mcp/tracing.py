@@ -0,0 +1,169 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Optional OpenTelemetry tracing of tool calls, client methods and HTTP requests.
+
+Tracing needs the ``opentelemetry-api`` package and is off by default. It is
+switched on with ``enable()``, which instruments ``SeaTunnelClient`` in place;
+``trace_tool`` only wraps tools while tracing is enabled. When tracing is off
+nothing is wrapped, so it costs nothing at all.
+
+Exporters are configured through the OpenTelemetry SDK as usual, e.g. by
+running the server under ``opentelemetry-instrument`` with ``OTEL_*``
+environment variables.
+"""
+
+import functools
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from .client import SeaTunnelClient
+from .metrics import endpoint_template
+
+# SeaTunnelClient methods traced with one span per call.
+CLIENT_METHODS = (
+    "submit_job",
+    "submit_jobs",
+    "submit_job_upload",
+    "stop_job",
+    "get_job_info",
+    "get_running_job",
+    "get_running_jobs",
+    "get_finished_jobs",
+    "get_overview",
+    "get_system_monitoring_information",
+)
+
+_tracer: Optional[Any] = None
+_originals: Dict[str, Callable] = {}
+
+
+def is_enabled() -> bool:
+    """Whether tracing is enabled."""
+    return _tracer is not None
+
+
+def enable(tracer_provider: Optional[Any] = None) -> None:
+    """Enable tracing and instrument ``SeaTunnelClient``.
+
+    Tools must be created after this call to be traced.
+
+    Args:
+        tracer_provider: Optional tracer provider; defaults to the global one.
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed.
+    """
+    global _tracer
+    if _tracer is not None:
+        return
+    try:
+        from opentelemetry import trace
+    except ImportError as e:
+        raise ImportError(
+            "Tracing requires the opentelemetry-api package: pip install seatunnel-mcp[tracing]"
+        ) from e
+
+    tracer = _tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+    for name in CLIENT_METHODS:
+        method = getattr(SeaTunnelClient, name)
+        _originals[name] = method
+        setattr(SeaTunnelClient, name, _trace_client_method(tracer, method))
+    _originals["_make_request"] = SeaTunnelClient._make_request
+    setattr(SeaTunnelClient, "_make_request", _trace_http_request(tracer, SeaTunnelClient._make_request))
+
+
+def disable() -> None:
+    """Disable tracing and restore the uninstrumented ``SeaTunnelClient``.
+
+    Tools created while tracing was enabled keep their spans.
+    """
+    global _tracer
+    for name, method in _originals.items():
+        setattr(SeaTunnelClient, name, method)
+    _originals.clear()
+    _tracer = None
+
+
+def _set_job_id(span: Any, kwargs: dict) -> None:
+    job_id = kwargs.get("jobId")
+    if job_id is not None:
+        span.set_attribute("seatunnel.job_id", str(job_id))
+
+
+def trace_tool(func: Callable) -> Callable:
+    """Wrap a tool function in a span if tracing is enabled.
+
+    Args:
+        func: Async tool function, with its tool name as ``__name__``.
+
+    Returns:
+        The wrapped function, or ``func`` itself when tracing is disabled.
+    """
+    if _tracer is None:
+        return func
+    tracer = _tracer
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tracer.start_as_current_span(f"tool {name}") as span:
+            span.set_attribute("mcp.tool.name", name)
+            _set_job_id(span, kwargs)
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _trace_client_method(tracer: Any, method: Callable) -> Callable:
+    span_name = f"SeaTunnelClient.{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self: SeaTunnelClient, *args: Any, **kwargs: Any) -> Any:
+        with tracer.start_as_current_span(span_name) as span:
+            _set_job_id(span, kwargs)
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _trace_http_request(tracer: Any, make_request: Callable) -> Callable:
+    from opentelemetry import propagate, trace
+
+    @functools.wraps(make_request)
+    def wrapper(self: SeaTunnelClient, method: str, endpoint: str, **kwargs: Any) -> Any:
+        template = endpoint_template(endpoint)
+        with tracer.start_as_current_span(f"{method} {template}", kind=trace.SpanKind.CLIENT) as span:
+            span.set_attribute("http.request.method", method)
+            span.set_attribute("url.full", f"{self.base_url}{endpoint}")
+            span.set_attribute("seatunnel.endpoint", template)
+            # Propagate the trace context to the SeaTunnel REST API
+            headers = dict(kwargs.pop("headers", None) or {})
+            propagate.inject(headers)
+            try:
+                response = make_request(self, method, endpoint, headers=headers, **kwargs)
+            except httpx.HTTPStatusError as e:
+                span.set_attribute("http.response.status_code", e.response.status_code)
+                raise
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute(
+                "http.request.body.size", int(response.request.headers.get("Content-Length") or 0)
+            )
+            span.set_attribute("http.response.body.size", len(response.content))
+            return response
+
+    return wrapper
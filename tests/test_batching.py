@@ -0,0 +1,169 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP submit-job micro-batcher."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from benchmarks.simulator import SimulatorConfig, SimulatorServer
+from src.seatunnel_mcp.batching import SubmitJobBatcher
+from src.seatunnel_mcp.client import SeaTunnelClient
+
+
+def job_config(name):
+    """Build a JSON job configuration."""
+    return json.dumps({
+        "env": {"job.mode": "batch"},
+        "source": [{"plugin_name": "FakeSource", "plugin_output": name}],
+        "sink": [{"plugin_name": "Console", "plugin_input": [name]}],
+    })
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock client that echoes submitted job names."""
+    client = MagicMock(spec=SeaTunnelClient)
+    client.submit_jobs.side_effect = lambda request_body: [
+        {"jobId": str(i), "jobName": job["params"]["jobName"]} for i, job in enumerate(request_body)
+    ]
+    client.submit_job.return_value = {"jobId": "single"}
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_are_batched(mock_client):
+    """Test that concurrent JSON submissions share one /submit-jobs request."""
+    batcher = SubmitJobBatcher(mock_client, window_ms=20, max_batch_size=10)
+    results = await asyncio.gather(*(
+        batcher.submit_job(job_config(f"fake{i}"), jobName=f"job-{i}", format="json")
+        for i in range(3)
+    ))
+
+    mock_client.submit_jobs.assert_called_once()
+    assert [r["jobName"] for r in results] == ["job-0", "job-1", "job-2"]
+    mock_client.submit_job.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size(mock_client):
+    """Test that batches are split at the maximum batch size."""
+    batcher = SubmitJobBatcher(mock_client, window_ms=20, max_batch_size=2)
+    await asyncio.gather(*(
+        batcher.submit_job(job_config("fake"), jobName=f"job-{i}", format="json") for i in range(5)
+    ))
+
+    sizes = [len(call.kwargs["request_body"]) for call in mock_client.submit_jobs.call_args_list]
+    assert sorted(sizes) == [1, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_submission_is_not_sent(mock_client):
+    """Test that the job of a call cancelled before its batch is sent never reaches the cluster."""
+    batcher = SubmitJobBatcher(mock_client, window_ms=50, max_batch_size=10)
+    calls = [
+        asyncio.ensure_future(batcher.submit_job(job_config("fake"), jobName=f"job-{i}", format="json"))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    calls[1].cancel()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    [call] = mock_client.submit_jobs.call_args_list
+    assert [job["params"]["jobName"] for job in call.kwargs["request_body"]] == ["job-0", "job-2"]
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert [results[0]["jobName"], results[2]["jobName"]] == ["job-0", "job-2"]
+
+
+@pytest.mark.asyncio
+async def test_hocon_is_submitted_individually(mock_client):
+    """Test that non-JSON configurations bypass the batch endpoint."""
+    batcher = SubmitJobBatcher(mock_client)
+    result = await batcher.submit_job('env { job.mode = "batch" }', jobName="job", format="hocon")
+
+    assert result == {"jobId": "single"}
+    mock_client.submit_jobs.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_isolates_errors(mock_client):
+    """Test that a rejected batch is retried per job so only the bad job fails."""
+    def submit_jobs(request_body):
+        if any(job["params"]["jobName"] == "bad" for job in request_body):
+            raise httpx.HTTPStatusError("rejected", request=MagicMock(), response=httpx.Response(400))
+        return [{"jobId": "1", "jobName": job["params"]["jobName"]} for job in request_body]
+
+    mock_client.submit_jobs.side_effect = submit_jobs
+    batcher = SubmitJobBatcher(mock_client, window_ms=20)
+    results = await asyncio.gather(
+        batcher.submit_job(job_config("a"), jobName="good", format="json"),
+        batcher.submit_job(job_config("b"), jobName="bad", format="json"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == {"jobId": "1", "jobName": "good"}
+    assert isinstance(results[1], httpx.HTTPStatusError)
+
+
+def parallel_job_config(parallelism):
+    """Build a JSON job configuration with the given parallelism."""
+    return json.dumps({
+        "env": {"job.mode": "STREAMING", "parallelism": parallelism},
+        "source": [{"plugin_name": "FakeSource"}],
+        "sink": [{"plugin_name": "Console"}],
+    })
+
+
+@pytest.mark.asyncio
+async def test_partially_applied_batch_is_not_resubmitted():
+    """Test that a batch failing with a server error after starting some jobs is not retried."""
+    with SimulatorServer(SimulatorConfig(workers=1, slots_per_worker=10)) as server:
+        client = SeaTunnelClient(base_url=server.url)
+        batcher = SubmitJobBatcher(client, window_ms=20)
+        results = await asyncio.gather(
+            batcher.submit_job(parallel_job_config(1), jobName="good", format="json"),
+            batcher.submit_job(parallel_job_config(999), jobName="too-big", format="json"),
+            return_exceptions=True,
+        )
+        client.close()
+        names = [job.name for job in server.simulator.jobs.values()]
+
+    # The simulator started the good job before rejecting the second one
+    assert names == ["good"]
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_with_job_ids_is_retried_after_server_error():
+    """Test that jobs with explicit IDs are retried individually, since they cannot start twice."""
+    with SimulatorServer(SimulatorConfig(workers=1, slots_per_worker=10)) as server:
+        client = SeaTunnelClient(base_url=server.url)
+        batcher = SubmitJobBatcher(client, window_ms=20)
+        results = await asyncio.gather(
+            batcher.submit_job(parallel_job_config(1), jobName="good", jobId=101, format="json"),
+            batcher.submit_job(parallel_job_config(999), jobName="too-big", jobId=102, format="json"),
+            return_exceptions=True,
+        )
+        client.close()
+        names = [job.name for job in server.simulator.jobs.values()]
+
+    # The retry of the already started job cannot start it a second time
+    assert names == ["good"]
+    assert isinstance(results[1], httpx.HTTPStatusError)
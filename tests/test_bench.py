@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the bench subcommand's load generator."""
+
+import sys
+from typing import Any, Dict, List, Union
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from src.seatunnel_mcp import cli
+from src.seatunnel_mcp.bench import BenchStats, Workload, parse_mix, run_bench
+
+
+def fake_server() -> FastMCP:
+    server = FastMCP("fake")
+    calls: List[str] = []
+
+    @server.tool(name="get-running-jobs")
+    async def get_running_jobs() -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        return [{"jobId": "1"}, {"jobId": "2"}]
+
+    @server.tool(name="get-job-info")
+    async def get_job_info(jobId: str) -> Dict[str, Any]:
+        calls.append(jobId)
+        if jobId == "2":
+            raise ValueError("job 2 is broken")
+        return {"jobId": jobId}
+
+    server.calls = calls  # type: ignore[attr-defined]
+    return server
+
+
+def test_parse_mix():
+    """Test parsing the tool mix, and rejecting malformed ones."""
+    assert parse_mix("get-job-info=70, get-running-jobs=30") == {"get-job-info": 70.0, "get-running-jobs": 30.0}
+    for spec in ("", "get-job-info", "get-job-info=x", "get-job-info=-1", "get-job-info=0"):
+        with pytest.raises(ValueError):
+            parse_mix(spec)
+
+
+def test_stats_summary():
+    """Test per-tool and overall latency percentiles, error rates and top errors."""
+    stats = BenchStats()
+    for i in range(1, 101):
+        stats.record("a", i / 1000)
+    stats.record("b", 0.5, "boom")
+    stats.record("b", 0.5, "boom")
+    summary = stats.summary(10.0)
+    assert summary["overall"]["calls"] == 102
+    assert summary["tools"]["a"]["latency_ms"]["p50"] == pytest.approx(50, abs=1)
+    assert summary["tools"]["b"]["error_rate"] == 1.0
+    assert summary["top_errors"] == {"b: boom": 2}
+    assert stats.interval(1.0)["calls"] == 102
+    assert stats.interval(1.0)["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_run_bench_closed_loop():
+    """Test a closed-loop run spreading job IDs from get-running-jobs and counting tool errors."""
+    server = fake_server()
+    workload = Workload({"get-job-info": 1}, seed=1)
+    async with create_connected_server_and_client_session(server._mcp_server) as session:
+        await workload.prepare(session)
+        assert workload.job_ids == ["1", "2"]
+        result = await run_bench([session], workload, duration=0.3, concurrency=2, report_interval=0.1)
+
+    summary = result["summary"]
+    assert summary["overall"]["calls"] == len(server.calls) > 0
+    assert summary["overall"]["errors"] == server.calls.count("2") > 0
+    assert any("job 2 is broken" in message for message in summary["top_errors"])
+    assert result["timeline"]
+    assert result["config"]["concurrency"] == 2
+
+
+@pytest.mark.asyncio
+async def test_run_bench_open_loop():
+    """Test that an open-loop run issues calls at the target rate."""
+    server = fake_server()
+    workload = Workload({"get-running-jobs": 1})
+    async with create_connected_server_and_client_session(server._mcp_server) as session:
+        result = await run_bench([session], workload, duration=0.5, rate=40, report_interval=1.0)
+
+    assert result["summary"]["overall"]["calls"] == 20
+    assert result["summary"]["overall"]["errors"] == 0
+    assert result["config"]["concurrency"] is None
+
+
+@pytest.mark.asyncio
+async def test_run_bench_rejects_non_positive_rate():
+    """Test that an open loop needs a positive rate."""
+    with pytest.raises(ValueError):
+        await run_bench([], Workload({"get-running-jobs": 1}), rate=0)
+
+
+@pytest.mark.parametrize("options", [
+    ["--rate", "0"],
+    ["--rate", "-5"],
+    ["--concurrency", "0"],
+    ["--mix", "get-job-info"],
+    ["--mix", "get-job-info=0"],
+])
+def test_bench_command_rejects_invalid_load(monkeypatch, capsys, options):
+    """Test that an invalid load is a usage error rather than a traceback or an endless run."""
+    monkeypatch.setattr(sys, "argv", ["seatunnel-mcp", "bench", *options])
+    monkeypatch.setattr(cli, "run_bench", lambda args: pytest.fail("bench must not start"))
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+    assert exc_info.value.code == 2
+    assert "error:" in capsys.readouterr().err
@@ -0,0 +1,52 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Smoke tests for the benchmark suite."""
+
+import copy
+
+import pytest
+
+from benchmarks.run_benchmarks import compare, percentile, run_benchmarks
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_every_tool_runs_against_fake_server():
+    """Test that every tool succeeds against the fake SeaTunnel server."""
+    results = await run_benchmarks(concurrency_levels=(2,), calls=3, warmup=1)
+    assert len(results["results"]) == 21
+    assert all(result["errors"] == 0 for result in results["results"])
+    assert all(result["latency_ms"]["p99"] >= result["latency_ms"]["p50"] for result in results["results"])
+
+
+def test_compare_reports_regressions():
+    """Test that throughput drops and p95 increases beyond the threshold are reported."""
+    baseline = {"results": [{"tool": "get-overview", "concurrency": 1, "throughput_per_s": 100.0,
+                             "latency_ms": {"p95": 10.0}}]}
+    current = copy.deepcopy(baseline)
+    assert compare(current, baseline, 0.1) == []
+
+    current["results"][0]["throughput_per_s"] = 80.0
+    current["results"][0]["latency_ms"]["p95"] = 12.0
+    assert len(compare(current, baseline, 0.1)) == 2
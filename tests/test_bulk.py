@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP bulk job operations."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.seatunnel_mcp.bulk import rolling_restart, select_running_job_ids, stop_jobs
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.tools import stop_jobs_tool
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock client for testing."""
+    client = MagicMock(spec=SeaTunnelClient)
+    client.get_running_jobs.return_value = [
+        {"jobId": "1", "jobName": "cdc_orders", "jobStatus": "RUNNING"},
+        {"jobId": "2", "jobName": "cdc_users", "jobStatus": "RUNNING"},
+        {"jobId": "3", "jobName": "batch_report", "jobStatus": "RUNNING"},
+    ]
+    client.stop_job.side_effect = lambda jobId, isStartWithSavePoint: {"jobId": jobId}
+    client.get_job_info.return_value = {"jobStatus": "SAVEPOINT_DONE"}
+    client.submit_job.side_effect = lambda **kwargs: {"jobId": kwargs["jobId"]}
+    return client
+
+
+@pytest.mark.asyncio
+async def test_select_running_job_ids(mock_client):
+    """Test selecting running jobs by name pattern."""
+    assert await select_running_job_ids(mock_client, "cdc_*") == ["1", "2"]
+    assert await select_running_job_ids(mock_client) == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_stop_jobs(mock_client):
+    """Test stop_jobs isolates per-job failures."""
+    def stop_job(jobId, isStartWithSavePoint):
+        if jobId == "2":
+            raise RuntimeError("boom")
+        return {"jobId": jobId}
+
+    mock_client.stop_job.side_effect = stop_job
+    result = await stop_jobs(mock_client, ["1", "2", "3"], isStopWithSavePoint=True, max_concurrency=2)
+
+    assert result == {
+        "total": 3,
+        "stopped": ["1", "3"],
+        "failed": [{"jobId": "2", "error": "boom"}],
+    }
+    mock_client.stop_job.assert_any_call(jobId="1", isStartWithSavePoint=True)
+
+
+@pytest.mark.asyncio
+async def test_stop_jobs_tool_selects_jobs(mock_client):
+    """Test the tool stops the given jobs, or the running jobs matching a pattern."""
+    tool = stop_jobs_tool(mock_client)
+    assert (await tool(jobIds=["3"]))["stopped"] == ["3"]
+    assert (await tool(jobNamePattern="cdc_*"))["stopped"] == ["1", "2"]
+    with pytest.raises(ValueError):
+        await tool()
+
+
+@pytest.mark.asyncio
+async def test_rolling_restart(mock_client):
+    """Test rolling_restart resubmits from the savepoint."""
+    jobs = [{"jobId": "1", "job_content": "env {}"}, {"jobId": "2", "job_content": "env {}"}]
+    result = await rolling_restart(mock_client, jobs, wave_size=1, poll_interval=0)
+
+    assert result == {"total": 2, "restarted": ["1", "2"], "failed": []}
+    mock_client.submit_job.assert_any_call(
+        job_content="env {}",
+        jobName=None,
+        jobId="1",
+        isStartWithSavePoint=True,
+        format="hocon",
+    )
+
+
+@pytest.mark.asyncio
+async def test_rolling_restart_without_savepoint(mock_client):
+    """Test rolling_restart does not resubmit a job that stopped without a savepoint."""
+    mock_client.get_job_info.return_value = {"jobStatus": "FAILED"}
+    result = await rolling_restart(mock_client, [{"jobId": "1", "job_content": "env {}"}], poll_interval=0)
+
+    assert result["restarted"] == []
+    assert result["failed"][0]["jobId"] == "1"
+    mock_client.submit_job.assert_not_called()
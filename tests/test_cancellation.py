@@ -0,0 +1,114 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the cancellation of in-flight SeaTunnel requests."""
+
+import asyncio
+import socket
+import threading
+
+import pytest
+from mcp import types
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from src.seatunnel_mcp.cancellation import RequestCancelled
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.concurrency import run_sync
+from src.seatunnel_mcp.tools import get_overview_tool
+
+
+class HangingServer:
+    """HTTP server that reads requests but never answers them."""
+
+    def __init__(self):
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self.received = threading.Event()
+        self.disconnected = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        connection, _ = self.sock.accept()
+        with connection:
+            connection.recv(65536)
+            self.received.set()
+            # Returns once the client shuts the connection down
+            connection.recv(65536)
+            self.disconnected.set()
+
+    def close(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def server():
+    server = HangingServer()
+    yield server
+    server.close()
+
+
+async def wait_for(event):
+    assert await asyncio.to_thread(event.wait, 5)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_run_sync_aborts_the_request(server):
+    """Test that cancelling the awaiting task aborts the request in the worker thread."""
+    client = SeaTunnelClient(base_url=server.url, timeout=30)
+    outcome = {}
+    done = threading.Event()
+
+    def get_overview():
+        try:
+            client.get_overview()
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    task = asyncio.ensure_future(run_sync(get_overview))
+    await wait_for(server.received)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await wait_for(done)
+    await wait_for(server.disconnected)
+    assert isinstance(outcome["error"], RequestCancelled)
+    assert client.pool_stats() == {"active": 0, "idle": 0}
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_mcp_cancel_notification_reaches_the_http_request(server):
+    """Test that an MCP cancel notification aborts the tool's HTTP request."""
+    client = SeaTunnelClient(base_url=server.url, timeout=30)
+    mcp = FastMCP(name="test")
+    mcp.add_tool(get_overview_tool(client))
+
+    async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+        call = asyncio.ensure_future(session.call_tool("get-overview", {}))
+        await wait_for(server.received)
+        await session.send_notification(types.ClientNotification(types.CancelledNotification(
+            params=types.CancelledNotificationParams(requestId=session._request_id - 1),
+        )))
+        await wait_for(server.disconnected)
+        call.cancel()
+        with pytest.raises((asyncio.CancelledError, McpError)):
+            await call
+    client.close()
@@ -0,0 +1,144 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for chunking oversized tool results."""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from src.seatunnel_mcp.chunking import ContinuationBuffer
+from src.seatunnel_mcp.tools import get_all_tools
+
+
+def jobs(count, name_length=10):
+    return [{"jobId": str(i), "jobName": "x" * name_length} for i in range(count)]
+
+
+def fetch_all(buffer, chunk):
+    chunks = [chunk]
+    while chunk["continuation"]:
+        chunk = buffer.fetch(chunk["continuation"])
+        chunks.append(chunk)
+    return chunks
+
+
+def test_small_results_pass_through():
+    """Test that results within the budget are returned as they are."""
+    buffer = ContinuationBuffer(max_response_bytes=1000)
+    assert buffer.guard(jobs(5)) == jobs(5)
+    assert buffer.guard({"jobId": "1"}) == {"jobId": "1"}
+
+
+def test_list_results_are_paged_by_item():
+    """Test that oversized lists come back as pages of whole items within the budget."""
+    buffer = ContinuationBuffer(max_response_bytes=200)
+    chunks = fetch_all(buffer, buffer.guard(jobs(30)))
+    assert len(chunks) > 1
+    assert all(len(json.dumps(chunk["items"])) <= 200 for chunk in chunks)
+    assert [item for chunk in chunks for item in chunk["items"]] == jobs(30)
+    assert [chunk["offset"] for chunk in chunks] == sorted({chunk["offset"] for chunk in chunks})
+    assert buffer.buffered_bytes() == 0
+    with pytest.raises(ValueError):
+        buffer.fetch(chunks[0]["continuation"])
+
+
+def test_oversized_items_fall_back_to_text():
+    """Test that results with an item over the budget are sliced as JSON text."""
+    buffer = ContinuationBuffer(max_response_bytes=100)
+    result = jobs(3, name_length=150)
+    chunks = fetch_all(buffer, buffer.guard(result))
+    assert all(len(chunk["text"]) <= 100 for chunk in chunks)
+    assert json.loads("".join(chunk["text"] for chunk in chunks)) == result
+
+
+def test_buffer_is_bounded():
+    """Test that the oldest continuations are evicted and a result over the cap is truncated."""
+    buffer = ContinuationBuffer(max_response_bytes=100, max_buffer_bytes=500)
+    first = buffer.guard(jobs(10))
+    second = buffer.guard(jobs(10))
+    assert buffer.buffered_bytes() <= 500
+    with pytest.raises(ValueError):
+        buffer.fetch(first["continuation"])
+
+    chunks = fetch_all(buffer, second)
+    assert [item for chunk in chunks for item in chunk["items"]] == jobs(10)
+
+    chunks = fetch_all(buffer, buffer.guard(jobs(100)))
+    received = [item for chunk in chunks for item in chunk["items"]]
+    assert received == jobs(100)[:len(received)]
+    assert len(json.dumps(received[len(chunks[0]["items"]):])) <= 500
+    assert chunks[-1]["truncated"] is True
+
+
+def test_continuations_expire():
+    """Test that continuations unused for longer than the TTL are dropped."""
+    now = [0.0]
+    buffer = ContinuationBuffer(max_response_bytes=100, ttl=10.0)
+    buffer.now = lambda: now[0]
+    chunk = buffer.guard(jobs(10))
+    now[0] = 9.0
+    chunk = buffer.fetch(chunk["continuation"])
+    now[0] = 18.0
+    chunk = buffer.fetch(chunk["continuation"])
+    now[0] = 30.0
+    with pytest.raises(ValueError):
+        buffer.fetch(chunk["continuation"])
+
+
+@pytest.mark.asyncio
+async def test_fetch_continuation_tool():
+    """Test chunked results and the fetch-continuation tool through an MCP session."""
+    client = MagicMock()
+    client.get_finished_jobs.return_value = jobs(50)
+    server = FastMCP("test")
+    for tool in get_all_tools(client, continuations=ContinuationBuffer(max_response_bytes=500)):
+        server.add_tool(tool)
+
+    async with create_connected_server_and_client_session(server._mcp_server) as session:
+        result = await session.call_tool("get-finished-jobs", {"state": "FINISHED"})
+        chunk = json.loads(result.content[0].text)
+        received = chunk["items"]
+        while chunk["continuation"]:
+            result = await session.call_tool("fetch-continuation", {"continuation": chunk["continuation"]})
+            assert not result.isError
+            chunk = json.loads(result.content[0].text)
+            received += chunk["items"]
+
+        result = await session.call_tool("fetch-continuation", {"continuation": "expired"})
+        assert result.isError
+
+    assert received == jobs(50)
+
+
+@pytest.mark.asyncio
+async def test_wrapped_tool_measures_results_off_the_event_loop():
+    """Test that a wrapped tool serializes its result in a worker thread."""
+    buffer = ContinuationBuffer(max_response_bytes=500)
+    threads = []
+    split = buffer._split
+    buffer._split = lambda result: threads.append(threading.get_ident()) or split(result)
+
+    async def get_jobs():
+        return jobs(50)
+
+    chunk = await buffer.wrap_tool(get_jobs)()
+    assert threads and threads[0] != threading.get_ident()
+    assert [job for c in fetch_all(buffer, chunk) for job in c["items"]] == jobs(50)
@@ -72,7 +72,7 @@ def test_submit_job(mock_client, client):
 
     mock_client_instance = MagicMock()
     mock_client_instance.request.return_value = mock_response
-    mock_client.return_value.__enter__.return_value = mock_client_instance
+    mock_client.return_value = mock_client_instance
 
     job_content = "env { job.mode = \"batch\" }"
     result = client.submit_job(
@@ -104,7 +104,7 @@ def test_submit_jobs(mock_client, client):
 
     mock_client_instance = MagicMock()
     mock_client_instance.request.return_value = mock_response
-    mock_client.return_value.__enter__.return_value = mock_client_instance
+    mock_client.return_value = mock_client_instance
 
     # 直接作为请求体的任意数据
     request_body = [
@@ -148,7 +148,7 @@ def test_submit_job_upload(mock_client, client):
 
     mock_client_instance = MagicMock()
     mock_client_instance.request.return_value = mock_response
-    mock_client.return_value.__enter__.return_value = mock_client_instance
+    mock_client.return_value = mock_client_instance
 
     # Mock file-like object
     config_file = MagicMock()
@@ -181,7 +181,7 @@ def test_submit_job_upload_json(mock_client, client):
 
     mock_client_instance = MagicMock()
     mock_client_instance.request.return_value = mock_response
-    mock_client.return_value.__enter__.return_value = mock_client_instance
+    mock_client.return_value = mock_client_instance
 
     # Mock file-like object with json extension
     config_file = MagicMock()
@@ -216,7 +216,7 @@ def test_submit_job_upload_path(mock_open, mock_client, client):
 
     mock_client_instance = MagicMock()
     mock_client_instance.request.return_value = mock_response
-    mock_client.return_value.__enter__.return_value = mock_client_instance
+    mock_client.return_value = mock_client_instance
     
     # Mock the file object returned by open()
     mock_file = MagicMock()
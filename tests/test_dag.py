@@ -0,0 +1,124 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the job DAG analysis."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.seatunnel_mcp import dag
+from src.seatunnel_mcp.dag import DagAnalyzer, analyze_job_dag, parse_job_dag
+
+# Two sources joined by a transform and written to two sinks
+JOB_DAG = {
+    "jobId": "1",
+    "pipelineEdges": {"1": [
+        {"inputVertexId": "1", "targetVertexId": "3"},
+        {"inputVertexId": "2", "targetVertexId": "3"},
+        {"inputVertexId": "3", "targetVertexId": "4"},
+        {"inputVertexId": "3", "targetVertexId": "5"},
+    ]},
+    "vertexInfoMap": [
+        {"vertexId": 1, "type": "source", "vertexName": "Source[0]-Kafka", "parallelism": 2, "tablePaths": ["orders"]},
+        {"vertexId": 2, "type": "source", "vertexName": "Source[1]-Jdbc", "parallelism": 1, "tablePaths": ["users"]},
+        {"vertexId": 3, "type": "transform", "vertexName": "Transform[0]-Sql", "parallelism": 2},
+        {"vertexId": 4, "type": "sink", "vertexName": "Sink[0]-Doris", "parallelism": 2, "tablePaths": ["dw"]},
+        {"vertexId": 5, "type": "sink", "vertexName": "Sink[1]-Console", "parallelism": 1, "tablePaths": ["log"]},
+    ],
+}
+
+
+def job_info(orders, users, dw, log, created="2025-06-10 12:00:00"):
+    return {
+        "jobId": "1",
+        "jobName": "join",
+        "jobStatus": "RUNNING",
+        "createTime": created,
+        "jobDag": JOB_DAG,
+        "metrics": {
+            "SourceReceivedCount": str(orders + users),
+            "SinkWriteCount": str(dw + log),
+            "TableSourceReceivedCount": {"orders": str(orders), "users": str(users)},
+            "TableSinkWriteCount": {"dw": str(dw), "log": str(log)},
+        },
+    }
+
+
+class Clock:
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_parse_job_dag():
+    """Test the indexed graph and the sources feeding each sink."""
+    graph = parse_job_dag(JOB_DAG)
+    assert graph.ids == ["1", "2", "3", "4", "5"]
+    assert graph.upstream[2] == [0, 1] and graph.downstream[2] == [3, 4]
+    assert graph.feeds == {3: ((0, 1), (2,)), 4: ((0, 1), (2,))}
+    assert graph.single == frozenset({"transform"})
+
+    keyed = parse_job_dag({"pipelineEdges": {}, "vertexInfoMap": {"7": {"type": "source", "vertexName": "s"}}})
+    assert keyed.ids == ["7"] and keyed.parallelism == [1]
+    with pytest.raises(ValueError):
+        parse_job_dag({"vertexInfoMap": []})
+
+
+def test_analysis_finds_growing_backpressure():
+    """Test per-vertex rates, gaps growing in front of a sink and the bottleneck."""
+    analyzer = DagAnalyzer()
+    analyzer.now = clock = Clock()
+
+    result = analyzer.analyze("http://a", job_info(1000, 500, 1400, 1500))
+    assert "note" in result
+    assert [hint["gap"] for hint in result["backpressure"]] == [100.0]
+
+    clock.time += 10.0
+    result = analyzer.analyze("http://a", job_info(2000, 1000, 2400, 3000))
+    rates = {vertex["vertexId"]: vertex.get("records_per_second") for vertex in result["vertices"]}
+    assert rates == {"1": 100.0, "2": 50.0, "3": None, "4": 100.0, "5": 150.0}
+    assert result["backpressure"] == [
+        {"sink": "4", "sources": ["1", "2"], "through": ["3"], "gap": 600.0, "gap_per_second": 50.0},
+    ]
+    assert result["bottleneck"]["vertexId"] == "4"
+    assert "note" not in result
+
+
+def test_dag_is_parsed_once_per_job():
+    """Test that repeat analyses reuse the parsed DAG until the job is resubmitted."""
+    analyzer = DagAnalyzer(max_graphs=1)
+    with patch.object(dag, "parse_job_dag", wraps=parse_job_dag) as parse:
+        analyzer.analyze("http://a", job_info(1, 1, 1, 1))
+        analyzer.analyze("http://a", job_info(2, 2, 2, 2))
+        assert parse.call_count == 1
+        analyzer.analyze("http://a", job_info(0, 0, 0, 0, created="2025-06-11 12:00:00"))
+        assert parse.call_count == 2
+        analyzer.analyze("http://b", job_info(0, 0, 0, 0))
+        analyzer.analyze("http://a", job_info(0, 0, 0, 0))
+        assert parse.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_analyze_job_dag_without_dag():
+    """Test that unknown jobs are reported as errors."""
+    client = MagicMock()
+    client.base_url = "http://a"
+    client.get_job_info.return_value = {}
+    with pytest.raises(ValueError):
+        await analyze_job_dag(client, DagAnalyzer(), "42")
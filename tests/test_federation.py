@@ -0,0 +1,119 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the federation of several clusters."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.seatunnel_mcp.federation import Federation
+
+
+@pytest.fixture
+def clients():
+    """Create a client per cluster."""
+    clients = {name: MagicMock(name=name) for name in ("eu", "us", "ap")}
+    clients["eu"].get_running_jobs.return_value = [{"jobId": "1"}, {"jobId": "2"}]
+    clients["us"].get_running_jobs.return_value = {"jobs": [{"jobId": "3"}]}
+    clients["ap"].get_running_jobs.side_effect = RuntimeError("connection refused")
+    clients["eu"].get_overview.return_value = {"projectVersion": "2.3.9", "runningJobs": "2", "totalSlot": "8"}
+    clients["us"].get_overview.return_value = {"projectVersion": "2.3.8", "runningJobs": "1", "totalSlot": "4"}
+    clients["ap"].get_overview.return_value = {"projectVersion": "2.3.9", "runningJobs": "0", "totalSlot": "2"}
+    return clients
+
+
+@pytest.fixture
+def federation(clients):
+    """Create a federation of the three clusters."""
+    registry = MagicMock()
+    registry.list_profiles.return_value = [{"name": name} for name in ("default", *clients)]
+    registry.get_client.side_effect = clients.__getitem__
+    return Federation(registry, ["eu", "us", "ap"], deadline=1.0)
+
+
+def test_unknown_clusters_are_rejected(federation):
+    """Test that every federated cluster must be a known profile."""
+    with pytest.raises(ValueError):
+        Federation(federation.registry, ["eu", "mars"])
+    with pytest.raises(ValueError):
+        Federation(federation.registry, [])
+
+
+@pytest.mark.asyncio
+async def test_merged_views(federation):
+    """Test that listings are merged and tagged by cluster, with failures reported."""
+    result = await federation.running_jobs()
+    assert [(job["jobId"], job["cluster"]) for job in result["jobs"]] == [("1", "eu"), ("2", "eu"), ("3", "us")]
+    assert result["clusters"] == ["eu", "us"]
+    assert result["errors"] == {"ap": "connection refused"}
+
+    result = await federation.overview()
+    assert result["totals"] == {"runningJobs": 3, "totalSlot": 14}
+    assert set(result["overviews"]) == {"eu", "us", "ap"}
+    assert "errors" not in result
+
+
+@pytest.mark.asyncio
+async def test_slow_clusters_are_left_out(federation, clients):
+    """Test that a fan-out returns the partial result at the deadline."""
+    release = threading.Event()
+    clients["us"].get_overview.side_effect = lambda: release.wait(5) and {}
+    federation.deadline = 0.1
+    try:
+        result = await federation.overview()
+    finally:
+        release.set()
+    assert result["clusters"] == ["ap", "eu"]
+    assert result["errors"] == {"us": "No response within 0.1s"}
+    assert result["totals"]["runningJobs"] == 2
+
+
+@pytest.mark.asyncio
+async def test_job_calls_are_routed_to_the_owner(federation, clients):
+    """Test routing by the jobs seen in listings, and lookup of unseen jobs."""
+    await federation.running_jobs()
+    clients["us"].stop_job.return_value = {"jobId": "3"}
+    assert await federation.call_owner("stop_job", "3", isStartWithSavePoint=True) == {"jobId": "3", "cluster": "us"}
+    clients["us"].stop_job.assert_called_once_with(jobId="3", isStartWithSavePoint=True)
+    clients["eu"].stop_job.assert_not_called()
+
+    clients["eu"].get_job_info.return_value = {}
+    clients["us"].get_job_info.side_effect = RuntimeError("not found")
+    clients["ap"].get_job_info.return_value = {"jobId": "9", "jobStatus": "FINISHED"}
+    assert (await federation.call_owner("get_job_info", "9"))["cluster"] == "ap"
+    assert federation.owner("9") == "ap"
+
+    clients["ap"].get_job_info.return_value = {}
+    with pytest.raises(ValueError):
+        await federation.locate("10")
+
+
+@pytest.mark.asyncio
+async def test_locate_returns_on_the_first_owner(federation, clients):
+    """Test that a lookup does not wait for the other clusters once one knows the job."""
+    release = threading.Event()
+    clients["eu"].get_job_info.side_effect = lambda jobId: release.wait(5) and {}
+    clients["us"].get_job_info.return_value = {"jobId": "9"}
+    clients["ap"].get_job_info.side_effect = RuntimeError("not found")
+    start = time.perf_counter()
+    try:
+        assert await federation.locate("9") == "us"
+    finally:
+        release.set()
+    assert time.perf_counter() - start < 0.5
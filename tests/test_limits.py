@@ -0,0 +1,182 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the upstream rate limits and bulkheads."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from benchmarks.simulator import SimulatorConfig, SimulatorServer
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.concurrency import run_sync
+from src.seatunnel_mcp.limits import Bulkhead, TokenBucket, UpstreamLimitExceeded, UpstreamLimits, parse_limits
+
+
+class Clock:
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_parse_limits():
+    """Test parsing limits and rejecting malformed ones."""
+    assert parse_limits("expensive=2, /job-info/{jobId}=50") == {"expensive": 2.0, "/job-info/{jobId}": 50.0}
+    assert parse_limits("") == {}
+    for spec in ("expensive", "expensive=0", "=3", "expensive=many"):
+        with pytest.raises(ValueError):
+            parse_limits(spec)
+    assert parse_limits("submit=8", integer=True) == {"submit": 8.0}
+    for spec in ("submit=0.5", "submit=1.5"):
+        with pytest.raises(ValueError):
+            parse_limits(spec, integer=True)
+    with pytest.raises(ValueError):
+        UpstreamLimits(bulkheads={"cheap": 2})
+    for limit in (0.5, 0, 2.5):
+        with pytest.raises(ValueError):
+            UpstreamLimits(bulkheads={"submit": limit})
+
+
+def test_token_bucket():
+    """Test bursts, refills and the waits for future tokens."""
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.now = clock = Clock()
+    bucket._last = clock.time
+    assert bucket.reserve(0) == 0.0
+    assert bucket.reserve(0) == 0.0
+    assert bucket.reserve(0) is None
+    assert bucket.reserve(1) == pytest.approx(0.1)
+    assert bucket.reserve(1) == pytest.approx(0.2)
+    clock.time += 1.0
+    assert bucket.reserve(0) == 0.0
+
+
+def test_rate_limit_rejects_requests_beyond_the_wait():
+    """Test that requests over an endpoint class rate fail once they would wait too long."""
+    limits = UpstreamLimits(endpoint_rates={"expensive": 1}, max_wait=0)
+    client = SeaTunnelClient(base_url="http://localhost:8090", limits=limits)
+    with patch.object(SeaTunnelClient, "_send") as send:
+        client._make_request("GET", "/finished-jobs/FAILED")
+        with pytest.raises(UpstreamLimitExceeded):
+            client._make_request("GET", "/system-monitoring-information")
+        # Other endpoint classes are not affected
+        client._make_request("GET", "/job-info/1")
+        client._make_request("GET", "/job-info/2")
+    assert send.call_count == 3
+
+
+def test_rejected_request_keeps_upstream_tokens():
+    """Test that a request rejected by its endpoint limit leaves the upstream budget to others."""
+    limits = UpstreamLimits(rate=1, burst=2, endpoint_rates={"/job-info/{jobId}": 1}, max_wait=0)
+    client = SeaTunnelClient(base_url="http://localhost:8090", limits=limits)
+    with patch.object(SeaTunnelClient, "_send") as send:
+        client._make_request("GET", "/job-info/1")
+        for job_id in range(2, 10):
+            with pytest.raises(UpstreamLimitExceeded):
+                client._make_request("GET", f"/job-info/{job_id}")
+        # The second upstream token is still there for another endpoint
+        client._make_request("GET", "/overview")
+    assert send.call_count == 2
+
+
+def test_bulkheads_isolate_endpoint_classes():
+    """Test that a full bulkhead rejects its class but lets the others through."""
+    limiter = UpstreamLimits(bulkheads={"expensive": 1}, max_wait=0.05).limiter("http://localhost:8090")
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_listing():
+        with limiter.admit("/finished-jobs/{state}"):
+            entered.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=slow_listing)
+    thread.start()
+    try:
+        assert entered.wait(5)
+        with pytest.raises(UpstreamLimitExceeded):
+            with limiter.admit("/system-monitoring-information"):
+                pass
+        with limiter.admit("/submit-job"):
+            pass
+    finally:
+        release.set()
+        thread.join()
+    with limiter.admit("/system-monitoring-information"):
+        pass
+
+
+def test_clients_of_an_upstream_share_limits():
+    """Test that limits are kept per upstream URL."""
+    limits = UpstreamLimits(rate=1, max_wait=0)
+    first = SeaTunnelClient(base_url="http://a:8090", limits=limits)
+    second = SeaTunnelClient(base_url="http://a:8090", limits=limits)
+    other = SeaTunnelClient(base_url="http://b:8090", limits=limits)
+    with patch.object(SeaTunnelClient, "_send", MagicMock()):
+        first._make_request("GET", "/overview")
+        with pytest.raises(UpstreamLimitExceeded):
+            second._make_request("GET", "/overview")
+        other._make_request("GET", "/overview")
+
+
+@pytest.mark.asyncio
+async def test_full_bulkhead_does_not_hold_worker_threads():
+    """Test that calls queued behind a full bulkhead do not delay the calls of other classes."""
+    config = SimulatorConfig(latency_sigma=0.0, endpoint_latency_ms={"/finished-jobs/{state}": 200})
+    limits = UpstreamLimits(bulkheads={"expensive": 1}, max_wait=30)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=4))
+    with SimulatorServer(config) as server:
+        client = SeaTunnelClient(base_url=server.url, limits=limits)
+        listings = [asyncio.ensure_future(run_sync(client.get_finished_jobs, "FINISHED")) for _ in range(8)]
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await run_sync(client.get_overview)
+        elapsed = time.perf_counter() - start
+        assert not all(listing.done() for listing in listings)
+        await asyncio.gather(*listings)
+        client.close()
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_hands_slots_to_threads_and_coroutines():
+    """Test that released slots go to waiting coroutines and threads, and cancelled waiters give them up."""
+    bulkhead = Bulkhead(1)
+    assert bulkhead.try_acquire()
+    cancelled = asyncio.ensure_future(bulkhead.acquire_async(5))
+    waiting = asyncio.ensure_future(bulkhead.acquire_async(5))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    bulkhead.release()
+    assert await waiting
+    assert not bulkhead.try_acquire()
+
+    thread_result = {}
+    thread = threading.Thread(target=lambda: thread_result.update(acquired=bulkhead.acquire(5)))
+    thread.start()
+    await asyncio.sleep(0.05)
+    bulkhead.release()
+    await asyncio.to_thread(thread.join)
+    assert thread_result == {"acquired": True}
+    bulkhead.release()
+    assert bulkhead.try_acquire()
+    assert not await bulkhead.acquire_async(0.01)
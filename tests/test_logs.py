@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the logging pipeline."""
+
+import io
+import json
+import logging
+import threading
+
+import httpx
+import pytest
+
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.logs import (
+    JsonFormatter,
+    SamplingFilter,
+    configure_logging,
+    parse_sampling,
+    stop_logging,
+)
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger's handlers and level after the test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def record(name="seatunnel_mcp.client", level=logging.DEBUG, msg="GET %s", args=("/overview",), **extra):
+    entry = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    entry.__dict__.update(extra)
+    return entry
+
+
+def test_json_formatter():
+    """Test that records become JSON objects with their structured fields."""
+    line = JsonFormatter().format(record(endpoint="/job-info/{jobId}", jobId="1", latency_ms=1.5, tool=None))
+    entry = json.loads(line)
+    assert entry["message"] == "GET /overview"
+    assert entry["level"] == "DEBUG"
+    assert entry["logger"] == "seatunnel_mcp.client"
+    assert (entry["endpoint"], entry["jobId"], entry["latency_ms"]) == ("/job-info/{jobId}", "1", 1.5)
+    assert "tool" not in entry
+
+
+def test_sampling_filter():
+    """Test that debug records are sampled per logger, including child loggers."""
+    sampler = SamplingFilter({"seatunnel_mcp": 10, "seatunnel_mcp.metrics": 1})
+    kept = [sampler.filter(record()) for _ in range(100)]
+    assert sum(kept) == 10
+    assert all(sampler.filter(record(name="seatunnel_mcp.metrics")) for _ in range(10))
+    assert all(sampler.filter(record(name="httpx")) for _ in range(10))
+    assert all(sampler.filter(record(level=logging.ERROR)) for _ in range(10))
+
+
+def test_parse_sampling():
+    """Test parsing per-logger sampling rates, and rejecting malformed ones."""
+    assert parse_sampling("seatunnel_mcp.client=100, httpx=10") == {"seatunnel_mcp.client": 100, "httpx": 10}
+    assert parse_sampling("") == {}
+    for spec in ("httpx", "httpx=x", "httpx=0", "=3"):
+        with pytest.raises(ValueError):
+            parse_sampling(spec)
+
+
+def test_records_are_written_by_listener_thread(root_logger):
+    """Test that records are formatted and written off the logging thread."""
+    threads = []
+
+    class Stream(io.StringIO):
+        def write(self, text):
+            threads.append(threading.current_thread())
+            return super().write(text)
+
+    stream = Stream()
+    configure_logging(logging.DEBUG, "json", {"test_logs": 2}, stream=stream)
+    logger = logging.getLogger("test_logs")
+    for i in range(4):
+        logger.debug("event %d", i)
+    logger.warning("kept", extra={"tool": "get-job-info"})
+    stop_logging()
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [entry["message"] for entry in entries] == ["event 0", "event 2", "kept"]
+    assert entries[-1]["tool"] == "get-job-info"
+    assert threading.current_thread() not in threads
+
+
+def test_client_request_fields(root_logger):
+    """Test that client requests log their endpoint, status, latency and job ID."""
+    stream = io.StringIO()
+    configure_logging(logging.DEBUG, "json", stream=stream)
+    transport = httpx.MockTransport(lambda request: httpx.Response(404, json={}))
+    client = SeaTunnelClient(base_url="http://seatunnel")
+    client._http_client = httpx.Client(transport=transport)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_job_info("42")
+    stop_logging()
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    request_entries = [entry for entry in entries if entry["logger"] == "src.seatunnel_mcp.client"]
+    assert [entry["level"] for entry in request_entries] == ["ERROR", "DEBUG"]
+    for entry in request_entries:
+        assert (entry["method"], entry["endpoint"], entry["status"], entry["jobId"]) == (
+            "GET", "/job-info/{jobId}", "404", "42",
+        )
+        assert entry["latency_ms"] >= 0
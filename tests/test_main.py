@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for creating and starting the SeaTunnel MCP server."""
+
+import pytest
+import uvicorn
+
+from src.seatunnel_mcp import __main__ as server_main
+from src.seatunnel_mcp.tools import SESSION_TOOLS
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch, tmp_path):
+    """Start from the defaults, without a .env file or logging setup."""
+    for name in ("MCP_TRANSPORT", "MCP_WORKERS", "MCP_METRICS_PORT", "SEATUNNEL_MCP_RECORD",
+                 "SEATUNNEL_MCP_REPLAY", "SEATUNNEL_PROFILES", "SEATUNNEL_FEDERATION"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(server_main, "setup", lambda: None)
+    monkeypatch.setenv("SEATUNNEL_MCP_EXPORT_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def uvicorn_run(monkeypatch):
+    """Capture the arguments uvicorn would be run with."""
+    calls = []
+    monkeypatch.setattr(uvicorn, "run", lambda app, **kwargs: calls.append((app, kwargs)))
+    return calls
+
+
+def routes(app):
+    return {route.path for route in app.routes}
+
+
+@pytest.mark.asyncio
+async def test_single_worker_server_keeps_sessions():
+    """Test that a single worker keeps sessions and offers the session tools and subscriptions."""
+    server = server_main.create_server()
+    names = {tool.name for tool in await server.list_tools()}
+    assert server.settings.stateless_http is False
+    assert set(SESSION_TOOLS) <= names
+    assert "fetch-continuation" in names
+    assert server._mcp_server.create_initialization_options().capabilities.resources.subscribe
+
+
+@pytest.mark.asyncio
+async def test_stateless_server_omits_session_features(monkeypatch):
+    """Test that several workers run stateless, without the features that need a session."""
+    monkeypatch.setenv("MCP_WORKERS", "2")
+    server = server_main.create_server()
+    names = {tool.name for tool in await server.list_tools()}
+    assert server.settings.stateless_http is True
+    assert not set(SESSION_TOOLS) & names
+    # Continuations could never be fetched from a later request's session
+    assert "fetch-continuation" not in names
+    assert "get-job-info" in names
+    assert not server._mcp_server.create_initialization_options().capabilities.resources.subscribe
+
+
+@pytest.mark.parametrize("transport, path", [("sse", "/sse"), ("streamable-http", "/mcp")])
+def test_create_app_for_transport(monkeypatch, transport, path):
+    """Test that the application serves the configured HTTP transport and the metrics."""
+    monkeypatch.setenv("MCP_TRANSPORT", transport)
+    assert {path, "/metrics"} <= routes(server_main.create_app())
+
+
+def test_main_runs_workers_from_app_factory(monkeypatch, uvicorn_run):
+    """Test that several workers each create their application from the factory."""
+    monkeypatch.setenv("MCP_TRANSPORT", "streamable-http")
+    monkeypatch.setenv("MCP_WORKERS", "3")
+    server_main.main()
+    [(app, kwargs)] = uvicorn_run
+    assert app == "src.seatunnel_mcp.__main__:create_app"
+    assert kwargs["factory"] is True
+    assert kwargs["workers"] == 3
+
+
+def test_main_runs_single_worker_app(monkeypatch, uvicorn_run):
+    """Test that a single worker is run with an application created up front."""
+    monkeypatch.setenv("MCP_TRANSPORT", "sse")
+    server_main.main()
+    [(app, kwargs)] = uvicorn_run
+    assert "/sse" in routes(app)
+    assert kwargs["factory"] is False
+
+
+@pytest.mark.parametrize("env", [
+    {"MCP_TRANSPORT": "websocket"},
+    {"MCP_TRANSPORT": "sse", "MCP_WORKERS": "2"},
+    {"MCP_TRANSPORT": "streamable-http", "MCP_WORKERS": "2", "SEATUNNEL_MCP_RECORD": "cassette.jsonl"},
+])
+def test_main_rejects_invalid_configurations(monkeypatch, uvicorn_run, env):
+    """Test that unsupported transports and worker combinations are rejected before serving."""
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError):
+        server_main.main()
+    assert uvicorn_run == []
@@ -0,0 +1,109 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP metrics."""
+
+import threading
+
+import pytest
+
+from src.seatunnel_mcp.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    TOOL_CALLS,
+    TOOL_ERRORS,
+    endpoint_template,
+    instrument_tool,
+)
+
+
+def test_render():
+    """Test the Prometheus text format of all metric kinds."""
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("requests_total", "Requests.", ("path",)))
+    gauge = registry.register(Gauge("in_flight", "In flight."))
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)))
+
+    counter.labels('/a"b').inc()
+    counter.labels('/a"b').inc(4)
+    gauge.labels().inc()
+    gauge.labels().inc()
+    gauge.labels().dec()
+    histogram.labels().observe(0.05)
+    histogram.labels().observe(0.5)
+    histogram.labels().observe(5)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{path="/a\\"b"} 5' in lines
+    assert "in_flight 1" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_sum 5.55" in lines
+    assert "latency_seconds_count 3" in lines
+
+
+def test_counter_from_many_threads():
+    """Test that increments from concurrent threads are all counted."""
+    counter = Counter("calls_total", "Calls.", ("tool",)).labels("t")
+
+    def work():
+        for _ in range(1000):
+            counter.inc()
+            counter.inc(2)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.value == 8 * 3000
+
+
+def test_labels_must_match():
+    """Test that a wrong number of label values is rejected."""
+    with pytest.raises(ValueError):
+        Counter("c", "C.", ("a", "b")).labels("x")
+
+
+def test_endpoint_template():
+    """Test that path parameters are removed from endpoint labels."""
+    assert endpoint_template("/job-info/123") == "/job-info/{jobId}"
+    assert endpoint_template("/finished-jobs/FAILED") == "/finished-jobs/{state}"
+    assert endpoint_template("/running-jobs") == "/running-jobs"
+
+
+@pytest.mark.asyncio
+async def test_instrument_tool():
+    """Test that instrumented tools keep their name and count calls and errors."""
+    async def tool(fail: bool = False) -> str:
+        if fail:
+            raise RuntimeError("boom")
+        return "ok"
+
+    tool.__name__ = "test-instrumented-tool"
+    wrapped = instrument_tool(tool)
+    assert wrapped.__name__ == "test-instrumented-tool"
+
+    assert await wrapped() == "ok"
+    with pytest.raises(RuntimeError):
+        await wrapped(fail=True)
+
+    assert TOOL_CALLS.labels("test-instrumented-tool").value == 2
+    assert TOOL_ERRORS.labels("test-instrumented-tool").value == 1
@@ -0,0 +1,155 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for ranking and health checks of running jobs."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.seatunnel_mcp.monitoring import CounterDeltas, StallDetector, top_jobs
+
+
+def job(job_id, received, written=0, qps=0.0, metrics=True):
+    entry = {"jobId": str(job_id), "jobName": f"job-{job_id}", "jobStatus": "RUNNING"}
+    if metrics:
+        entry["metrics"] = {
+            "SourceReceivedCount": str(received),
+            "SinkWriteCount": str(written),
+            "SourceReceivedQPS": str(qps),
+        }
+    return entry
+
+
+class Clock:
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.base_url = "http://seatunnel"
+    return client
+
+
+@pytest.mark.asyncio
+async def test_top_jobs_by_metric(client):
+    """Test ranking by reported metrics, lowest first, and jobs without the metric."""
+    client.get_running_jobs.return_value = [job(i, received=i * 10, written=i, qps=i) for i in range(20)] + [
+        {"jobId": "x", "metrics": {}},
+    ]
+    deltas = CounterDeltas()
+
+    result = await top_jobs(client, deltas, metric="records_per_second", n=3)
+    assert [entry["jobId"] for entry in result["jobs"]] == ["19", "18", "17"]
+    assert result["without_value"] == 1
+
+    result = await top_jobs(client, deltas, metric="lag", n=2, smallest=True)
+    assert [(entry["jobId"], entry["value"]) for entry in result["jobs"]] == [("0", 0.0), ("1", 9.0)]
+
+    result = await top_jobs(client, deltas, metric="SinkWriteCount", n=1)
+    assert result["jobs"][0]["jobId"] == "19"
+
+
+@pytest.mark.asyncio
+async def test_received_delta_rates_between_calls(client):
+    """Test that counter deltas are cached, so rates are available from the second call on."""
+    deltas = CounterDeltas()
+    deltas.now = clock = Clock()
+
+    client.get_running_jobs.return_value = [job(1, 1000), job(2, 5000), job(3, 100)]
+    result = await top_jobs(client, deltas, metric="received_delta")
+    assert result["jobs"] == []
+    assert "note" in result
+
+    clock.time += 10.0
+    # Job 2 restarted and job 3 finished
+    client.get_running_jobs.return_value = [job(1, 3000), job(2, 10), job(4, 0)]
+    result = await top_jobs(client, deltas, metric="received_delta")
+    assert [(entry["jobId"], entry["value"]) for entry in result["jobs"]] == [("1", 200.0)]
+
+    clock.time += 10.0
+    client.get_running_jobs.return_value = [job(1, 3000), job(2, 1010), job(4, 100)]
+    result = await top_jobs(client, deltas, metric="received_delta")
+    assert [(entry["jobId"], entry["value"]) for entry in result["jobs"]] == [("2", 100.0), ("4", 10.0), ("1", 0.0)]
+
+
+@pytest.mark.asyncio
+async def test_missing_metrics_are_fetched(client):
+    """Test that jobs listed without metrics are completed from /job-info."""
+    client.get_running_jobs.return_value = [job(1, 0, metrics=False), job(2, 0, qps=5)]
+    client.get_job_info.side_effect = lambda job_id: job(job_id, 0, qps=50)
+    result = await top_jobs(client, CounterDeltas(), n=1)
+    assert result["jobs"][0]["jobId"] == "1"
+    client.get_job_info.assert_called_once_with("1")
+
+
+def test_stall_detector_classifies_jobs(client):
+    """Test stalled, sink-stalled, degrading and healthy jobs across polls."""
+    detector = StallDetector(client, poll_interval=10.0, stall_polls=3)
+    detector.now = clock = Clock()
+    counts = {"idle": [0, 0], "sink": [0, 0], "slow": [0, 0], "steady": [0, 0]}
+    for poll in range(40):
+        # Every job moves along until poll 30, then each falls into its own pattern
+        late = poll >= 30
+        counts["idle"][0] += 0 if late else 100
+        counts["idle"][1] += 0 if late else 100
+        counts["sink"][0] += 100
+        counts["sink"][1] += 0 if late else 100
+        counts["slow"][0] += 10 if late else 100
+        counts["slow"][1] += 10 if late else 100
+        counts["steady"][0] += 100
+        counts["steady"][1] += 100
+        detector.observe([job(name, received, written) for name, (received, written) in counts.items()])
+        clock.time += 10.0
+
+    statuses = {finding["jobId"]: finding["status"] for finding in detector.findings()}
+    assert statuses == {"idle": "stalled", "sink": "sink_stalled", "slow": "degrading"}
+    assert detector.findings()[0]["seconds_without_writes"] == 110.0
+
+
+def test_stall_detector_forgets_finished_and_restarted_jobs(client):
+    """Test that only jobs of the latest listing are tracked, and restarts start over."""
+    detector = StallDetector(client, stall_polls=2)
+    detector.now = clock = Clock()
+    for _ in range(4):
+        detector.observe([job(1, 500, 500), job(2, 500, 500)])
+        clock.time += 30.0
+    assert {finding["jobId"] for finding in detector.findings()} == {"1", "2"}
+
+    detector.observe([job(1, 10, 10)])
+    assert detector.findings() == []
+    assert len(detector._jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_stalled_jobs_polls_on_demand(client):
+    """Test that a check polls when the last poll is stale, and starts the background poller."""
+    detector = StallDetector(client, poll_interval=3600.0, stall_polls=1)
+    detector.now = clock = Clock()
+    client.get_running_jobs.return_value = [job(1, 500, 500)]
+
+    report = await detector.check()
+    assert report["running"] == 1 and report["jobs"] == [] and "note" in report
+    clock.time += 3600.0
+    report = await detector.check()
+    assert [finding["jobId"] for finding in report["jobs"]] == ["1"]
+    assert client.get_running_jobs.call_count == 2
+    detector._poller.cancel()
@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the node pressure ranking."""
+
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.seatunnel_mcp import nodes
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.nodes import NodeHotspots, parse_number
+from src.seatunnel_mcp.tools import get_node_hotspots_tool
+
+
+class Clock:
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test with the pure-Python columns and, if installed, the NumPy ones."""
+    if request.param == "numpy":
+        monkeypatch.setattr(nodes, "np", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(nodes, "np", None)
+    return request.param
+
+
+def cluster(gc, hot_heap="3.8G", hot_load="90.00%"):
+    """Monitoring records of a master and eight workers, the last one under pressure."""
+    records = []
+    for node in range(9):
+        hot = node == 8
+        records.append({
+            "isMaster": "true" if node == 0 else "false",
+            "host": f"seatunnel-{node}",
+            "port": "5801",
+            "physical.memory.total": "16.0G",
+            "physical.memory.free": "8.0G",
+            "heap.memory.used": hot_heap if hot else f"{1500 + 10 * node}.0M",
+            "heap.memory.max": "4.0G",
+            "load.process": hot_load if hot else f"{30 + node}.00%",
+            "load.system": "40.00%",
+            "thread.count": "150",
+            "minor.gc.count": str(gc * (10 if hot else 1)),
+            "major.gc.count": "0",
+        })
+    return records
+
+
+def test_parse_number():
+    """Test parsing sizes, percentages and counts."""
+    assert parse_number("4.0G") == 4 * 1024 ** 3
+    assert parse_number("256M") == 256 * 1024 ** 2
+    assert parse_number("1.5KB") == 1536
+    assert parse_number("12.50%") == 0.125
+    assert parse_number("42") == 42
+    assert math.isnan(parse_number("n/a"))
+    assert math.isnan(parse_number(None))
+
+
+def test_rank_nodes_and_flag_outliers(backend):
+    """Test that the node under pressure comes first with its outlying figures."""
+    hotspots = NodeHotspots()
+    hotspots.now = clock = Clock()
+    first = hotspots.analyze("cluster", cluster(gc=100), n=3)
+    columns = first["columns"]
+    assert first["nodes"] == 9
+    assert len(first["rows"]) == 3
+    top = dict(zip(columns, first["rows"][0]))
+    assert top["node"] == "seatunnel-8:5801"
+    assert top["role"] == "worker"
+    assert top["heap_used_ratio"] == 0.95
+    assert top["gc_per_second"] is None
+    # Without its GC component the pressure does not count towards the average yet
+    assert top["pressure_avg"] is None
+    assert top["outliers"] == ["heap_used_ratio", "cpu_load"]
+    assert first["with_outliers"] == 1
+
+    clock.time += 10
+    second = hotspots.analyze("cluster", cluster(gc=200), n=3)
+    top = dict(zip(columns, second["rows"][0]))
+    assert top["gc_per_second"] == 100.0
+    assert top["outliers"] == ["heap_used_ratio", "cpu_load", "gc_per_second"]
+    assert second["medians"]["gc_per_second"] == 10.0
+    # The GC rate relative to the busiest node joins the pressure
+    assert top["pressure"] == pytest.approx((0.95 + 0.9 + 1.0) / 3, abs=1e-4)
+    assert top["pressure_avg"] == top["pressure"]
+
+    clock.time += 10
+    third = hotspots.analyze("cluster", cluster(gc=300), n=3)
+    top = dict(zip(columns, third["rows"][0]))
+    assert top["pressure_avg"] == pytest.approx((second["rows"][0][2] + top["pressure"]) / 2, abs=1e-4)
+
+
+def test_gc_rate_of_a_single_collector_family(backend):
+    """Test that nodes reporting only minor or only major GC counters still get a GC rate."""
+    hotspots = NodeHotspots()
+    hotspots.now = clock = Clock()
+    records = cluster(gc=100)
+    for record in records:
+        del record["major.gc.count"]
+    hotspots.analyze("cluster", records)
+
+    clock.time += 10
+    records = cluster(gc=200)
+    for record in records[:4]:
+        del record["major.gc.count"]
+    for record in records[4:]:
+        record["major.gc.count"] = record.pop("minor.gc.count")
+    result = hotspots.analyze("cluster", records, n=9)
+    rates = {row[0]: row[result["columns"].index("gc_per_second")] for row in result["rows"]}
+    assert rates["seatunnel-1:5801"] == 10.0
+    assert rates["seatunnel-8:5801"] == 100.0
+
+
+def test_sort_by_column(backend):
+    """Test ranking by another column and rejecting unknown ones."""
+    hotspots = NodeHotspots()
+    result = hotspots.analyze("cluster", cluster(gc=1, hot_heap="1.0G", hot_load="1.00%"), sort_by="heap_used_ratio")
+    assert [row[0] for row in result["rows"][:2]] == ["seatunnel-7:5801", "seatunnel-6:5801"]
+    assert result["with_outliers"] == 0
+    with pytest.raises(ValueError):
+        hotspots.analyze("cluster", [], sort_by="disk")
+    assert hotspots.analyze("cluster", [])["rows"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_node_hotspots_tool():
+    """Test the tool reads the monitoring information of the client."""
+    client = MagicMock(spec=SeaTunnelClient)
+    client.base_url = "http://localhost:8090"
+    client.get_system_monitoring_information.return_value = cluster(gc=1)
+    tool = get_node_hotspots_tool(client)
+    result = await tool(n=1)
+    assert result["rows"][0][0] == "seatunnel-8:5801"
+    with pytest.raises(ValueError):
+        await tool(sortBy="disk")
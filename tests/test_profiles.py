@@ -0,0 +1,126 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP connection profiles."""
+
+import gc
+
+import pytest
+from unittest.mock import MagicMock
+
+from mcp.server.lowlevel.server import request_ctx
+
+from src.seatunnel_mcp.profiles import ClientRegistry, SessionClient, load_profiles
+from src.seatunnel_mcp.schema import ConnectionProfile
+
+
+class FakeSession:
+    """Stand-in for an MCP server session."""
+
+
+def in_session(session):
+    """Make ``session`` the session of the current request."""
+    return request_ctx.set(MagicMock(session=session))
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with two profiles."""
+    return ClientRegistry(
+        [
+            ConnectionProfile(name="default", url="http://localhost:8090"),
+            ConnectionProfile(name="eu", url="http://eu:8090", api_key="eu_key"),
+        ],
+        max_clients=1,
+    )
+
+
+def test_load_profiles():
+    """Test parsing profiles from JSON."""
+    profiles = load_profiles('{"eu": {"url": "http://eu:8090", "timeout": 5}}')
+    assert profiles == [ConnectionProfile(name="eu", url="http://eu:8090", timeout=5)]
+
+
+def test_clients_are_pooled_and_bounded(registry):
+    """Test that clients are reused and the LRU is bounded."""
+    client = registry.get_client("default")
+    assert registry.get_client("default") is client
+    assert client.base_url == "http://localhost:8090"
+
+    eu = registry.get_client("eu")
+    assert eu.api_key == "eu_key"
+    # The default client is pinned; the others are evicted to stay within the bound
+    assert registry.get_client("default") is client
+    token = in_session(FakeSession())
+    try:
+        registry.update_current_connection(url="http://other:8090")
+        assert registry.current_client().base_url == "http://other:8090"
+    finally:
+        request_ctx.reset(token)
+    assert registry.get_client("eu") is not eu
+    assert registry.get_client("default") is client
+
+    with pytest.raises(ValueError):
+        registry.get_client("missing")
+
+
+def test_sessions_are_isolated(registry):
+    """Test that switching profiles only affects the calling session."""
+    first, second = FakeSession(), FakeSession()
+    client = SessionClient(registry)
+
+    token = in_session(first)
+    try:
+        registry.use_profile("eu")
+        assert client.get_connection_settings()["url"] == "http://eu:8090"
+    finally:
+        request_ctx.reset(token)
+
+    token = in_session(second)
+    try:
+        settings = client.update_connection_settings(url="http://other:8090")
+        assert settings["url"] == "http://other:8090"
+        assert settings["profile"].startswith("custom-")
+    finally:
+        request_ctx.reset(token)
+
+    token = in_session(first)
+    try:
+        assert client.get_connection_settings() == {
+            "url": "http://eu:8090",
+            "has_api_key": True,
+            "profile": "eu",
+        }
+    finally:
+        request_ctx.reset(token)
+
+
+def test_derived_profiles_stay_with_their_session(registry):
+    """Test that profiles derived from updated settings are neither listed nor kept after the session."""
+    session = FakeSession()
+    token = in_session(session)
+    try:
+        derived = registry.update_current_connection(url="http://other:8090")
+        assert registry.current_profile() == derived
+        assert [p["name"] for p in registry.list_profiles()] == ["default", "eu"]
+        with pytest.raises(ValueError):
+            registry.use_profile(derived.name)
+    finally:
+        request_ctx.reset(token)
+
+    del session
+    gc.collect()
+    assert len(registry._sessions) == 0
@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP sampling profiler."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.concurrency import run_sync
+from src.seatunnel_mcp.profiling import SamplingProfiler
+from src.seatunnel_mcp.tools import get_all_tools
+
+
+def busy_loop(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """Profiler sampling every call, stopped after the test."""
+    profiler = SamplingProfiler(output_dir=str(tmp_path), sample_every=1, interval=0.001)
+    yield profiler
+    profiler.stop()
+
+
+def test_samples_only_sampled_calls(profiler):
+    """Test that only one in every sample_every calls is marked for sampling."""
+    profiler.sample_every = 3
+    sampled = [profiler._begin("tool:x") for _ in range(6)]
+    assert sampled == [True, False, False, True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_profiles_tool_into_folded_stacks(profiler):
+    """Test that a sampled tool's client calls are aggregated, summarized and written."""
+    profiler.instrument_client()
+    client = SeaTunnelClient(base_url="http://localhost:8090")
+    client._make_request = lambda *args, **kwargs: busy_loop(0.1) or MagicMock()
+
+    async def slow_tool():
+        busy_loop(0.1)
+        return await run_sync(client.get_overview)
+
+    slow_tool.__name__ = "slow-tool"
+    profiler.sample_every = 2
+    profiler.start()
+    await profiler.wrap_tool(slow_tool)()
+    profiler.stop()
+
+    summary = profiler.summary(top=5)
+    assert summary["samples"] > 0
+    # The client call is sampled with the tool, though its own turn was not up
+    assert set(summary["calls"]) == {"tool:slow-tool"}
+    assert summary["hotspots"][0]["function"] == "busy_loop (test_profiling.py)"
+    # The event loop thread running the tool itself is not sampled
+    assert not any("slow_tool" in hotspot["function"] for hotspot in profiler.summary(top=100)["hotspots"])
+
+    path = profiler.flush()
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert lines and all(line.startswith("tool:slow-tool;client:get_overview;") for line in lines)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == summary["samples"]
+
+
+def test_profiles_client_methods_in_worker_threads(profiler):
+    """Test that client methods are profiled in the threads that run them and restored on stop."""
+    original = SeaTunnelClient.get_overview
+    profiler.instrument_client()
+    assert SeaTunnelClient.get_overview is not original
+
+    client = SeaTunnelClient(base_url="http://localhost:8090")
+    client._make_request = lambda *args, **kwargs: busy_loop(0.1) or MagicMock()
+    profiler.start()
+    thread = threading.Thread(target=client.get_overview)
+    thread.start()
+    thread.join()
+    profiler.stop()
+
+    assert SeaTunnelClient.get_overview is original
+    assert set(profiler.summary()["calls"]) == {"client:get_overview"}
+
+
+def test_profile_summary_tool_registered_with_profiler(profiler):
+    """Test that the get-profile-summary tool is only added with a profiler."""
+    client = SeaTunnelClient(base_url="http://localhost:8090")
+    names = [tool.__name__ for tool in get_all_tools(client, profiler=profiler)]
+    assert names[-1] == "get-profile-summary"
+    assert "get-profile-summary" not in [tool.__name__ for tool in get_all_tools(client)]
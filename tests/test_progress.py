@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP progress notifications."""
+
+import asyncio
+import io
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp.server.lowlevel.server import request_ctx
+
+from src.seatunnel_mcp.client import _UploadProgress
+from src.seatunnel_mcp.concurrency import run_sync
+from src.seatunnel_mcp.progress import ProgressReporter, progress_reporter
+
+
+@pytest.fixture
+def session():
+    """Create a mock MCP session."""
+    session = MagicMock()
+    session.send_progress_notification = AsyncMock()
+    return session
+
+
+def test_no_request_context():
+    """Test that reports outside a tool call are discarded."""
+    reporter = progress_reporter()
+    assert not reporter.enabled
+    reporter.report(1, 2)
+
+
+@pytest.mark.asyncio
+async def test_reports_are_throttled(session):
+    """Test that reports are rate-limited but completion is always sent."""
+    reporter = ProgressReporter(session, "token", asyncio.get_running_loop(), min_interval=60)
+    for i in range(1, 11):
+        reporter.report(i, 10)
+    await asyncio.sleep(0)
+
+    sent = [call.args[1] for call in session.send_progress_notification.call_args_list]
+    assert sent == [1, 10]
+
+
+@pytest.mark.asyncio
+async def test_report_from_worker_thread(session):
+    """Test that worker threads of a tool call share its reporter."""
+    ctx = MagicMock(session=session)
+    ctx.meta.progressToken = "token"
+    token = request_ctx.set(ctx)
+    try:
+        reporter = progress_reporter()
+        assert reporter.enabled
+        assert await run_sync(progress_reporter) is reporter
+        await run_sync(reporter.report, 5, 5, "done")
+    finally:
+        request_ctx.reset(token)
+    await asyncio.sleep(0.01)
+
+    session.send_progress_notification.assert_called_once_with("token", 5, total=5, message="done")
+
+
+@pytest.mark.asyncio
+async def test_upload_progress(session):
+    """Test that the upload wrapper reports bytes read."""
+    reporter = ProgressReporter(session, "token", asyncio.get_running_loop(), min_interval=0)
+    upload = _UploadProgress(io.BytesIO(b"x" * 100), reporter)
+    upload.seek(0)
+    while upload.read(40):
+        pass
+    await asyncio.sleep(0)
+
+    sent = [call.args[1] for call in session.send_progress_notification.call_args_list]
+    assert sent == [40, 80, 100]
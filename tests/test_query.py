@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the job filter language."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.seatunnel_mcp.query import FilterError, compile_filter, find_jobs, required_states
+
+NOW = time.mktime((2025, 6, 10, 12, 0, 0, 0, 0, -1))
+
+
+def at(seconds_ago):
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(NOW - seconds_ago))
+
+
+JOBS = [
+    {"jobId": 1, "jobName": "cdc_orders", "jobStatus": "FAILED", "createTime": at(5000), "finishTime": at(600),
+     "errorMsg": "java.net.SocketTimeoutException: Read timed out", "metrics": {"SourceReceivedCount": "10"}},
+    {"jobId": 2, "jobName": "cdc_users", "jobStatus": "FAILED", "createTime": at(9000), "finishTime": at(7200),
+     "errorMsg": "Connection timeout", "metrics": {"SourceReceivedCount": "2000"}},
+    {"jobId": 3, "jobName": "batch_orders", "jobStatus": "FINISHED", "createTime": at(900), "finishTime": at(60),
+     "errorMsg": None, "metrics": {"SourceReceivedCount": "5000", "SinkWriteQPS": "12.5"}},
+    {"jobId": 4, "jobName": "cdc_orders_v2", "jobStatus": "RUNNING", "createTime": at(300), "metrics": {}},
+]
+
+
+def matching(expression):
+    return [job["jobId"] for job in filter(compile_filter(expression, now=NOW), JOBS)]
+
+
+def test_comparisons():
+    """Test the comparisons of each kind of field."""
+    assert matching("state = failed") == [1, 2]
+    assert matching("state != FAILED") == [3, 4]
+    assert matching("state in (FINISHED, running)") == [3, 4]
+    assert matching("id = 3") == [3]
+    assert matching('name ~ "cdc_*"') == [1, 2, 4]
+    # States match whatever the case of the pattern
+    assert matching('state ~ "fail*"') == [1, 2]
+    assert matching('state =~ "^fin"') == [3]
+    assert matching('name =~ "^cdc_[a-z]+$"') == [1, 2]
+    assert matching("error contains TIMEOUT") == [1, 2]
+    assert matching("finished > -1h") == [1, 3]
+    assert matching('created >= "2025-06-10 11:00:00"') == [3, 4]
+    assert matching("finished < -1h") == [2]
+    assert matching("SourceReceivedCount >= 2000") == [2, 3]
+    assert matching("metrics.SinkWriteQPS > 10") == [3]
+    assert matching("SourceReceivedCount != 10") == [2, 3]
+
+
+def test_boolean_operators():
+    """Test and, or, not and parentheses."""
+    expression = 'state = FAILED and name ~ "cdc_*" and finished > -1h and error contains timeout'
+    assert matching(expression) == [1]
+    assert matching("state = RUNNING or SourceReceivedCount > 4000") == [3, 4]
+    assert matching("not (state = FAILED or state = RUNNING)") == [3]
+    assert matching("state = FAILED and (id = 1 or id = 3)") == [1]
+
+
+@pytest.mark.parametrize("expression", [
+    "",
+    "state =",
+    "state = FAILED and",
+    "(state = FAILED",
+    "state = FAILED FINISHED",
+    "created = -1h",
+    "finished > yesterday",
+    "SourceReceivedCount > many",
+    "name < b",
+    'name =~ "("',
+    "state in FAILED",
+])
+def test_invalid_filters(expression):
+    """Test that invalid filters are rejected with a FilterError."""
+    with pytest.raises(FilterError):
+        compile_filter(expression)
+
+
+def test_required_states():
+    """Test the states a filter restricts jobs to."""
+    assert required_states("state = failed and name ~ x") == {"FAILED"}
+    assert required_states("state in (FAILED, RUNNING) and state = FAILED") == {"FAILED"}
+    assert required_states("state = FAILED or state = CANCELED") == {"FAILED", "CANCELED"}
+    assert required_states("state = FAILED or id = 1") is None
+    assert required_states("not state = FAILED") is None
+
+
+@pytest.mark.asyncio
+async def test_find_jobs_fetches_only_needed_listings():
+    """Test that only the listings of the required states are fetched, and duplicates are dropped."""
+    client = MagicMock()
+    client.get_running_jobs.return_value = [JOBS[3]]
+    client.get_finished_jobs.side_effect = lambda state: [job for job in JOBS if job["jobStatus"] == state]
+
+    assert [job["jobId"] for job in await find_jobs(client, "state = FAILED")] == [1, 2]
+    client.get_running_jobs.assert_not_called()
+    client.get_finished_jobs.assert_called_once_with(state="FAILED")
+
+    client.get_running_jobs.return_value = [JOBS[3], JOBS[2]]
+    assert [job["jobId"] for job in await find_jobs(client, 'name ~ "*orders*"')] == [4, 3, 1]
+    assert len(await find_jobs(client, 'name ~ "*"', limit=2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_find_jobs_keeps_jobs_without_id():
+    """Test that jobs listed without an ID are not taken for duplicates of each other."""
+    client = MagicMock()
+    client.get_running_jobs.return_value = [{"jobName": "a", "jobStatus": "RUNNING"},
+                                            {"jobName": "b", "jobStatus": "RUNNING"}]
+    client.get_finished_jobs.return_value = []
+    assert [job["jobName"] for job in await find_jobs(client, 'name ~ "*"')] == ["a", "b"]
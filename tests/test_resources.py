@@ -0,0 +1,119 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP job state resources."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from mcp.server.fastmcp import FastMCP
+
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.resources import JOB_URI_PREFIX, RUNNING_JOBS_URI, JobStateWatcher, register_resources
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock client for testing."""
+    client = MagicMock(spec=SeaTunnelClient)
+    client.get_running_jobs.return_value = [{"jobId": "1", "jobStatus": "RUNNING"}]
+    client.get_job_info.return_value = {"jobId": "1", "jobStatus": "RUNNING"}
+    return client
+
+
+@pytest.mark.asyncio
+async def test_reads_share_snapshot(mock_client):
+    """Test that concurrent and repeated reads hit upstream once per interval."""
+    watcher = JobStateWatcher(mock_client, poll_interval=60)
+    contents = await asyncio.gather(*(watcher.read(RUNNING_JOBS_URI) for _ in range(10)))
+    await watcher.read(RUNNING_JOBS_URI)
+
+    assert len(set(contents)) == 1
+    mock_client.get_running_jobs.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_subscribers_are_notified_of_changes(mock_client):
+    """Test that subscribers are notified only when the resource changes."""
+    watcher = JobStateWatcher(mock_client, poll_interval=60)
+    session = MagicMock()
+    session.send_resource_updated = AsyncMock()
+    uri = JOB_URI_PREFIX + "1"
+
+    await watcher.subscribe(uri, session)
+    await watcher.poll_once()
+    session.send_resource_updated.assert_not_called()
+
+    mock_client.get_job_info.return_value = {"jobId": "1", "jobStatus": "FINISHED"}
+    await watcher.poll_once()
+    session.send_resource_updated.assert_called_once()
+    assert str(session.send_resource_updated.call_args.args[0]) == uri
+    mock_client.get_job_info.assert_called_with(jobId="1")
+
+
+@pytest.mark.asyncio
+async def test_unknown_resource(mock_client):
+    """Test that unknown resources are rejected."""
+    watcher = JobStateWatcher(mock_client)
+    with pytest.raises(ValueError):
+        await watcher.subscribe("seatunnel://nope", MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_read_refreshing_a_snapshot_notifies_subscribers(mock_client):
+    """Test that a change seen by a read is not lost to the subscribers."""
+    watcher = JobStateWatcher(mock_client, poll_interval=0)
+    session = MagicMock()
+    session.send_resource_updated = AsyncMock()
+    uri = JOB_URI_PREFIX + "1"
+    await watcher.subscribe(uri, session)
+
+    mock_client.get_job_info.return_value = {"jobId": "1", "jobStatus": "FINISHED"}
+    assert "FINISHED" in await watcher.read(uri)
+    session.send_resource_updated.assert_called_once()
+    # The poller sees no further change
+    await watcher.poll_once()
+    session.send_resource_updated.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_snapshots_are_bounded(mock_client):
+    """Test that only the most recently read unsubscribed jobs keep a snapshot."""
+    watcher = JobStateWatcher(mock_client, poll_interval=60, max_snapshots=2)
+    session = MagicMock()
+    await watcher.subscribe(JOB_URI_PREFIX + "0", session)
+    for job_id in range(1, 5):
+        await watcher.read(JOB_URI_PREFIX + str(job_id))
+
+    assert sorted(watcher._snapshots) == [JOB_URI_PREFIX + job_id for job_id in ("0", "3", "4")]
+
+
+def test_subscriptions_are_advertised(mock_client):
+    """Test that the server advertises resource subscriptions."""
+    server = FastMCP(name="test")
+    assert not server._mcp_server.create_initialization_options().capabilities.resources.subscribe
+    register_resources(server, JobStateWatcher(mock_client))
+    assert server._mcp_server.create_initialization_options().capabilities.resources.subscribe
+
+
+def test_subscriptions_skipped_on_unknown_server(mock_client):
+    """Test that subscriptions are left out rather than patched into an unexpected server."""
+    server = FastMCP(name="test")
+    server._mcp_server = lowlevel = MagicMock()
+    register_resources(server, JobStateWatcher(mock_client))
+    lowlevel.subscribe_resource.assert_not_called()
@@ -0,0 +1,171 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the simulated SeaTunnel REST API."""
+
+import io
+import json
+import os
+
+import httpx
+import pytest
+
+from benchmarks.simulator import (
+    SeaTunnelSimulator,
+    SimulatorConfig,
+    SimulatorError,
+    SimulatorServer,
+    parse_job_config,
+)
+from src.seatunnel_mcp.client import SeaTunnelClient
+
+
+def job_config(parallelism=1, mode="STREAMING"):
+    return json.dumps({
+        "env": {"job.mode": mode, "parallelism": parallelism},
+        "source": [{"plugin_name": "FakeSource"}],
+        "transform": [{"plugin_name": "Sql"}],
+        "sink": [{"plugin_name": "Console"}],
+    })
+
+
+class Clock:
+    """Manually advanced simulated clock."""
+
+    def __init__(self):
+        self.time = 1_700_000_000.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def simulator_with(clock, **config):
+    simulator = SeaTunnelSimulator(SimulatorConfig(**config))
+    simulator.now = clock
+    return simulator
+
+
+def test_slot_accounting_queues_jobs(clock):
+    """Test that jobs wait as PENDING for slots, and are scheduled once slots free up."""
+    simulator = simulator_with(clock, workers=1, slots_per_worker=3, scheduling_delay=1.0, stop_delay=2.0)
+    first = simulator.submit(job_config(parallelism=2), "json")["jobId"]
+    second = simulator.submit(job_config(parallelism=2), "json")["jobId"]
+
+    assert simulator.job_info(first)["jobStatus"] == "SCHEDULED"
+    assert simulator.job_info(second)["jobStatus"] == "PENDING"
+    assert simulator.overview()["unassignedSlot"] == "1"
+
+    clock.time += 1.0
+    assert simulator.job_info(first)["jobStatus"] == "RUNNING"
+
+    simulator.stop(first)
+    assert simulator.job_info(first)["jobStatus"] == "CANCELING"
+    clock.time += 2.0
+    assert simulator.job_info(first)["jobStatus"] == "CANCELED"
+    assert simulator.job_info(second)["jobStatus"] == "SCHEDULED"
+    assert simulator.overview()["unassignedSlot"] == "1"
+
+    with pytest.raises(SimulatorError):
+        simulator.submit(job_config(parallelism=4), "json")
+
+
+def test_batch_job_lifecycle_and_growing_metrics(clock):
+    """Test that batch jobs finish and their counters grow while they run."""
+    simulator = simulator_with(clock, scheduling_delay=0.0, batch_duration=100.0, rows_per_second=10.0)
+    job_id = simulator.submit(job_config(mode="BATCH"), "json")["jobId"]
+
+    clock.time += 10.0
+    early = int(simulator.job_info(job_id)["metrics"]["SourceReceivedCount"])
+    clock.time += 10.0
+    later = int(simulator.job_info(job_id)["metrics"]["SourceReceivedCount"])
+    assert 0 < early < later
+
+    clock.time += 200.0
+    info = simulator.job_info(job_id)
+    assert info["jobStatus"] == "FINISHED"
+    assert info["metrics"]["SourceReceivedCount"] == info["metrics"]["SinkWriteCount"]
+    assert [vertex["type"] for vertex in info["jobDag"]["vertexInfoMap"]] == ["source", "transform", "sink"]
+    assert simulator.running_jobs() == []
+
+
+def test_stop_with_savepoint_and_resubmit(clock):
+    """Test stopping through a savepoint and resubmitting under the same job ID."""
+    simulator = simulator_with(clock, scheduling_delay=0.0, stop_delay=1.0)
+    job_id = simulator.submit(job_config(), "json")["jobId"]
+
+    simulator.stop(job_id, with_savepoint=True)
+    assert simulator.job_info(job_id)["jobStatus"] == "DOING_SAVEPOINT"
+    with pytest.raises(SimulatorError):
+        simulator.submit(job_config(), "json", job_id=job_id)
+    clock.time += 1.0
+    assert simulator.job_info(job_id)["jobStatus"] == "SAVEPOINT_DONE"
+    with pytest.raises(SimulatorError):
+        simulator.stop(job_id)
+
+    simulator.submit(job_config(), "json", job_id=job_id, start_with_savepoint=True)
+    info = simulator.job_info(job_id)
+    assert info["jobStatus"] == "RUNNING"
+    assert info["isStartWithSavePoint"] is True
+
+
+def test_history(clock):
+    """Test that the job history is served by state and by job ID."""
+    simulator = simulator_with(clock, history=1000)
+    finished = simulator.finished_jobs("FINISHED")
+    failed = simulator.finished_jobs("FAILED")
+    overview = simulator.overview()
+    assert int(overview["finishedJobs"]) == len(finished) > len(failed) > 0
+    assert int(overview["failedJobs"]) == len(failed)
+    assert simulator.job_info(finished[0]["jobId"]) == finished[0]
+    assert simulator.job_info("1") == {}
+
+
+def test_hocon_config():
+    """Test that the mode, parallelism and plugins are picked out of HOCON configs."""
+    with open(os.path.join(os.path.dirname(__file__), "..", "examples", "simple_job.conf")) as f:
+        mode, parallelism, plugins, _ = parse_job_config(f.read(), "hocon")
+    assert (mode, parallelism) == ("BATCH", 1)
+    assert plugins == {"source": ["Jdbc"], "transform": [], "sink": ["Elasticsearch"]}
+
+
+def test_client_against_simulator():
+    """Test the SeaTunnel client against the simulator over HTTP, including uploads and faults."""
+    with SimulatorServer(SimulatorConfig(scheduling_delay=0.0)) as server:
+        client = SeaTunnelClient(base_url=server.url)
+        job_id = client.submit_job(job_config(), jobName="sim", format="json")["jobId"]
+        assert client.get_job_info(job_id)["jobName"] == "sim"
+        assert client.get_running_job(job_id)["jobStatus"] == "RUNNING"
+
+        upload = client.submit_job_upload(io.BytesIO(job_config(parallelism=2).encode()), format="json")
+        assert client.get_job_info(upload["jobId"])["jobDag"]["vertexInfoMap"][0]["parallelism"] == 2
+
+        submitted = client.submit_jobs([dict(json.loads(job_config()), params={"jobName": "batch"})])
+        assert submitted[0]["jobName"] == "batch"
+        assert client.stop_job(job_id) == {"jobId": job_id}
+
+        server.simulator.config.error_rate = 1.0
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_overview()
+        server.simulator.config.error_rate = 0.0
+        server.simulator.config.disconnect_rate = 1.0
+        with pytest.raises(httpx.RequestError):
+            client.get_overview()
+        client.close()
@@ -0,0 +1,182 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the cluster snapshot export."""
+
+import gzip
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.seatunnel_mcp import snapshot
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.snapshot import export_snapshot, export_snapshot_to
+from src.seatunnel_mcp.tools import export_snapshot_tool
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock client with running and finished jobs."""
+    client = MagicMock(spec=SeaTunnelClient)
+    client.base_url = "http://localhost:8090"
+    client.get_overview.return_value = {"runningJobs": "1"}
+    client.get_system_monitoring_information.return_value = [{"host": "node-1"}]
+    client.get_running_jobs.return_value = [{"jobId": "1", "jobStatus": "RUNNING"}]
+    finished = {
+        "FINISHED": [{"jobId": str(i), "jobStatus": "FINISHED"} for i in range(2, 12)],
+        # Job 1 finished between the two listings
+        "FAILED": [{"jobId": "1", "jobStatus": "FAILED"}],
+    }
+    client.get_finished_jobs.side_effect = lambda state: finished.get(state, [])
+    client.get_job_info.side_effect = lambda job_id: {"jobId": job_id, "jobDag": {}}
+    return client
+
+
+def read_records(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_jsonl(mock_client, tmp_path):
+    """Test that every listing and job info is written once, between a header and a summary."""
+    path = tmp_path / "snapshot.jsonl.gz"
+    summary = await export_snapshot_to(mock_client, str(path), max_concurrency=4)
+
+    records = read_records(path)
+    assert records[0]["kind"] == "snapshot"
+    assert records[0]["data"]["url"] == "http://localhost:8090"
+    assert records[-1] == {"kind": "summary", "data": {k: summary[k] for k in ("jobs", "records", "errors", "seconds")}}
+    kinds = [record["kind"] for record in records]
+    assert kinds.count("overview") == kinds.count("monitoring") == 1
+    assert kinds.count("running_job") == 1
+    assert kinds.count("finished_job") == 11
+    assert {r["state"] for r in records if r["kind"] == "finished_job"} == {"FINISHED", "FAILED"}
+    assert sorted(int(r["jobId"]) for r in records if r["kind"] == "job_info") == list(range(1, 12))
+    assert summary["jobs"] == 11
+    assert summary["errors"] == 0
+    assert summary["bytes"] == path.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_records_failures(mock_client, tmp_path):
+    """Test that failed fetches become error records without stopping the export."""
+    def get_job_info(job_id):
+        if job_id == "3":
+            raise RuntimeError("boom")
+        return {"jobId": job_id}
+
+    mock_client.get_job_info.side_effect = get_job_info
+    mock_client.get_system_monitoring_information.side_effect = RuntimeError("unavailable")
+    path = tmp_path / "snapshot.jsonl.gz"
+    summary = await export_snapshot_to(mock_client, str(path))
+
+    errors = [record for record in read_records(path) if record["kind"] == "error"]
+    assert sorted((e["source"], e.get("jobId")) for e in errors) == [("job-info", "3"), ("monitoring", None)]
+    assert summary["errors"] == 2
+    assert summary["records"]["job_info"] == 10
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_skips_job_info_without_id(mock_client, tmp_path):
+    """Test that listed jobs without an ID are kept but their info is not fetched."""
+    mock_client.get_running_jobs.return_value = [{"jobId": "1", "jobStatus": "RUNNING"}, {"jobStatus": "RUNNING"}]
+    path = tmp_path / "snapshot.jsonl.gz"
+    summary = await export_snapshot_to(mock_client, str(path))
+
+    assert summary["records"]["running_job"] == 2
+    assert summary["errors"] == 0
+    assert "None" not in [call.args[0] for call in mock_client.get_job_info.call_args_list]
+    assert summary["records"]["job_info"] == 11
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_bounds_concurrency(mock_client, tmp_path):
+    """Test that no more than max_concurrency job infos are fetched at once."""
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def get_job_info(job_id):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.01)
+        with lock:
+            in_flight["now"] -= 1
+        return {"jobId": job_id}
+
+    mock_client.get_job_info.side_effect = get_job_info
+    await export_snapshot_to(mock_client, str(tmp_path / "snapshot.jsonl"), max_concurrency=3)
+    assert 1 < in_flight["max"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_parquet(mock_client, tmp_path):
+    """Test the Parquet export keeps the filter columns next to the JSON data."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "snapshot.parquet"
+    await export_snapshot_to(mock_client, str(path), include_job_info=False)
+
+    table = pq.read_table(str(path)).to_pylist()
+    finished = [row for row in table if row["kind"] == "finished_job"]
+    assert len(finished) == 11
+    assert json.loads(finished[0]["data"])["jobStatus"] == finished[0]["state"]
+    assert not any(row["kind"] == "job_info" for row in table)
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_tool(mock_client, tmp_path):
+    """Test that the tool writes into its export directory only."""
+    tool = export_snapshot_tool(mock_client, str(tmp_path / "exports"))
+    result = await tool(fileName="cluster.jsonl.gz", includeJobInfo=False)
+    assert result["path"] == str(tmp_path / "exports" / "cluster.jsonl.gz")
+    assert result["records"]["finished_job"] == 11
+
+    for name in ("../escape.jsonl", "nested/snapshot.jsonl", ".hidden"):
+        with pytest.raises(ValueError):
+            await tool(fileName=name)
+    with pytest.raises(ValueError):
+        await tool(fileName="cluster.csv", format="csv")
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_writes_off_the_event_loop(mock_client, monkeypatch):
+    """Test that records are written in batches, in order, by worker threads."""
+    monkeypatch.setattr(snapshot, "WRITE_BATCH_SIZE", 4)
+    writer = MagicMock()
+    threads = set()
+    writer.write.side_effect = lambda record: threads.add(threading.get_ident())
+    summary = await export_snapshot(mock_client, writer)
+
+    records = [call.args[0] for call in writer.write.call_args_list]
+    assert records[0]["kind"] == "snapshot"
+    assert records[-1]["kind"] == "summary"
+    # Every record counted in the summary, and the summary itself
+    assert len(records) == sum(summary["records"].values()) + 1
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_export_snapshot_tool_clamps_concurrency(mock_client, tmp_path, monkeypatch):
+    """Test that a tool call cannot ask for more concurrent requests than the server allows."""
+    export = AsyncMock(return_value={})
+    monkeypatch.setattr(snapshot, "export_snapshot_to", export)
+    tool = export_snapshot_tool(mock_client, str(tmp_path))
+    await tool(maxConcurrency=10_000)
+    assert export.call_args.kwargs["max_concurrency"] == snapshot.MAX_EXPORT_CONCURRENCY
@@ -0,0 +1,67 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Startup benchmark for the SeaTunnel MCP command line interface.
+
+Uses ``python -X importtime`` to check that importing the CLI stays cheap:
+the server stack must only be imported by the ``run`` command. The import
+time budget can be overridden with ``SEATUNNEL_MCP_STARTUP_BUDGET_MS``.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP_BUDGET_MS = float(os.environ.get("SEATUNNEL_MCP_STARTUP_BUDGET_MS", "100"))
+
+# Modules that belong to the server stack and are expensive to import.
+HEAVY_MODULES = ("mcp", "httpx", "pydantic", "dotenv", "src.seatunnel_mcp.__main__")
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative import times in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_does_not_load_server_stack():
+    """Test that importing the CLI does not pull in the server stack."""
+    times = import_times("src.seatunnel_mcp.cli")
+    assert "src.seatunnel_mcp.cli" in times
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    assert loaded == []
+
+
+def test_cli_import_time_budget():
+    """Test that importing the CLI stays within the startup budget."""
+    # Take the best of a few runs to smooth out noise from a busy machine.
+    best_ms = min(import_times("src.seatunnel_mcp.cli")["src.seatunnel_mcp.cli"] for _ in range(3)) / 1000
+    assert best_ms < STARTUP_BUDGET_MS, f"CLI import took {best_ms:.1f}ms (budget {STARTUP_BUDGET_MS}ms)"
@@ -208,16 +208,21 @@ async def test_stop_job_tool(mock_client):
 def test_get_all_tools(mock_client):
     """Test get_all_tools."""
     tools = get_all_tools(mock_client)
-    assert len(tools) == 12
+    assert len(tools) == 21
     tool_names = [tool.__name__ for tool in tools]
     assert "get-connection-settings" in tool_names
     assert "update-connection-settings" in tool_names
     assert "submit-job" in tool_names
     assert "submit-jobs" in tool_names
     assert "stop-job" in tool_names
+    assert "stop-jobs" in tool_names
+    assert "rolling-restart" in tool_names
+    assert "wait-for-job" in tool_names
     assert "get-job-info" in tool_names
     assert "get-running-job" in tool_names
     assert "get-running-jobs" in tool_names
     assert "get-finished-jobs" in tool_names
+    assert "find-jobs" in tool_names
+    assert "top-jobs" in tool_names
     assert "get-overview" in tool_names
     assert "get-system-monitoring-information" in tool_names 
\ No newline at end of file
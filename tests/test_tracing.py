@@ -0,0 +1,78 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for the SeaTunnel MCP OpenTelemetry tracing."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from src.seatunnel_mcp import tracing
+from src.seatunnel_mcp.client import SeaTunnelClient
+from src.seatunnel_mcp.tools import get_job_info_tool
+
+
+@pytest.fixture
+def exporter():
+    """Enable tracing into an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracing.enable(tracer_provider=provider)
+    yield exporter
+    tracing.disable()
+
+
+def test_disabled_tracing_does_not_wrap():
+    """Test that tools are returned unchanged when tracing is disabled."""
+    async def tool():
+        pass
+
+    assert not tracing.is_enabled()
+    assert tracing.trace_tool(tool) is tool
+
+
+@pytest.mark.asyncio
+@patch("httpx.Client")
+async def test_spans_are_nested_and_propagated(mock_http_client, exporter):
+    """Test tool, client method and HTTP spans, and trace context propagation."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"jobId": "123"}'
+    mock_response.json.return_value = {"jobId": "123"}
+    mock_response.request.headers = {}
+    mock_http_client.return_value.request.return_value = mock_response
+
+    client = SeaTunnelClient(base_url="http://localhost:8090")
+    tool = tracing.trace_tool(get_job_info_tool(client))
+    assert await tool(jobId="123") == {"jobId": "123"}
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {"tool get-job-info", "SeaTunnelClient.get_job_info", "GET /job-info/{jobId}"}
+    http_span = spans["GET /job-info/{jobId}"]
+    assert http_span.parent.span_id == spans["SeaTunnelClient.get_job_info"].context.span_id
+    assert spans["SeaTunnelClient.get_job_info"].parent.span_id == spans["tool get-job-info"].context.span_id
+    assert spans["tool get-job-info"].attributes["seatunnel.job_id"] == "123"
+    assert http_span.attributes["http.response.status_code"] == 200
+    assert http_span.attributes["http.response.body.size"] == 16
+
+    headers = mock_http_client.return_value.request.call_args.kwargs["headers"]
+    assert headers["traceparent"].split("-")[1] == format(http_span.context.trace_id, "032x")